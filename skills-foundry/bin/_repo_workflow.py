@@ -2,17 +2,38 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
 import json
+import os
+import random
 import shlex
 import re
 import shutil
+import signal
 import subprocess
+import sys
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import IO, Any
 
 
 PROMPT_RE = re.compile(r"^PROMPT_(\d+)(?:_s)?\.txt$")
+# `Depends-On: PROMPT_01, 02` near the top of a prompt file (optionally behind #, //, or <!-- -->).
+DEPENDS_ON_RE = re.compile(r"^\s*(?:#+|//|<!--)?\s*depends[-_ ]on\s*:\s*(.*?)\s*(?:-->)?\s*$", re.IGNORECASE)
+PROMPT_REF_RE = re.compile(r"^(?:PROMPT_)?(\d+)(_s)?(?:\.txt)?$", re.IGNORECASE)
+DEPENDS_ON_HEADER_LINES = 20
+# Runner output up to this size is inlined in the markdown run log; larger output is referenced by path.
+INLINE_OUTPUT_MAX_BYTES = 4096
+# Seconds between SIGTERM and SIGKILL when tearing down a runner's process group.
+RUNNER_KILL_GRACE_SECONDS = 2.0
+PROGRESS_REFRESH_SECONDS = 1.0
+# Runner lines longer than this are teed in pieces rather than buffered whole.
+STREAM_LINE_LIMIT = 1 << 20
+DEFAULT_RETRY_BACKOFF_SECONDS = 2.0
+DEFAULT_RETRY_MAX_BACKOFF_SECONDS = 60.0
 
 
 @dataclass
@@ -22,6 +43,34 @@ class PromptFile:
     is_system: bool
 
 
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before re-running a prompt whose runner failed transiently.
+
+    Only failures whose return code is in ``exit_codes`` (or per-prompt timeouts, with
+    ``on_timeout``) are retried. The delay before retry ``n`` is
+    ``min(max_backoff, backoff * 2 ** (n - 1))``, with the upper half randomized
+    ("equal jitter") so parallel prompts that failed together do not retry in lockstep.
+    """
+
+    retries: int = 0
+    exit_codes: frozenset[int] = frozenset()
+    on_timeout: bool = False
+    backoff_seconds: float = DEFAULT_RETRY_BACKOFF_SECONDS
+    max_backoff_seconds: float = DEFAULT_RETRY_MAX_BACKOFF_SECONDS
+
+    def should_retry(self, entry: dict[str, object], attempt: int) -> bool:
+        if attempt > self.retries:
+            return False
+        if entry["status"] == "failed":
+            return int(entry["returncode"]) in self.exit_codes
+        return entry["status"] == "timed_out" and self.on_timeout
+
+    def delay(self, attempt: int, rng: random.Random | None = None) -> float:
+        ceiling = min(self.max_backoff_seconds, self.backoff_seconds * 2 ** (attempt - 1))
+        return ceiling / 2 + (rng or random).uniform(0, ceiling / 2)
+
+
 def _resolve_repo_root(repo_root: Path) -> Path:
     return repo_root.resolve()
 
@@ -138,6 +187,94 @@ def _stage_selection(prompts: list[PromptFile], start: int | None, end: int | No
     return selected
 
 
+def _read_prompt_dependency_header(path: Path) -> list[str] | None:
+    """Return the `Depends-On:` references near the top of a prompt, or None if it declares none."""
+    with path.open(encoding="utf-8", errors="replace") as handle:
+        for _ in range(DEPENDS_ON_HEADER_LINES):
+            line = handle.readline()
+            if not line:
+                break
+            match = DEPENDS_ON_RE.match(line)
+            if match:
+                return [ref for ref in re.split(r"[,\s]+", match.group(1)) if ref and ref.lower() != "none"]
+    return None
+
+
+def _resolve_prompt_ref(ref: str, prompts: list[PromptFile], source: str) -> PromptFile:
+    match = PROMPT_REF_RE.match(ref.strip())
+    if not match:
+        raise ValueError(f"{source}: cannot parse prompt reference {ref!r} (use PROMPT_07, PROMPT_07.txt, or 07)")
+    number = int(match.group(1))
+    is_system = match.group(2) is not None
+    # `07` and `PROMPT_07` mean the task prompt; `PROMPT_07_s` names the system prompt.
+    for prompt in prompts:
+        if prompt.number == number and prompt.is_system == is_system:
+            return prompt
+    raise ValueError(f"{source}: unknown prompt reference {ref!r}")
+
+
+def load_prompt_dependencies_file(path: Path) -> dict[str, list[str]]:
+    """Read a sidecar JSON object mapping prompt references to lists of prompt references."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise ValueError(f"Cannot read prompt dependencies file {path}: {exc}") from exc
+    if not isinstance(data, dict) or not all(
+        isinstance(refs, list) and all(isinstance(ref, str) for ref in refs) for refs in data.values()
+    ):
+        raise ValueError(f"{path} must be a JSON object mapping prompt names to lists of prompt names")
+    return data
+
+
+def resolve_prompt_dependencies(
+    selected: list[PromptFile],
+    prompts: list[PromptFile],
+    sidecar: dict[str, list[str]] | None = None,
+) -> dict[str, list[str]]:
+    """Map each selected prompt name to the selected prompt names it must wait for.
+
+    Declarations come from the sidecar file first, then a `Depends-On:` header. A prompt
+    that declares nothing depends on every earlier selected prompt, which keeps the
+    serial behaviour. Dependencies outside the selection (e.g. before `--start`) are
+    treated as already done.
+    """
+    declared: dict[str, list[str]] = {}
+    for key, refs in (sidecar or {}).items():
+        declared[_resolve_prompt_ref(key, prompts, "prompt dependencies file").path.name] = refs
+    selected_names = [prompt.path.name for prompt in selected]
+    dependencies: dict[str, list[str]] = {}
+    for index, prompt in enumerate(selected):
+        name = prompt.path.name
+        refs = declared.get(name)
+        if refs is None:
+            refs = _read_prompt_dependency_header(prompt.path)
+        if refs is None:
+            dependencies[name] = selected_names[:index]
+            continue
+        resolved = {_resolve_prompt_ref(ref, prompts, name).path.name for ref in refs}
+        if name in resolved:
+            raise ValueError(f"{name} cannot depend on itself")
+        dependencies[name] = [other for other in selected_names if other in resolved]
+
+    # Reject cycles up front; the scheduler would otherwise wait forever.
+    state: dict[str, int] = {}
+
+    def visit(name: str, trail: list[str]) -> None:
+        if state.get(name) == 2:
+            return
+        if state.get(name) == 1:
+            cycle = trail[trail.index(name) :] + [name]
+            raise ValueError(f"Prompt dependency cycle: {' -> '.join(cycle)}")
+        state[name] = 1
+        for dep in dependencies[name]:
+            visit(dep, trail + [name])
+        state[name] = 2
+
+    for name in selected_names:
+        visit(name, [])
+    return dependencies
+
+
 def _build_preflight_parser(prog: str) -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog=prog,
@@ -205,6 +342,13 @@ def main_repo_preflight() -> int:
     return 1 if missing else 0
 
 
+def _exit_code_list(value: str) -> frozenset[int]:
+    try:
+        return frozenset(int(part) for part in value.split(",") if part.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated exit codes such as 75,137 (got {value!r})") from None
+
+
 def _build_stage_run_parser(prog: str, stage_label: str, *, allow_execute: bool = False) -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog=prog,
@@ -221,7 +365,10 @@ def _build_stage_run_parser(prog: str, stage_label: str, *, allow_execute: bool
         parser.add_argument(
             "--execute",
             action="store_true",
-            help="Opt-in Stage 1 execution mode: run selected prompts serially using an explicit runner template.",
+            help=(
+                "Opt-in Stage 1 execution mode: run selected prompts using an explicit runner template "
+                "(serially unless --parallel is set)."
+            ),
         )
         parser.add_argument(
             "--runner-shell-template",
@@ -260,6 +407,100 @@ def _build_stage_run_parser(prog: str, stage_label: str, *, allow_execute: bool
             type=float,
             help="Optional per-prompt timeout for execution mode (seconds).",
         )
+        parser.add_argument(
+            "--global-timeout-seconds",
+            type=float,
+            help=(
+                "Optional wall-clock limit for the whole execution run (seconds). When it is reached, running "
+                "prompts are terminated and recorded as timed_out and no further prompts start."
+            ),
+        )
+        parser.add_argument(
+            "--no-progress",
+            action="store_true",
+            help="Execution mode: do not print the progress line (elapsed, running, done, failed, prompts/min).",
+        )
+        parser.add_argument(
+            "--retries",
+            type=int,
+            default=0,
+            metavar="N",
+            help=(
+                "Execution mode: re-run a prompt up to N more times when its runner fails transiently, as selected "
+                "by --retry-on-exit-codes and/or --retry-on-timeout (default: 0). Every attempt is recorded in the run log."
+            ),
+        )
+        parser.add_argument(
+            "--retry-on-exit-codes",
+            type=_exit_code_list,
+            default=frozenset(),
+            metavar="CODES",
+            help="Comma-separated runner exit codes that count as transient, for example `75,137`.",
+        )
+        parser.add_argument(
+            "--retry-on-timeout",
+            action="store_true",
+            help="Also retry prompts that hit --runner-timeout-seconds (never the global timeout or an interrupt).",
+        )
+        parser.add_argument(
+            "--retry-backoff-seconds",
+            type=float,
+            default=DEFAULT_RETRY_BACKOFF_SECONDS,
+            help=(
+                "Base delay before the first retry; it doubles for each further retry and is jittered "
+                f"(default: {DEFAULT_RETRY_BACKOFF_SECONDS:g})."
+            ),
+        )
+        parser.add_argument(
+            "--retry-max-backoff-seconds",
+            type=float,
+            default=DEFAULT_RETRY_MAX_BACKOFF_SECONDS,
+            help=f"Upper bound for a single retry delay (default: {DEFAULT_RETRY_MAX_BACKOFF_SECONDS:g}).",
+        )
+        parser.add_argument(
+            "--parallel",
+            type=int,
+            default=1,
+            metavar="N",
+            help=(
+                "Execution mode: run up to N independent prompts at once (default: 1). Prompts declare what they "
+                "wait for with a `Depends-On: PROMPT_01, PROMPT_02` line near the top (or `Depends-On: none`); "
+                "a prompt without one waits for every earlier selected prompt."
+            ),
+        )
+        parser.add_argument(
+            "--prompt-deps",
+            type=Path,
+            help=(
+                "Optional JSON sidecar mapping prompt names to the prompts they depend on, for example "
+                '\'{"PROMPT_03.txt": ["PROMPT_01.txt"]}\'. Entries override `Depends-On:` headers. '
+                "Relative paths resolve against --repo-root."
+            ),
+        )
+        parser.add_argument(
+            "--prompt-log-dir",
+            type=Path,
+            help=(
+                "Directory (repo-root-relative by default) for per-prompt <prompt>.stdout.log/.stderr.log files "
+                "streamed during execution (default: <run-log-stem>.logs next to --run-log)."
+            ),
+        )
+        parser.add_argument(
+            "--checkpoint",
+            type=Path,
+            help=(
+                "JSON-lines checkpoint journal (repo-root-relative by default) with one record per finished prompt "
+                "(default: <run-log-stem>.checkpoint.jsonl next to --run-log)."
+            ),
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help=(
+                "Keep the checkpoint journal and skip prompts it records as successful, as long as the prompt file's "
+                "sha256 is unchanged. The run log is appended to instead of replaced."
+            ),
+        )
         parser.add_argument(
             "--allow-outside-repo-artifacts",
             action="store_true",
@@ -310,60 +551,6 @@ def _render_runner_argv_command(template_json: str, prompt: PromptFile, repo_roo
     return rendered
 
 
-def _write_stage_execution_log(
-    *,
-    out_path: Path,
-    stage_label: str,
-    repo_root: Path,
-    selected: list[PromptFile],
-    runner_mode: str,
-    runner_template_display: str,
-    entries: list[dict[str, object]],
-) -> None:
-    lines = [f"# {stage_label} Execution Log", ""]
-    lines.append(f"- repo_root: `{repo_root}`")
-    lines.append(f"- prompts_selected: {len(selected)}")
-    lines.append(f"- started_at_utc: {entries[0]['started_at'] if entries else _now_iso_utc()}")
-    lines.append(f"- finished_at_utc: {entries[-1]['finished_at'] if entries else _now_iso_utc()}")
-    lines.append(f"- runner_mode: `{runner_mode}`")
-    lines.append(f"- runner_template: `{runner_template_display}`")
-    lines.append("")
-    lines.append("## Prompt Results")
-    lines.append("")
-    for entry in entries:
-        prompt_name = entry["prompt_name"]
-        status = entry["status"]
-        returncode = entry["returncode"]
-        lines.append(f"### {prompt_name}")
-        lines.append(f"- status: `{status}`")
-        lines.append(f"- returncode: `{returncode}`")
-        lines.append(f"- started_at_utc: `{entry['started_at']}`")
-        lines.append(f"- finished_at_utc: `{entry['finished_at']}`")
-        lines.append(f"- command: `{entry['command']}`")
-        stdout_text = str(entry.get("stdout", "")).strip()
-        stderr_text = str(entry.get("stderr", "")).strip()
-        if stdout_text:
-            lines.append("- stdout:")
-            lines.append("```text")
-            lines.append(stdout_text)
-            lines.append("```")
-        if stderr_text:
-            lines.append("- stderr:")
-            lines.append("```text")
-            lines.append(stderr_text)
-            lines.append("```")
-        lines.append("")
-    _write_text(out_path, "\n".join(lines))
-
-
-def _coerce_timeout_stream_text(value: str | bytes | None) -> str:
-    if value is None:
-        return ""
-    if isinstance(value, bytes):
-        return value.decode("utf-8", errors="replace")
-    return value
-
-
 def _is_path_within(child: Path, parent: Path) -> bool:
     try:
         child.relative_to(parent)
@@ -388,6 +575,452 @@ def _resolve_execution_artifact_path(
     return resolved
 
 
+def _display_artifact_path(path: Path, repo_root: Path) -> str:
+    return str(path.relative_to(repo_root)) if _is_path_within(path, repo_root) else str(path)
+
+
+class _StageRunLog:
+    """Markdown execution log appended one prompt at a time, so a long run can be followed live."""
+
+    def __init__(
+        self,
+        *,
+        out_path: Path,
+        stage_label: str,
+        repo_root: Path,
+        selected: list[PromptFile],
+        runner_mode: str,
+        runner_template_display: str,
+        resumed: list[str] | None = None,
+    ) -> None:
+        self.out_path = out_path
+        self.repo_root = repo_root
+        # A resumed run appends to the earlier log instead of replacing it.
+        append = resumed is not None and out_path.exists()
+        lines = [f"# {stage_label} Execution Log" + (" (resumed)" if resumed is not None else ""), ""]
+        lines.append(f"- repo_root: `{repo_root}`")
+        lines.append(f"- prompts_selected: {len(selected)}")
+        if resumed is not None:
+            lines.append(f"- already_done_from_checkpoint: {len(resumed)}")
+        lines.append(f"- started_at_utc: {_now_iso_utc()}")
+        lines.append(f"- runner_mode: `{runner_mode}`")
+        lines.append(f"- runner_template: `{runner_template_display}`")
+        lines.append("")
+        lines.append("## Prompt Results")
+        lines.append("")
+        if append:
+            self._append(["", *lines])
+        else:
+            _write_text(out_path, "\n".join(lines) + "\n")
+
+    def _append(self, lines: list[str]) -> None:
+        with self.out_path.open("a", encoding="utf-8") as handle:
+            handle.write("\n".join(lines) + "\n")
+
+    def _output_lines(self, label: str, entry: dict[str, object]) -> list[str]:
+        path = entry.get(f"{label}_path")
+        if path is None:
+            text = str(entry.get(label, "")).strip()
+            return [f"- {label}:", "```text", text, "```"] if text else []
+        size = int(entry.get(f"{label}_bytes", 0))
+        if size == 0:
+            return []
+        lines = [f"- {label}_log: `{_display_artifact_path(Path(str(path)), self.repo_root)}` ({size} bytes)"]
+        text = entry.get(label)
+        if text is None:
+            lines.append(f"- {label}: not inlined (over {INLINE_OUTPUT_MAX_BYTES} bytes); see {label}_log")
+        elif str(text).strip():
+            lines += [f"- {label}:", "```text", str(text).strip(), "```"]
+        return lines
+
+    def append_entry(self, entry: dict[str, object]) -> None:
+        lines = [f"### {entry['prompt_name']}"]
+        lines.append(f"- status: `{entry['status']}`")
+        lines.append(f"- returncode: `{entry['returncode']}`")
+        lines.append(f"- started_at_utc: `{entry['started_at']}`")
+        lines.append(f"- finished_at_utc: `{entry['finished_at']}`")
+        lines.append(f"- command: `{entry['command']}`")
+        lines += self._output_lines("stdout", entry)
+        lines += self._output_lines("stderr", entry)
+        earlier = entry.get("attempts") or []
+        if earlier:
+            lines.append(f"- attempts: {int(entry['attempt'])}")
+            for number, attempt in enumerate(earlier, start=1):
+                lines.append(
+                    f"  - attempt {number}: `{attempt['status']}` (rc={attempt['returncode']}), "
+                    f"{attempt['started_at']} -> {attempt['finished_at']}; retried after {attempt['retry_delay_seconds']}s"
+                )
+                for label in ("stdout", "stderr"):
+                    if int(attempt.get(f"{label}_bytes", 0)):
+                        path = _display_artifact_path(Path(str(attempt[f"{label}_path"])), self.repo_root)
+                        lines.append(f"    - {label}_log: `{path}` ({attempt[f'{label}_bytes']} bytes)")
+        lines.append("")
+        self._append(lines)
+
+    def finish(
+        self,
+        entries: list[dict[str, object]],
+        skipped: dict[str, str],
+        already_done: list[str],
+        stopped: str | None = None,
+        not_started: int = 0,
+    ) -> None:
+        counts: dict[str, int] = {}
+        for entry in entries:
+            counts[str(entry["status"])] = counts.get(str(entry["status"]), 0) + 1
+        lines = ["## Summary", ""]
+        lines.append(f"- finished_at_utc: {_now_iso_utc()}")
+        lines.append(f"- prompts_run: {len(entries)}")
+        for status in sorted(counts):
+            lines.append(f"- {status}: {counts[status]}")
+        lines.append(f"- skipped_after_dependency_failure: {len(skipped)}")
+        retried = [entry for entry in entries if entry.get("attempts")]
+        if retried:
+            lines.append(f"- prompts_retried: {len(retried)}")
+            lines.append(f"- retry_attempts: {sum(len(entry['attempts']) for entry in retried)}")
+        if already_done:
+            lines.append(f"- already_done_from_checkpoint: {len(already_done)}")
+        if stopped:
+            lines.append(f"- stopped: {stopped}")
+            lines.append(f"- not_started: {not_started}")
+        lines.append("")
+        self._append(lines)
+
+
+def _captured_output(log_path: Path) -> tuple[str | None, int]:
+    size = log_path.stat().st_size
+    if size > INLINE_OUTPUT_MAX_BYTES:
+        return None, size
+    return log_path.read_text(encoding="utf-8", errors="replace"), size
+
+
+def _prompt_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def load_checkpoint_successes(path: Path) -> dict[str, str]:
+    """Map prompt name -> prompt sha256 for prompts whose latest checkpoint record is a success.
+
+    A torn final line (the process died mid-write) is ignored.
+    """
+    done: dict[str, str] = {}
+    if not path.exists():
+        return done
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(record, dict) or "prompt_name" not in record:
+            continue
+        name = str(record["prompt_name"])
+        if record.get("status") == "success" and record.get("prompt_sha256"):
+            done[name] = str(record["prompt_sha256"])
+        else:
+            done.pop(name, None)
+    return done
+
+
+class _CheckpointJournal:
+    """JSON-lines journal with one record per finished prompt, fsynced so a crash keeps completed work."""
+
+    def __init__(self, path: Path, *, resume: bool) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not resume:
+            path.write_text("", encoding="utf-8")
+
+    def record(self, entry: dict[str, object]) -> None:
+        record = {
+            key: entry.get(key)
+            for key in ("prompt_name", "prompt_sha256", "status", "returncode", "started_at", "finished_at", "command", "attempt")
+        }
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record, sort_keys=True) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+
+
+class _Console:
+    """Console output during execution: teed runner lines, status messages, and a progress line.
+
+    On a terminal the progress line is redrawn in place on stderr underneath the scrolling
+    output; otherwise it is printed as a plain line each time a prompt finishes.
+    """
+
+    def __init__(self, *, progress: bool) -> None:
+        self.progress = progress
+        self.live = progress and sys.stderr.isatty()
+        self._line = ""
+
+    def _clear(self) -> None:
+        if self.live and self._line:
+            sys.stderr.write("\r\033[K")
+
+    def _redraw(self) -> None:
+        if self.live and self._line:
+            sys.stderr.write(self._line)
+            sys.stderr.flush()
+
+    def write(self, stream: IO[str], text: str) -> None:
+        self._clear()
+        stream.write(text)
+        stream.flush()
+        self._redraw()
+
+    def print(self, message: str) -> None:
+        self.write(sys.stdout, message + "\n")
+
+    def update(self, line: str, *, milestone: bool) -> None:
+        if not self.progress:
+            return
+        if self.live:
+            self._clear()
+            self._line = line
+            self._redraw()
+        elif milestone:
+            self.write(sys.stderr, line + "\n")
+
+    def close(self) -> None:
+        self._clear()
+        self._line = ""
+
+
+@dataclass
+class _StopRequest:
+    """Set once when the whole run must stop (Ctrl-C, SIGTERM, or the global timeout)."""
+
+    event: asyncio.Event
+    status: str = ""
+    returncode: int = 0
+    message: str = ""
+
+    def trigger(self, status: str, returncode: int, message: str) -> None:
+        if not self.event.is_set():
+            self.status, self.returncode, self.message = status, returncode, message
+            self.event.set()
+
+
+async def _tee_stream(stream: asyncio.StreamReader, log_path: Path, console_stream: IO[str], prefix: str, console: _Console) -> None:
+    """Copy runner output line by line to its log file and, prefixed, to the console."""
+    with log_path.open("wb") as handle:
+        while True:
+            try:
+                chunk = await stream.readuntil(b"\n")
+            except asyncio.IncompleteReadError as exc:
+                chunk = exc.partial
+            except asyncio.LimitOverrunError as exc:
+                # A line longer than the buffer limit is passed through in pieces.
+                chunk = await stream.read(exc.consumed)
+            if not chunk:
+                return
+            handle.write(chunk)
+            handle.flush()
+            text = chunk.decode("utf-8", errors="replace")
+            console.write(console_stream, prefix + (text if text.endswith("\n") else text + "\n"))
+
+
+async def _terminate_process_group(proc: asyncio.subprocess.Process) -> None:
+    """SIGTERM the runner's process group, then SIGKILL anything still left after a grace period.
+
+    Runners start in their own session, so this also reaches children a shell template
+    spawned, which would otherwise be orphaned holding pipes and other resources.
+    """
+    if not hasattr(os, "killpg"):
+        proc.kill()
+        await proc.wait()
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        await proc.wait()
+        return
+    try:
+        await asyncio.wait_for(proc.wait(), RUNNER_KILL_GRACE_SECONDS)
+    except asyncio.TimeoutError:
+        pass
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    await proc.wait()
+
+
+async def _run_prompt(
+    prompt: PromptFile,
+    *,
+    repo_root: Path,
+    runner_shell_template: str | None,
+    runner_argv_template: str | None,
+    runner_timeout_seconds: float | None,
+    output_dir: Path,
+    console: _Console,
+    stop: _StopRequest,
+    attempt: int = 1,
+) -> dict[str, object]:
+    """Run one prompt through the runner template and return its run-log entry.
+
+    stdout and stderr are streamed to ``output_dir/<prompt>.{stdout,stderr}.log`` (retries
+    use ``<prompt>.attempt-N.*.log``) and teed to the console as they arrive; only output
+    small enough to inline is kept in memory.
+    The runner's process group is torn down on the per-prompt timeout or when ``stop`` fires.
+    """
+    started_at = _now_iso_utc()
+    # Hash what is about to run, so --resume can tell if the prompt was edited afterwards.
+    prompt_sha256 = _prompt_sha256(prompt.path)
+    try:
+        if runner_argv_template is not None:
+            command_argv = _render_runner_argv_command(runner_argv_template, prompt, repo_root)
+            command_display = " ".join(shlex.quote(part) for part in command_argv)
+        else:
+            command_display = _render_runner_shell_command(runner_shell_template or "", prompt, repo_root)
+            command_argv = None
+    except ValueError as exc:
+        return {
+            "prompt_name": prompt.path.name,
+            "prompt_sha256": prompt_sha256,
+            "status": "template_error",
+            "returncode": 2,
+            "started_at": started_at,
+            "finished_at": _now_iso_utc(),
+            "command": "<template render failed>",
+            "stdout": "",
+            "stderr": str(exc),
+        }
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    log_stem = prompt.path.stem if attempt == 1 else f"{prompt.path.stem}.attempt-{attempt}"
+    stdout_path = output_dir / f"{log_stem}.stdout.log"
+    stderr_path = output_dir / f"{log_stem}.stderr.log"
+    spawn_options: dict[str, Any] = {
+        "cwd": repo_root,
+        "stdout": asyncio.subprocess.PIPE,
+        "stderr": asyncio.subprocess.PIPE,
+        "start_new_session": True,
+        "limit": STREAM_LINE_LIMIT,
+    }
+    try:
+        if command_argv is not None:
+            proc = await asyncio.create_subprocess_exec(*command_argv, **spawn_options)
+        else:
+            proc = await asyncio.create_subprocess_shell(command_display, **spawn_options)
+    except OSError as exc:
+        return {
+            "prompt_name": prompt.path.name,
+            "prompt_sha256": prompt_sha256,
+            "status": "failed",
+            "returncode": 127,
+            "started_at": started_at,
+            "finished_at": _now_iso_utc(),
+            "command": command_display,
+            "stdout": "",
+            "stderr": f"Could not start runner: {exc}",
+        }
+
+    prefix = f"[{prompt.path.name}] "
+    assert proc.stdout is not None and proc.stderr is not None
+    tees = [
+        asyncio.create_task(_tee_stream(proc.stdout, stdout_path, sys.stdout, prefix, console)),
+        asyncio.create_task(_tee_stream(proc.stderr, stderr_path, sys.stderr, prefix, console)),
+    ]
+    waiter = asyncio.create_task(proc.wait())
+    stopper = asyncio.create_task(stop.event.wait())
+    done, _ = await asyncio.wait({waiter, stopper}, timeout=runner_timeout_seconds, return_when=asyncio.FIRST_COMPLETED)
+    stopper.cancel()
+    note = ""
+    if waiter in done:
+        returncode = waiter.result()
+        status = "success" if returncode == 0 else "failed"
+    else:
+        await _terminate_process_group(proc)
+        if stop.event.is_set():
+            status, returncode, note = stop.status, stop.returncode, stop.message
+        else:
+            status, returncode, note = "timed_out", 124, f"Timed out after {runner_timeout_seconds} second(s)"
+    # Output pipes close once the group is gone; don't hang on a child that escaped it.
+    _finished, stuck = await asyncio.wait(tees, timeout=RUNNER_KILL_GRACE_SECONDS)
+    for task in stuck:
+        task.cancel()
+    if note:
+        with stderr_path.open("a", encoding="utf-8") as handle:
+            handle.write(f"\n{note}\n")
+    stdout_text, stdout_bytes = _captured_output(stdout_path)
+    stderr_text, stderr_bytes = _captured_output(stderr_path)
+    return {
+        "prompt_name": prompt.path.name,
+        "prompt_sha256": prompt_sha256,
+        "status": status,
+        "returncode": returncode,
+        "started_at": started_at,
+        "finished_at": _now_iso_utc(),
+        "command": command_display,
+        "stdout": stdout_text,
+        "stderr": stderr_text,
+        "stdout_path": stdout_path,
+        "stderr_path": stderr_path,
+        "stdout_bytes": stdout_bytes,
+        "stderr_bytes": stderr_bytes,
+    }
+
+
+def _append_stderr_note(entry: dict[str, object], note: str) -> None:
+    stderr_path = entry.get("stderr_path")
+    if stderr_path is None:
+        entry["stderr"] = f"{entry.get('stderr') or ''}\n{note}\n"
+        return
+    with Path(str(stderr_path)).open("a", encoding="utf-8") as handle:
+        handle.write(f"\n{note}\n")
+    entry["stderr"], entry["stderr_bytes"] = _captured_output(Path(str(stderr_path)))
+
+
+async def _run_prompt_with_retries(
+    prompt: PromptFile,
+    *,
+    retry_policy: RetryPolicy,
+    console: _Console,
+    stop: _StopRequest,
+    **run_options: Any,
+) -> dict[str, object]:
+    """Run a prompt, re-running it after a backoff while ``retry_policy`` says the failure is transient.
+
+    Returns the last attempt's entry; earlier attempts are kept under ``attempts`` together
+    with the delay that followed each of them. A stop request during a backoff cancels the
+    retry, and the prompt is recorded with the stop's status instead of its last failure.
+    """
+    attempts: list[dict[str, object]] = []
+    attempt = 1
+    while True:
+        entry = await _run_prompt(prompt, console=console, stop=stop, attempt=attempt, **run_options)
+        if stop.event.is_set() or not retry_policy.should_retry(entry, attempt):
+            break
+        delay = retry_policy.delay(attempt)
+        console.print(
+            f"- retrying {prompt.path.name} in {delay:.1f}s (attempt {attempt + 1}/{retry_policy.retries + 1}): "
+            f"{entry['status']} (rc={entry['returncode']})"
+        )
+        try:
+            await asyncio.wait_for(stop.event.wait(), delay)
+        except asyncio.TimeoutError:
+            # The backoff ran out, so the retry is about to start: only now is this attempt an earlier one.
+            attempts.append({**entry, "retry_delay_seconds": round(delay, 3)})
+            attempt += 1
+            continue
+        entry["status"], entry["returncode"] = stop.status, stop.returncode
+        _append_stderr_note(entry, f"{stop.message} before retry {attempt + 1} started")
+        break
+    entry["attempt"] = attempt
+    entry["attempts"] = attempts
+    return entry
+
+
+def _format_progress(elapsed: float, running: int, finished: int, total: int, failed: int) -> str:
+    rate = finished / elapsed * 60 if elapsed > 0 else 0.0
+    return (
+        f"[progress] {elapsed:.1f}s elapsed | running {running} | done {finished}/{total} | "
+        f"failed {failed} | {rate:.1f} prompts/min"
+    )
+
+
 def _execute_stage_plan(
     *,
     stage_label: str,
@@ -397,137 +1030,205 @@ def _execute_stage_plan(
     runner_argv_template: str | None,
     run_log_path: Path,
     runner_timeout_seconds: float | None,
+    dependencies: dict[str, list[str]] | None = None,
+    parallel: int = 1,
+    output_dir: Path | None = None,
+    checkpoint_path: Path | None = None,
+    resume: bool = False,
+    global_timeout_seconds: float | None = None,
+    progress: bool = True,
+    retry_policy: RetryPolicy | None = None,
 ) -> int:
-    entries: list[dict[str, object]] = []
+    """Run the selected prompts, up to ``parallel`` at a time, in dependency order.
+
+    A prompt starts once everything it depends on has succeeded. When a prompt fails,
+    times out, or cannot render its command, every prompt that depends on it (directly
+    or transitively) is skipped; independent prompts keep running. Without declared
+    dependencies each prompt depends on all earlier ones, which is the old serial,
+    stop-on-first-failure behaviour. Returns the return code of the first failed prompt
+    in selection order, or 0.
+
+    Each result is appended to the markdown run log as soon as the prompt finishes; full
+    runner output lives in per-prompt files under ``output_dir`` (default: next to the
+    run log, ``<run-log-stem>.logs/``).
+
+    Every finished prompt is also recorded in a JSON-lines checkpoint journal (default:
+    ``<run-log-stem>.checkpoint.jsonl``). With ``resume`` the journal is kept and prompts
+    whose last record is a success for the same prompt-file sha256 are not run again.
+
+    Prompts run as asyncio subprocesses, each in its own process group. Ctrl-C, SIGTERM,
+    or ``global_timeout_seconds`` stop the run: running prompts are torn down and recorded
+    (`interrupted`, rc 130, or `timed_out`, rc 124), and nothing new starts.
+
+    With a ``retry_policy``, transient failures are re-run after an exponential, jittered
+    backoff before they count as failed; every attempt is written to the run log.
+    """
     runner_mode = "argv" if runner_argv_template else "shell"
     runner_template_display = runner_argv_template if runner_argv_template is not None else (runner_shell_template or "")
+    if dependencies is None:
+        dependencies = {p.path.name: [q.path.name for q in selected[:i]] for i, p in enumerate(selected)}
+    if output_dir is None:
+        output_dir = run_log_path.with_name(f"{run_log_path.stem}.logs")
+    if checkpoint_path is None:
+        checkpoint_path = run_log_path.with_name(f"{run_log_path.stem}.checkpoint.jsonl")
+    if retry_policy is None:
+        retry_policy = RetryPolicy()
+    already_done: list[str] = []
+    if resume:
+        recorded = load_checkpoint_successes(checkpoint_path)
+        for prompt in selected:
+            name = prompt.path.name
+            if name not in recorded:
+                continue
+            if recorded[name] == _prompt_sha256(prompt.path):
+                already_done.append(name)
+            else:
+                print(f"- {name}: prompt changed since its checkpointed success; running it again")
     print(f"{stage_label} execution mode enabled (opt-in)")
     print(f"- runner mode: {runner_mode}")
     print(f"- runner template: {runner_template_display}")
     print(f"- run log: {run_log_path}")
     if runner_timeout_seconds is not None:
         print(f"- runner timeout seconds: {runner_timeout_seconds}")
-
-    for prompt in selected:
-        started_at = _now_iso_utc()
-        try:
-            if runner_argv_template is not None:
-                command_argv = _render_runner_argv_command(runner_argv_template, prompt, repo_root)
-                command_display = " ".join(shlex.quote(part) for part in command_argv)
-            else:
-                command_display = _render_runner_shell_command(runner_shell_template or "", prompt, repo_root)
-                command_argv = None
-        except ValueError as exc:
-            print(f"ERROR: {exc}")
-            finished_at = _now_iso_utc()
-            entries.append(
-                {
-                    "prompt_name": prompt.path.name,
-                    "status": "template_error",
-                    "returncode": 2,
-                    "started_at": started_at,
-                    "finished_at": finished_at,
-                    "command": "<template render failed>",
-                    "stdout": "",
-                    "stderr": str(exc),
-                }
-            )
-            _write_stage_execution_log(
-                out_path=run_log_path,
-                stage_label=stage_label,
-                repo_root=repo_root,
-                selected=selected,
-                runner_mode=runner_mode,
-                runner_template_display=runner_template_display,
-                entries=entries,
-            )
-            return 2
-
-        try:
-            if command_argv is not None:
-                proc = subprocess.run(
-                    command_argv,
-                    shell=False,
-                    cwd=repo_root,
-                    capture_output=True,
-                    text=True,
-                    timeout=runner_timeout_seconds,
-                )
-            else:
-                proc = subprocess.run(
-                    command_display,
-                    shell=True,
-                    cwd=repo_root,
-                    capture_output=True,
-                    text=True,
-                    timeout=runner_timeout_seconds,
-                )
-        except subprocess.TimeoutExpired as exc:
-            finished_at = _now_iso_utc()
-            timeout_stdout = _coerce_timeout_stream_text(exc.stdout)
-            timeout_stderr = _coerce_timeout_stream_text(exc.stderr)
-            entries.append(
-                {
-                    "prompt_name": prompt.path.name,
-                    "status": "timed_out",
-                    "returncode": 124,
-                    "started_at": started_at,
-                    "finished_at": finished_at,
-                    "command": command_display,
-                    "stdout": timeout_stdout,
-                    "stderr": timeout_stderr + f"\nTimed out after {runner_timeout_seconds} second(s)",
-                }
-            )
-            print(f"- executed {prompt.path.name}: timed_out (rc=124)")
-            _write_stage_execution_log(
-                out_path=run_log_path,
-                stage_label=stage_label,
-                repo_root=repo_root,
-                selected=selected,
-                runner_mode=runner_mode,
-                runner_template_display=runner_template_display,
-                entries=entries,
-            )
-            print(f"Wrote run log: {run_log_path}")
-            return 124
-        finished_at = _now_iso_utc()
-        status = "success" if proc.returncode == 0 else "failed"
-        entries.append(
-            {
-                "prompt_name": prompt.path.name,
-                "status": status,
-                "returncode": proc.returncode,
-                "started_at": started_at,
-                "finished_at": finished_at,
-                "command": command_display,
-                "stdout": proc.stdout,
-                "stderr": proc.stderr,
-            }
+    if global_timeout_seconds is not None:
+        print(f"- global timeout seconds: {global_timeout_seconds}")
+    if parallel > 1:
+        print(f"- parallel workers: {parallel}")
+    if retry_policy.retries:
+        retry_on = [str(code) for code in sorted(retry_policy.exit_codes)] + (["timeout"] if retry_policy.on_timeout else [])
+        print(
+            f"- retries: {retry_policy.retries} on {', '.join(retry_on)} "
+            f"(backoff {retry_policy.backoff_seconds:g}s, max {retry_policy.max_backoff_seconds:g}s, jittered)"
         )
-        print(f"- executed {prompt.path.name}: {status} (rc={proc.returncode})")
-        if proc.returncode != 0:
-            _write_stage_execution_log(
-                out_path=run_log_path,
-                stage_label=stage_label,
-                repo_root=repo_root,
-                selected=selected,
-                runner_mode=runner_mode,
-                runner_template_display=runner_template_display,
-                entries=entries,
-            )
-            print(f"Wrote run log: {run_log_path}")
-            return proc.returncode
-
-    _write_stage_execution_log(
+    print(f"- prompt output logs: {output_dir}")
+    print(f"- checkpoint journal: {checkpoint_path}")
+    for name in already_done:
+        print(f"- already done {name} (checkpoint; prompt unchanged)")
+    journal = _CheckpointJournal(checkpoint_path, resume=resume)
+    run_log = _StageRunLog(
         out_path=run_log_path,
         stage_label=stage_label,
         repo_root=repo_root,
         selected=selected,
         runner_mode=runner_mode,
         runner_template_display=runner_template_display,
-        entries=entries,
+        resumed=already_done if resume else None,
+    )
+
+    console = _Console(progress=progress)
+    results: dict[str, dict[str, object]] = {}
+    succeeded = set(already_done)
+    blocked: dict[str, str] = {}
+    pending = [prompt for prompt in selected if prompt.path.name not in succeeded]
+    total = len(pending)
+
+    def block_dependents(failed_name: str) -> None:
+        # Repeat until stable so chains declared in any order are skipped transitively.
+        changed = True
+        while changed:
+            changed = False
+            for prompt in list(pending):
+                name = prompt.path.name
+                culprits = [blocked.get(dep, dep) for dep in dependencies[name] if dep == failed_name or dep in blocked]
+                if culprits:
+                    blocked[name] = culprits[0]
+                    pending.remove(prompt)
+                    changed = True
+                    console.print(f"- skipped {name}: depends on failed {culprits[0]}")
+
+    async def schedule() -> _StopRequest:
+        loop = asyncio.get_running_loop()
+        stop = _StopRequest(asyncio.Event())
+        handled_signals: list[signal.Signals] = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.trigger, "interrupted", 130, f"Interrupted by {sig.name}")
+                handled_signals.append(sig)
+            except (NotImplementedError, RuntimeError, ValueError):
+                pass
+        deadline = None
+        if global_timeout_seconds is not None:
+            deadline = loop.call_later(
+                global_timeout_seconds,
+                stop.trigger,
+                "timed_out",
+                124,
+                f"Global timeout of {global_timeout_seconds} second(s) reached",
+            )
+        running: dict[asyncio.Task[dict[str, object]], PromptFile] = {}
+        started = time.monotonic()
+        try:
+            while pending or running:
+                # Selection order decides which ready prompts take free slots first.
+                for prompt in list(pending):
+                    if len(running) >= parallel or stop.event.is_set():
+                        break
+                    if all(dep in succeeded for dep in dependencies[prompt.path.name]):
+                        pending.remove(prompt)
+                        task = asyncio.create_task(
+                            _run_prompt_with_retries(
+                                prompt,
+                                retry_policy=retry_policy,
+                                repo_root=repo_root,
+                                runner_shell_template=runner_shell_template,
+                                runner_argv_template=runner_argv_template,
+                                runner_timeout_seconds=runner_timeout_seconds,
+                                output_dir=output_dir,
+                                console=console,
+                                stop=stop,
+                            )
+                        )
+                        running[task] = prompt
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, timeout=PROGRESS_REFRESH_SECONDS, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    prompt = running.pop(task)
+                    entry = task.result()
+                    results[prompt.path.name] = entry
+                    if entry["status"] == "success":
+                        succeeded.add(prompt.path.name)
+                    journal.record(entry)
+                    run_log.append_entry(entry)
+                    if entry["status"] == "template_error":
+                        console.print(f"ERROR: {entry['stderr']}")
+                    else:
+                        console.print(f"- executed {prompt.path.name}: {entry['status']} (rc={entry['returncode']})")
+                    # After a stop, dependents are reported as not started rather than skipped.
+                    if entry["status"] != "success" and not stop.event.is_set():
+                        block_dependents(prompt.path.name)
+                failed = sum(1 for entry in results.values() if entry["status"] != "success")
+                console.update(
+                    _format_progress(time.monotonic() - started, len(running), len(results), total, failed),
+                    milestone=bool(done),
+                )
+        finally:
+            if deadline is not None:
+                deadline.cancel()
+            for sig in handled_signals:
+                loop.remove_signal_handler(sig)
+            console.close()
+        return stop
+
+    stop = asyncio.run(schedule())
+
+    entries = [results[p.path.name] for p in selected if p.path.name in results]
+    run_log.finish(
+        entries,
+        blocked,
+        already_done,
+        stopped=stop.message if stop.event.is_set() else None,
+        not_started=len(pending),
     )
     print(f"Wrote run log: {run_log_path}")
+    if blocked:
+        print(f"Skipped {len(blocked)} prompt(s) whose dependencies failed")
+    if stop.event.is_set():
+        print(f"Stopped: {stop.message}; {len(pending)} prompt(s) not started")
+        return stop.returncode
+    for entry in entries:
+        if entry["status"] != "success":
+            return int(entry["returncode"]) or 1
     return 0
 
 
@@ -593,6 +1294,27 @@ def _run_stage_plan(stage_label: str, args: argparse.Namespace) -> int:
         if getattr(args, "runner_timeout_seconds", None) is not None and args.runner_timeout_seconds <= 0:
             print("ERROR: --runner-timeout-seconds must be > 0")
             return 2
+        if getattr(args, "global_timeout_seconds", None) is not None and args.global_timeout_seconds <= 0:
+            print("ERROR: --global-timeout-seconds must be > 0")
+            return 2
+        retries = getattr(args, "retries", 0)
+        if retries < 0:
+            print("ERROR: --retries must be >= 0")
+            return 2
+        retry_exit_codes = getattr(args, "retry_on_exit_codes", frozenset())
+        retry_on_timeout = getattr(args, "retry_on_timeout", False)
+        if retries and not (retry_exit_codes or retry_on_timeout):
+            print("ERROR: --retries requires --retry-on-exit-codes and/or --retry-on-timeout")
+            return 2
+        retry_backoff = getattr(args, "retry_backoff_seconds", DEFAULT_RETRY_BACKOFF_SECONDS)
+        retry_max_backoff = getattr(args, "retry_max_backoff_seconds", DEFAULT_RETRY_MAX_BACKOFF_SECONDS)
+        if retry_backoff < 0 or retry_max_backoff < 0:
+            print("ERROR: --retry-backoff-seconds and --retry-max-backoff-seconds must be >= 0")
+            return 2
+        parallel = getattr(args, "parallel", 1)
+        if parallel < 1:
+            print("ERROR: --parallel must be >= 1")
+            return 2
         if not getattr(args, "no_max_prompts", False):
             max_prompts = getattr(args, "max_prompts", None)
             if max_prompts is not None and max_prompts >= 0 and len(selected) > max_prompts:
@@ -608,6 +1330,29 @@ def _run_stage_plan(stage_label: str, args: argparse.Namespace) -> int:
                 args.run_log,
                 allow_outside_repo_artifacts=getattr(args, "allow_outside_repo_artifacts", False),
             )
+            prompt_log_dir = None
+            if getattr(args, "prompt_log_dir", None) is not None:
+                prompt_log_dir = _resolve_execution_artifact_path(
+                    repo_root,
+                    args.prompt_log_dir,
+                    allow_outside_repo_artifacts=getattr(args, "allow_outside_repo_artifacts", False),
+                )
+            checkpoint_path = None
+            if getattr(args, "checkpoint", None) is not None:
+                checkpoint_path = _resolve_execution_artifact_path(
+                    repo_root,
+                    args.checkpoint,
+                    allow_outside_repo_artifacts=getattr(args, "allow_outside_repo_artifacts", False),
+                )
+        except ValueError as exc:
+            print(f"ERROR: {exc}")
+            return 2
+        try:
+            prompt_deps = getattr(args, "prompt_deps", None)
+            sidecar = None
+            if prompt_deps is not None:
+                sidecar = load_prompt_dependencies_file(prompt_deps if prompt_deps.is_absolute() else repo_root / prompt_deps)
+            dependencies = resolve_prompt_dependencies(selected, prompts, sidecar)
         except ValueError as exc:
             print(f"ERROR: {exc}")
             return 2
@@ -619,6 +1364,20 @@ def _run_stage_plan(stage_label: str, args: argparse.Namespace) -> int:
             runner_argv_template=runner_argv_template,
             run_log_path=run_log_path,
             runner_timeout_seconds=getattr(args, "runner_timeout_seconds", None),
+            dependencies=dependencies,
+            parallel=parallel,
+            output_dir=prompt_log_dir,
+            checkpoint_path=checkpoint_path,
+            resume=getattr(args, "resume", False),
+            global_timeout_seconds=getattr(args, "global_timeout_seconds", None),
+            progress=not getattr(args, "no_progress", False),
+            retry_policy=RetryPolicy(
+                retries=retries,
+                exit_codes=retry_exit_codes,
+                on_timeout=retry_on_timeout,
+                backoff_seconds=retry_backoff,
+                max_backoff_seconds=retry_max_backoff,
+            ),
         )
         if execute_rc != 0:
             return execute_rc
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+from _skills_common import PROFILER
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+
+BACKUP_STORE_VERSION = 1
+STORE_LOCK_NAME = ".lock"
+_BYTE_SIZE_RE = re.compile(r"^\s*(\d+)\s*([kmgt]?)i?b?\s*$", re.IGNORECASE)
+_BYTE_SIZE_UNITS = {"": 1, "k": 1 << 10, "m": 1 << 20, "g": 1 << 30, "t": 1 << 40}
+
+
+def default_backup_store(target_root: Path | None = None) -> Path:
+    """``skills-backups`` next to the sync target (``~/.codex/skills`` when none is given)."""
+    return (target_root or Path.home() / ".codex" / "skills").parent / "skills-backups"
+
+
+def parse_byte_size(value: str) -> int:
+    """Parse ``1048576``, ``512K``, ``50M``, or ``2GiB`` into bytes (argparse ``type=``)."""
+    match = _BYTE_SIZE_RE.match(value)
+    if not match:
+        raise argparse.ArgumentTypeError(f"expected a byte size such as 500000, 512K, or 50M (got {value!r})")
+    return int(match.group(1)) * _BYTE_SIZE_UNITS[match.group(2).lower()]
+
+
+def _new_run_id() -> str:
+    # Microseconds keep ids unique per process and lexically sortable by creation time.
+    return dt.datetime.now(dt.timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _unlink_symlinked_dirs(root: Path, directory: Path) -> None:
+    """Remove directory symlinks between ``root`` (exclusive) and ``directory`` (inclusive)."""
+    current = root
+    for part in directory.relative_to(root).parts:
+        current = current / part
+        if current.is_symlink():
+            current.unlink()
+            return
+
+
+class DirectoryBackup:
+    """Legacy ``--backup-dir`` layout: a plain copy of each file under ``root/<skill_id>/``."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def destination(self, skill_id: str, rel: str) -> str:
+        return str(self.root / skill_id / rel)
+
+    def save(self, skill_id: str, rel: str, source: Path) -> None:
+        backup_path = self.root / skill_id / rel
+        backup_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, backup_path)
+
+    def describe(self) -> str | None:
+        return f"Backups (if any) written under: {self.root}"
+
+
+@dataclass
+class BackupFile:
+    skill_id: str
+    path: str
+    sha256: str
+    size: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"skill_id": self.skill_id, "path": self.path, "sha256": self.sha256, "size": self.size}
+
+
+@dataclass
+class BackupRunManifest:
+    run_id: str
+    created: str
+    target_root: str
+    files: list[BackupFile]
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(item.size for item in self.files)
+
+
+@dataclass
+class PruneResult:
+    removed_runs: list[str] = field(default_factory=list)
+    kept_runs: list[str] = field(default_factory=list)
+    removed_blobs: int = 0
+    freed_bytes: int = 0
+    stored_bytes: int = 0
+
+
+class BackupStore:
+    """Content-addressed backup store.
+
+    Layout::
+
+        <root>/objects/<sha256[:2]>/<sha256[2:]>   one blob per distinct file content
+        <root>/runs/<run_id>.json                  which blob each backed-up file had in that run
+
+    Identical content is stored once no matter how many runs back it up, so a run costs
+    only the bytes that actually changed since any earlier backup.
+
+    A run holds a shared lock on ``<root>/.lock`` from its first backed-up file until its
+    manifest is written, and ``prune`` takes it exclusively. A blob that a run is about to
+    reference, even one it found already present, is never deleted before that reference
+    is recorded.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.objects_dir = root / "objects"
+        self.runs_dir = root / "runs"
+
+    def lock(self, *, exclusive: bool) -> IO[bytes] | None:
+        """Take the store lock; release it by closing the returned handle."""
+        if fcntl is None:
+            return None
+        self.root.mkdir(parents=True, exist_ok=True)
+        handle = (self.root / STORE_LOCK_NAME).open("ab")
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        except BaseException:
+            handle.close()
+            raise
+        return handle
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.objects_dir / sha256[:2] / sha256[2:]
+
+    @PROFILER.timed("backup.blob")
+    def put(self, source: Path) -> tuple[str, int, bool]:
+        """Store ``source``; return ``(sha256, size, wrote_new_blob)``."""
+        sha256 = _sha256_file(source)
+        blob = self.blob_path(sha256)
+        if blob.exists():
+            return sha256, blob.stat().st_size, False
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = blob.with_name(f".{blob.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with source.open("rb") as src, tmp_path.open("wb") as dst:
+                for block in iter(lambda: src.read(1 << 16), b""):
+                    digest.update(block)
+                    dst.write(block)
+                    size += len(block)
+            # Key by what was actually copied in case the file changed after the first hash.
+            blob = self.blob_path(digest.hexdigest())
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, blob)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return digest.hexdigest(), size, True
+
+    def begin_run(self, target_root: Path) -> BackupRun:
+        return BackupRun(self, target_root)
+
+    def list_runs(self) -> list[BackupRunManifest]:
+        """Run manifests oldest first; unreadable manifests are skipped."""
+        runs: list[BackupRunManifest] = []
+        if not self.runs_dir.is_dir():
+            return runs
+        for path in sorted(self.runs_dir.glob("*.json")):
+            try:
+                runs.append(self.load_run(path.stem))
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+        return runs
+
+    def load_run(self, run_id: str) -> BackupRunManifest:
+        if run_id == "latest":
+            runs = self.list_runs()
+            if not runs:
+                raise FileNotFoundError(f"No backup runs in {self.root}")
+            return runs[-1]
+        data = json.loads((self.runs_dir / f"{run_id}.json").read_text(encoding="utf-8"))
+        if data.get("version") != BACKUP_STORE_VERSION:
+            raise ValueError(f"Unsupported backup run version in {run_id}: {data.get('version')!r}")
+        return BackupRunManifest(
+            run_id=data["run_id"],
+            created=data["created"],
+            target_root=data["target_root"],
+            files=[BackupFile(**item) for item in data["files"]],
+        )
+
+    def write_run(self, manifest: BackupRunManifest) -> Path:
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        path = self.runs_dir / f"{manifest.run_id}.json"
+        payload = {
+            "version": BACKUP_STORE_VERSION,
+            "run_id": manifest.run_id,
+            "created": manifest.created,
+            "target_root": manifest.target_root,
+            "files": [item.to_dict() for item in manifest.files],
+        }
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp_path, path)
+        return path
+
+    def restore(
+        self,
+        run_id: str,
+        target_root: Path | None = None,
+        only_ids: list[str] | None = None,
+        dry_run: bool = False,
+    ) -> tuple[BackupRunManifest, list[Path]]:
+        """Write a run's files back into ``target_root`` (default: where they were backed up from).
+
+        Each file is replaced atomically; files the run did not back up are left alone. A skill
+        directory that is a symlink (the ``symlink`` sync strategy) is unlinked first and
+        restored as a real directory, so restoring never writes through into the source tree.
+        """
+        manifest = self.load_run(run_id)
+        root = target_root or Path(manifest.target_root)
+        selected = [item for item in manifest.files if not only_ids or item.skill_id in set(only_ids)]
+        missing = [item for item in selected if not self.blob_path(item.sha256).is_file()]
+        if missing:
+            raise FileNotFoundError(
+                f"Backup run {manifest.run_id} references {len(missing)} missing blob(s), "
+                f"first: {missing[0].skill_id}/{missing[0].path}"
+            )
+        restored: list[Path] = []
+        for item in selected:
+            destination = root / item.skill_id / item.path
+            restored.append(destination)
+            if dry_run:
+                continue
+            _unlink_symlinked_dirs(root, destination.parent)
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = destination.with_name(f".{destination.name}.skills-backup.tmp")
+            shutil.copyfile(self.blob_path(item.sha256), tmp_path)
+            os.replace(tmp_path, destination)
+        return manifest, restored
+
+    @PROFILER.timed("backup.prune")
+    def prune(self, keep_last: int | None = None, max_bytes: int | None = None, dry_run: bool = False) -> PruneResult:
+        """Drop old runs by count and/or total blob size, then delete blobs no run references.
+
+        Runs are dropped oldest first. The newest run is always kept, even when it alone
+        exceeds ``max_bytes``.
+        """
+        if not self.root.is_dir():
+            return PruneResult()
+        handle = self.lock(exclusive=True)
+        try:
+            return self._prune_locked(keep_last, max_bytes, dry_run)
+        finally:
+            if handle is not None:
+                handle.close()
+
+    def _prune_locked(self, keep_last: int | None, max_bytes: int | None, dry_run: bool) -> PruneResult:
+        runs = self.list_runs()
+        kept = list(runs)
+        if keep_last is not None:
+            kept = kept[-keep_last:] if keep_last > 0 else []
+        if max_bytes is not None:
+            while len(kept) > 1 and self._referenced_bytes(kept) > max_bytes:
+                kept.pop(0)
+        kept_ids = {run.run_id for run in kept}
+        result = PruneResult(
+            removed_runs=[run.run_id for run in runs if run.run_id not in kept_ids],
+            kept_runs=[run.run_id for run in kept],
+            stored_bytes=self._referenced_bytes(kept),
+        )
+        referenced = {item.sha256 for run in kept for item in run.files}
+        if not dry_run:
+            for run_id in result.removed_runs:
+                (self.runs_dir / f"{run_id}.json").unlink(missing_ok=True)
+        if self.objects_dir.is_dir():
+            for blob in self.objects_dir.glob("*/*"):
+                if blob.name.startswith(".") or blob.parent.name + blob.name in referenced:
+                    continue
+                result.removed_blobs += 1
+                result.freed_bytes += blob.stat().st_size
+                if not dry_run:
+                    blob.unlink()
+        return result
+
+    @staticmethod
+    def _referenced_bytes(runs: list[BackupRunManifest]) -> int:
+        sizes = {item.sha256: item.size for run in runs for item in run.files}
+        return sum(sizes.values())
+
+
+class BackupRun:
+    """One sync run's backups; thread-safe so parallel sync workers can share it."""
+
+    def __init__(self, store: BackupStore, target_root: Path) -> None:
+        self.store = store
+        self.target_root = target_root
+        self.run_id = _new_run_id()
+        self.created = dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds")
+        self.files: list[BackupFile] = []
+        self.new_blobs = 0
+        self.new_bytes = 0
+        self._lock = threading.Lock()
+        self._store_lock: IO[bytes] | None = None
+        self._locked = False
+
+    def destination(self, skill_id: str, rel: str) -> str:
+        return f"{self.store.root} (run {self.run_id}: {skill_id}/{rel})"
+
+    def save(self, skill_id: str, rel: str, source: Path) -> None:
+        with self._lock:
+            if not self._locked:
+                self._store_lock = self.store.lock(exclusive=False)
+                self._locked = True
+        sha256, size, created = self.store.put(source)
+        record = BackupFile(skill_id, rel, sha256, size)
+        with self._lock:
+            self.files.append(record)
+            if created:
+                self.new_blobs += 1
+                self.new_bytes += record.size
+
+    def commit(self) -> Path | None:
+        """Write the run manifest; a run that backed nothing up leaves no trace."""
+        try:
+            if not self.files:
+                return None
+            files = sorted(self.files, key=lambda item: (item.skill_id, item.path))
+            manifest = BackupRunManifest(self.run_id, self.created, str(self.target_root), files)
+            return self.store.write_run(manifest)
+        finally:
+            if self._store_lock is not None:
+                self._store_lock.close()
+                self._store_lock = None
+            self._locked = False
+
+    def describe(self) -> str | None:
+        if not self.files:
+            return None
+        return (
+            f"Backup run {self.run_id}: {len(self.files)} file(s), {self.new_blobs} new blob(s) "
+            f"({self.new_bytes} bytes) in {self.store.root}"
+        )
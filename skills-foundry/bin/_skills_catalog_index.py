@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+from bisect import bisect_left
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from _skills_common import PROFILER, REPORTS_ROOT
+from _skills_sync_render import SkillEntry, write_text_if_changed
+
+
+CATALOG_INDEX_VERSION = 1
+DEFAULT_CATALOG_INDEX_PATH = REPORTS_ROOT / "skills-catalog-index.json"
+# Inverted-index field -> SkillEntry attribute holding its values.
+INDEX_FIELDS = {
+    "tag": "tags",
+    "expected_tool": "expected_tools",
+    "input_name": "input_names",
+    "category": "category",
+}
+
+
+def _index_key(value: str) -> str:
+    return value.strip().casefold()
+
+
+def _entry_values(entry: SkillEntry, attr: str) -> list[str]:
+    value = getattr(entry, attr)
+    return [value] if isinstance(value, str) else list(value)
+
+
+def build_catalog_index(entries: list[SkillEntry], skills_root: Path | None = None) -> dict[str, Any]:
+    """Skill records sorted by id plus, per field, sorted keys with parallel posting lists.
+
+    Postings are positions into ``skills`` so the file stays compact; sorted keys let
+    ``CatalogIndex`` answer exact and prefix lookups by binary search.
+    """
+    ordered = sorted(entries, key=lambda e: e.skill_id)
+    skills = [
+        {
+            "skill_id": e.skill_id,
+            "category": e.category,
+            "description": e.description,
+            "tags": e.tags,
+            "expected_tools": e.expected_tools,
+            "input_names": e.input_names,
+            "path": str(e.source_skill_md),
+        }
+        for e in ordered
+    ]
+    index: dict[str, dict[str, list[Any]]] = {}
+    for field_name, attr in INDEX_FIELDS.items():
+        postings: dict[str, set[int]] = {}
+        for position, entry in enumerate(ordered):
+            for value in _entry_values(entry, attr):
+                if value.strip():
+                    postings.setdefault(_index_key(value), set()).add(position)
+        keys = sorted(postings)
+        index[field_name] = {"keys": keys, "postings": [sorted(postings[key]) for key in keys]}
+    return {
+        "version": CATALOG_INDEX_VERSION,
+        "skills_root": str(skills_root) if skills_root is not None else None,
+        "skills": skills,
+        "index": index,
+    }
+
+
+@PROFILER.timed("report.catalog_index")
+def write_catalog_index(entries: list[SkillEntry], output_path: Path, skills_root: Path | None = None) -> bool:
+    """Write the JSON catalog index; returns False when the file already held identical bytes."""
+    payload = build_catalog_index(entries, skills_root)
+    return write_text_if_changed(output_path, json.dumps(payload, separators=(",", ":")) + "\n")
+
+
+@dataclass
+class CatalogIndex:
+    skills: list[dict[str, Any]]
+    index: dict[str, dict[str, list[Any]]]
+    skills_root: str | None = None
+
+    def __post_init__(self) -> None:
+        self._ids = [skill["skill_id"] for skill in self.skills]
+
+    @classmethod
+    def load(cls, path: Path) -> CatalogIndex:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict) or data.get("version") != CATALOG_INDEX_VERSION:
+            raise ValueError(f"Unsupported catalog index version in {path}; re-run skills-render")
+        return cls(skills=data["skills"], index=data["index"], skills_root=data.get("skills_root"))
+
+    def lookup(self, field_name: str, value: str) -> set[int]:
+        """Positions matching ``value`` exactly, or every key starting with it when it ends in ``*``."""
+        if field_name not in self.index:
+            raise KeyError(f"Unknown index field: {field_name} (expected one of {', '.join(INDEX_FIELDS)})")
+        keys = self.index[field_name]["keys"]
+        postings = self.index[field_name]["postings"]
+        needle = _index_key(value)
+        prefix = needle.endswith("*")
+        if prefix:
+            needle = needle[:-1]
+        matches: set[int] = set()
+        position = bisect_left(keys, needle)
+        while position < len(keys):
+            key = keys[position]
+            if key != needle and not (prefix and key.startswith(needle)):
+                break
+            matches.update(postings[position])
+            position += 1
+        return matches
+
+    def _id_position(self, skill_id: str) -> int | None:
+        position = bisect_left(self._ids, skill_id)
+        if position < len(self._ids) and self._ids[position] == skill_id:
+            return position
+        return None
+
+    def find_id(self, skill_id: str) -> dict[str, Any] | None:
+        position = self._id_position(skill_id)
+        return None if position is None else self.skills[position]
+
+    def query(self, criteria: list[tuple[str, str]], skill_id: str | None = None) -> list[dict[str, Any]]:
+        """Skills matching every ``(field, value)`` criterion, and ``skill_id`` if given, in skill id order."""
+        if not criteria and skill_id is None:
+            return list(self.skills)
+        selected: set[int] | None = None
+        if skill_id is not None:
+            position = self._id_position(skill_id)
+            selected = set() if position is None else {position}
+        for field_name, value in criteria:
+            matches = self.lookup(field_name, value)
+            selected = matches if selected is None else selected & matches
+            if not selected:
+                return []
+        return [self.skills[position] for position in sorted(selected or ())]
+
+    def key_counts(self, field_name: str) -> list[tuple[str, int]]:
+        if field_name not in self.index:
+            raise KeyError(f"Unknown index field: {field_name} (expected one of {', '.join(INDEX_FIELDS)})")
+        data = self.index[field_name]
+        return [(key, len(ids)) for key, ids in zip(data["keys"], data["postings"])]
@@ -1,11 +1,22 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
+import hashlib
+import io
 import json
+import os
 import re
-from dataclasses import dataclass
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Callable, Iterable, Iterator, NamedTuple
 
 
 FOUNDRY_ROOT = Path(__file__).resolve().parents[1]
@@ -36,8 +47,112 @@ REQUIRED_SECTIONS = [
 ]
 
 HEADING_RE = re.compile(r"^##\s+(.+?)\s*$", re.MULTILINE)
+TOP_LEVEL_KEY_RE = re.compile(r"^([A-Za-z_][A-Za-z0-9_-]*):(?:\s*(.*))?$")
+NESTED_KEY_RE = re.compile(r"^([A-Za-z_][A-Za-z0-9_-]*):(?:\s+(.*))?$")
+KEBAB_CASE_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+NUMBERED_STEP_RE = re.compile(r"(?m)^\d+\.\s+")
 FRONT_MATTER_START = "---"
 
+# Bump when parsing changes so stale cache entries are discarded wholesale.
+PARSE_CACHE_VERSION = 3
+DEFAULT_PARSE_CACHE_PATH = REPORTS_ROOT / ".skill-parse-cache.json"
+DEFAULT_PARSE_CACHE_MAX_ENTRIES = 5000
+
+
+class Profiler:
+    """Accumulate wall time, CPU time, and call counts per named phase.
+
+    Phases nest and are reported inclusively. A disabled profiler hands out a shared
+    no-op context, so instrumented hot paths cost one attribute check when profiling is off.
+    CPU time is process-wide, so it also counts threads running alongside a phase.
+    Recording is locked, so phases may be timed from worker threads.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.phases: dict[str, list[float]] = {}
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def reset(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self.phases = {}
+        self._started = time.perf_counter()
+
+    def phase(self, name: str) -> AbstractContextManager[None]:
+        if not self.enabled:
+            return _NULL_PHASE
+        return self._timed(name)
+
+    def timed(self, name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Decorator form of ``phase`` for functions that are a phase on their own."""
+
+        def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+            @wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self._timed(name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorate
+
+    @contextmanager
+    def _timed(self, name: str) -> Iterator[None]:
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - wall_start, time.process_time() - cpu_start)
+
+    def add(self, name: str, wall: float, cpu: float, calls: int = 1) -> None:
+        with self._lock:
+            entry = self.phases.get(name)
+            if entry is None:
+                self.phases[name] = [wall, cpu, calls]
+            else:
+                entry[0] += wall
+                entry[1] += cpu
+                entry[2] += calls
+
+    def snapshot(self) -> dict[str, list[float]]:
+        with self._lock:
+            return {name: list(values) for name, values in self.phases.items()}
+
+    def merge(self, snapshot: dict[str, list[float]]) -> None:
+        """Fold in phases recorded by a worker process."""
+        for name, (wall, cpu, calls) in snapshot.items():
+            self.add(name, wall, cpu, int(calls))
+
+    def report(self) -> dict[str, Any]:
+        phases = sorted(self.phases.items(), key=lambda item: (-item[1][0], item[0]))
+        return {
+            "total_wall_seconds": round(time.perf_counter() - self._started, 6),
+            "phases": [
+                {"phase": name, "wall_seconds": round(wall, 6), "cpu_seconds": round(cpu, 6), "calls": int(calls)}
+                for name, (wall, cpu, calls) in phases
+            ],
+        }
+
+    def format_report(self) -> str:
+        report = self.report()
+        lines = [f"Profile (total wall {report['total_wall_seconds'] * 1000:.1f} ms; phases are inclusive):"]
+        for item in report["phases"]:
+            lines.append(
+                f"- {item['phase']}: wall={item['wall_seconds'] * 1000:.2f} ms "
+                f"cpu={item['cpu_seconds'] * 1000:.2f} ms calls={item['calls']}"
+            )
+        return "\n".join(lines)
+
+
+_NULL_PHASE = nullcontext()
+
+# Process-wide profiler; CLIs enable it via --profile and library code records into it.
+PROFILER = Profiler()
+
 
 @dataclass
 class ValidationMessage:
@@ -55,6 +170,7 @@ class SkillDocument:
     metadata: dict[str, Any]
     section_map: dict[str, str]
     messages: list[ValidationMessage]
+    front_matter_tree: dict[str, Any] = field(default_factory=dict)
 
     @property
     def skill_id(self) -> str:
@@ -65,6 +181,315 @@ class SkillDocument:
         return any(m.level == "ERROR" for m in self.messages)
 
 
+class LazySkillDocument(SkillDocument):
+    """SkillDocument built from the front matter alone; the body is read on first use.
+
+    ``text``, ``body_text``, and ``section_map`` re-read the file and split it into
+    sections the first time any of them is accessed. Callers that only need metadata
+    (catalog rendering, skill entries) never pay for the body.
+    """
+
+    @classmethod
+    def from_front_matter(
+        cls,
+        path: Path,
+        front_matter_text: str,
+        metadata: dict[str, Any],
+        front_matter_tree: dict[str, Any],
+        messages: list[ValidationMessage],
+    ) -> "LazySkillDocument":
+        return cls(
+            path=path,
+            text=None,  # type: ignore[arg-type]
+            front_matter_text=front_matter_text,
+            body_text=None,  # type: ignore[arg-type]
+            metadata=metadata,
+            section_map=None,  # type: ignore[arg-type]
+            messages=messages,
+            front_matter_tree=front_matter_tree,
+        )
+
+    def _load_body(self) -> None:
+        with PROFILER.phase("read"):
+            text = read_text(self.path)
+        _fm_text, body_text, _msgs = split_front_matter(text)
+        with PROFILER.phase("parse.sections"):
+            sections = extract_sections(body_text)
+        self._text, self._body_text, self._section_map = text, body_text, sections
+
+    @property  # type: ignore[override]
+    def text(self) -> str:
+        if self._text is None:
+            self._load_body()
+        return self._text
+
+    @text.setter
+    def text(self, value: str | None) -> None:
+        self._text = value
+
+    @property  # type: ignore[override]
+    def body_text(self) -> str:
+        if self._body_text is None:
+            self._load_body()
+        return self._body_text
+
+    @body_text.setter
+    def body_text(self, value: str | None) -> None:
+        self._body_text = value
+
+    @property  # type: ignore[override]
+    def section_map(self) -> dict[str, str]:
+        if self._section_map is None:
+            self._load_body()
+        return self._section_map
+
+    @section_map.setter
+    def section_map(self, value: dict[str, str] | None) -> None:
+        self._section_map = value
+
+
+@dataclass
+class SkillCorpus:
+    """Every SKILL.md under a skills root, read and parsed once per invocation."""
+
+    skills_root: Path
+    documents: list[SkillDocument]
+    files_read: int
+    validated: bool = False
+    cache_hits: int = 0
+    lint_results: list[dict[str, Any]] | None = None
+
+
+class SkillParseCache:
+    """On-disk cache of parsed SKILL.md files.
+
+    Entries are keyed by path and carry the file size, mtime, and a sha256 of
+    the content. Size is a cheap pre-check; the content hash is authoritative,
+    so a touched-but-identical file (fresh checkout, mtime drift) still hits.
+    Entries also keep a sha256 of the front matter prefix (through the closing
+    ``---``) so lazy loads can verify the part they parse without reading the body.
+    Only parse-stage results are cached; repo-dependent validation such as
+    output-path existence is recomputed every run.
+    """
+
+    def __init__(self, path: Path, max_entries: int = DEFAULT_PARSE_CACHE_MAX_ENTRIES) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._touched: set[str] = set()
+
+    @classmethod
+    def load(cls, path: Path, max_entries: int = DEFAULT_PARSE_CACHE_MAX_ENTRIES) -> "SkillParseCache":
+        cache = cls(path, max_entries=max_entries)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cache
+        if not isinstance(data, dict) or data.get("version") != PARSE_CACHE_VERSION:
+            return cache
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            cache.entries = entries
+        cache.generation = int(data.get("generation", 0)) + 1
+        return cache
+
+    def lookup(self, path: Path, raw: bytes, stat: os.stat_result) -> SkillDocument | None:
+        entry = self.entries.get(str(path))
+        if entry is None or entry.get("size") != stat.st_size:
+            self.misses += 1
+            return None
+        if entry.get("sha256") != hashlib.sha256(raw).hexdigest():
+            self.misses += 1
+            return None
+        if entry.get("mtime_ns") != stat.st_mtime_ns:
+            entry["mtime_ns"] = stat.st_mtime_ns
+        return self._hit(path, entry, raw.decode("utf-8"))
+
+    def lookup_prefix(self, path: Path, prefix: str) -> LazySkillDocument | None:
+        """Hit when the streamed front matter prefix hashes the same; used by lazy loads.
+
+        Only the front matter comes from the entry. The body may have changed, so the
+        returned document still reads it from disk on first use.
+        """
+        entry = self.entries.get(str(path))
+        if entry is None or entry.get("prefix_sha256") != _prefix_digest(prefix):
+            self.misses += 1
+            return None
+        self._mark_hit(path, entry)
+        return LazySkillDocument.from_front_matter(
+            path,
+            entry["front_matter_text"],
+            dict(entry["metadata"]),
+            dict(entry["front_matter_tree"]),
+            [ValidationMessage(*item) for item in entry["messages"]],
+        )
+
+    def _mark_hit(self, path: Path, entry: dict[str, Any]) -> None:
+        entry["generation"] = self.generation
+        self._dirty = True
+        self._touched.add(str(path))
+        self.hits += 1
+
+    def _hit(self, path: Path, entry: dict[str, Any], text: str) -> SkillDocument:
+        self._mark_hit(path, entry)
+        return SkillDocument(
+            path=path,
+            text=text,
+            front_matter_text=entry["front_matter_text"],
+            body_text=entry["body_text"],
+            metadata=dict(entry["metadata"]),
+            section_map=dict(entry["section_map"]),
+            messages=[ValidationMessage(*item) for item in entry["messages"]],
+            front_matter_tree=dict(entry["front_matter_tree"]),
+        )
+
+    def store(self, path: Path, raw: bytes, stat: os.stat_result, doc: SkillDocument) -> None:
+        prefix = _front_matter_prefix(io.StringIO(doc.text, newline=""))
+        self.entries[str(path)] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": hashlib.sha256(raw).hexdigest(),
+            "prefix_sha256": None if prefix is None else _prefix_digest(prefix),
+            "generation": self.generation,
+            "front_matter_text": doc.front_matter_text,
+            "body_text": doc.body_text,
+            "metadata": doc.metadata,
+            "front_matter_tree": doc.front_matter_tree,
+            "section_map": doc.section_map,
+            "messages": [[m.level, m.code, m.message] for m in doc.messages],
+        }
+        self._dirty = True
+        self._touched.add(str(path))
+
+    def subset(self, paths: list[Path]) -> "SkillParseCache":
+        """Detached copy holding only ``paths`` so worker processes receive a small pickle."""
+        part = SkillParseCache(self.path, max_entries=self.max_entries)
+        part.generation = self.generation
+        part.entries = {str(p): self.entries[str(p)] for p in paths if str(p) in self.entries}
+        return part
+
+    def touched_entries(self) -> dict[str, dict[str, Any]]:
+        return {key: self.entries[key] for key in self._touched}
+
+    def merge(self, part: "SkillParseCache") -> None:
+        """Fold hits, misses, and new or refreshed entries from a worker's subset back in."""
+        self.hits += part.hits
+        self.misses += part.misses
+        touched = part.touched_entries()
+        if touched:
+            self.entries.update(touched)
+            self._touched.update(touched)
+            self._dirty = True
+
+    def _evict(self) -> None:
+        overflow = len(self.entries) - self.max_entries
+        if overflow <= 0:
+            return
+        # Least-recently-used generations go first; path order keeps eviction deterministic.
+        ranked = sorted(self.entries.items(), key=lambda item: (int(item[1].get("generation", 0)), item[0]))
+        for key, _entry in ranked[:overflow]:
+            del self.entries[key]
+
+    @PROFILER.timed("cache.save")
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self._evict()
+        payload = {"version": PARSE_CACHE_VERSION, "generation": self.generation, "entries": self.entries}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+def add_parse_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the on-disk SKILL.md parse cache for this run (always re-read and re-parse).",
+    )
+    parser.add_argument(
+        "--cache-file",
+        type=Path,
+        help=f"Parse cache location (default: {DEFAULT_PARSE_CACHE_PATH.name} in --reports-dir, or in "
+        f"{REPORTS_ROOT.relative_to(FOUNDRY_ROOT)}/ for commands without one).",
+    )
+
+
+def parse_cache_from_args(args: argparse.Namespace, default_dir: Path | None = None) -> SkillParseCache | None:
+    """Load the parse cache named by ``--cache-file`` or, if unset, the one in the command's
+    reports directory (``default_dir``, then ``--reports-dir``, then the foundry's reports/).
+
+    ``args.cache_file`` is filled in either way, so callers can keep related caches next to it.
+    """
+    if args.cache_file is None:
+        reports_dir = default_dir or getattr(args, "reports_dir", None) or REPORTS_ROOT
+        args.cache_file = reports_dir / DEFAULT_PARSE_CACHE_PATH.name
+    if args.no_cache:
+        return None
+    return SkillParseCache.load(args.cache_file)
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1 (got {value})")
+    return number
+
+
+def add_jobs_argument(parser: argparse.ArgumentParser, help_text: str | None = None) -> None:
+    parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=1,
+        metavar="N",
+        help=help_text
+        or "Load, validate, and lint skills across N worker processes (default: 1, serial). Output order is unchanged.",
+    )
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record wall/CPU time per phase and print a sorted breakdown to stderr.",
+    )
+    parser.add_argument(
+        "--profile-json",
+        type=Path,
+        metavar="PATH",
+        help="Also write the profile breakdown as JSON to PATH (implies --profile).",
+    )
+
+
+def start_profile_from_args(args: argparse.Namespace) -> None:
+    PROFILER.reset(enabled=bool(args.profile or args.profile_json))
+
+
+def run_profiled(args: argparse.Namespace, run: Callable[[argparse.Namespace], int]) -> int:
+    """Run a CLI body with ``--profile`` / ``--profile-json`` honored on every exit path."""
+    start_profile_from_args(args)
+    try:
+        return run(args)
+    finally:
+        finish_profile_from_args(args)
+
+
+def finish_profile_from_args(args: argparse.Namespace) -> None:
+    if not PROFILER.enabled:
+        return
+    print(PROFILER.format_report(), file=sys.stderr)
+    if args.profile_json:
+        args.profile_json.parent.mkdir(parents=True, exist_ok=True)
+        args.profile_json.write_text(json.dumps(PROFILER.report(), indent=2) + "\n", encoding="utf-8")
+
+
+@PROFILER.timed("discover")
 def discover_skill_files(skills_root: Path) -> list[Path]:
     return sorted(skills_root.rglob("SKILL.md"))
 
@@ -98,11 +523,15 @@ def _parse_scalar(value: str) -> Any:
     v = value.strip()
     if not v:
         return ""
-    if v.lower() in {"true", "false"}:
-        return v.lower() == "true"
-    if re.fullmatch(r"\d+", v):
-        return int(v)
-    if v.startswith("[") and v.endswith("]"):
+    first = v[0]
+    if first in "tTfF":
+        lowered = v.lower()
+        if lowered == "true" or lowered == "false":
+            return lowered == "true"
+    elif first.isdigit():
+        if v.isascii() and v.isdigit():
+            return int(v)
+    elif first == "[" and v.endswith("]"):
         inner = v[1:-1].strip()
         if not inner:
             return []
@@ -114,76 +543,192 @@ def _parse_scalar(value: str) -> Any:
             else:
                 cleaned.append(p)
         return cleaned
-    if (v.startswith('"') and v.endswith('"')) or (v.startswith("'") and v.endswith("'")):
+    elif (first == '"' or first == "'") and v.endswith(first):
         return v[1:-1]
     return v
 
 
-def parse_front_matter_minimal(front_matter: str) -> tuple[dict[str, Any], list[ValidationMessage]]:
+class FrontMatterToken(NamedTuple):
+    line_no: int
+    indent: int
+    kind: str  # "key", "item", "comment", or "text"
+    key: str = ""
+    value: str = ""
+    value_col: int = 0
+
+
+def tokenize_front_matter(front_matter: str) -> tuple[list[str], list[FrontMatterToken]]:
+    """Classify every non-blank front matter line in a single pass."""
+    lines = front_matter.splitlines()
+    tokens: list[FrontMatterToken] = []
+    append = tokens.append
+    for line_no, line in enumerate(lines):
+        stripped = line.lstrip(" ")
+        if not stripped or stripped.isspace():
+            continue
+        indent = len(line) - len(stripped)
+        first = stripped[0]
+        if first == "#":
+            append(FrontMatterToken(line_no, indent, "comment"))
+            continue
+        if first == "-" and (len(stripped) == 1 or stripped[1] == " "):
+            rest = stripped[1:]
+            value = rest.strip()
+            value_col = indent + 1 + (len(rest) - len(rest.lstrip()))
+            append(FrontMatterToken(line_no, indent, "item", "", value, value_col))
+            continue
+        # Top-level keys keep the historical lenient form (`key:value`); nested keys need `key: value`.
+        match = (NESTED_KEY_RE if indent else TOP_LEVEL_KEY_RE).match(stripped.rstrip())
+        if match:
+            append(FrontMatterToken(line_no, indent, "key", match.group(1), (match.group(2) or "").strip()))
+        else:
+            append(FrontMatterToken(line_no, indent, "text", "", stripped.strip()))
+    return lines, tokens
+
+
+def _subtree_end(tokens: list[FrontMatterToken], pos: int, end: int) -> int:
+    indent = tokens[pos].indent
+    child_end = pos + 1
+    while child_end < end and tokens[child_end].indent > indent:
+        child_end += 1
+    return child_end
+
+
+def _build_mapping(tokens: list[FrontMatterToken], pos: int, end: int) -> dict[str, Any]:
+    indent = tokens[pos].indent
+    mapping: dict[str, Any] = {}
+    while pos < end:
+        tok = tokens[pos]
+        child_end = _subtree_end(tokens, pos, end)
+        if tok.kind == "key" and tok.indent == indent:
+            if tok.value:
+                mapping[tok.key] = _parse_scalar(tok.value)
+            elif child_end > pos + 1:
+                mapping[tok.key] = _build_node(tokens, pos + 1, child_end)
+            elif child_end < end and tokens[child_end].kind == "item" and tokens[child_end].indent == indent:
+                # `key:` followed by list items at the same indentation is valid YAML.
+                list_end = child_end
+                while list_end < end and (
+                    tokens[list_end].indent > indent or tokens[list_end].kind == "item"
+                ):
+                    list_end += 1
+                mapping[tok.key] = _build_list(tokens, child_end, list_end)
+                child_end = list_end
+            else:
+                mapping[tok.key] = ""
+        pos = child_end
+    return mapping
+
+
+def _build_list(tokens: list[FrontMatterToken], pos: int, end: int) -> list[Any]:
+    indent = tokens[pos].indent
+    items: list[Any] = []
+    while pos < end:
+        tok = tokens[pos]
+        child_end = _subtree_end(tokens, pos, end)
+        if tok.kind == "item" and tok.indent == indent:
+            match = NESTED_KEY_RE.match(tok.value) if tok.value else None
+            if match:
+                # `- key: value` opens a mapping whose keys sit at the column after the dash.
+                first = FrontMatterToken(tok.line_no, tok.value_col, "key", match.group(1), (match.group(2) or "").strip())
+                items.append(_build_mapping([first, *tokens[pos + 1 : child_end]], 0, child_end - pos))
+            elif tok.value:
+                items.append(_parse_scalar(tok.value))
+            elif child_end > pos + 1:
+                items.append(_build_node(tokens, pos + 1, child_end))
+            else:
+                items.append("")
+        pos = child_end
+    return items
+
+
+def _build_node(tokens: list[FrontMatterToken], pos: int, end: int) -> Any:
+    if tokens[pos].kind == "item":
+        return _build_list(tokens, pos, end)
+    if tokens[pos].kind == "key":
+        return _build_mapping(tokens, pos, end)
+    return " ".join(tok.value for tok in tokens[pos:end] if tok.kind == "text")
+
+
+def parse_front_matter(front_matter: str) -> tuple[dict[str, Any], dict[str, Any], list[ValidationMessage]]:
+    """Parse front matter once into flat metadata and a structured tree.
+
+    ``metadata`` keeps nested blocks as raw indented text (the historical shape);
+    ``tree`` holds the same keys with nested blocks parsed into dicts/lists/scalars.
+    """
     metadata: dict[str, Any] = {}
+    tree: dict[str, Any] = {}
     msgs: list[ValidationMessage] = []
-    lines = front_matter.splitlines()
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        if not line.strip() or line.lstrip().startswith("#"):
-            i += 1
+    lines, tokens = tokenize_front_matter(front_matter)
+    pos = 0
+    while pos < len(tokens):
+        tok = tokens[pos]
+        line = lines[tok.line_no]
+        if tok.kind == "comment":
+            pos += 1
             continue
-        if line.startswith(" "):
+        if tok.indent > 0:
             msgs.append(ValidationMessage("ERROR", "bad_indentation", f"Unexpected indented line in front matter: {line!r}"))
-            i += 1
+            pos += 1
             continue
-        m = re.match(r"^([A-Za-z_][A-Za-z0-9_-]*):(?:\s*(.*))?$", line)
-        if not m:
+        if tok.kind != "key":
             msgs.append(ValidationMessage("ERROR", "bad_yaml_line", f"Could not parse front matter line: {line!r}"))
-            i += 1
+            pos += 1
             continue
-        key, raw_val = m.group(1), (m.group(2) or "")
-        if raw_val == "":
-            block_lines: list[str] = []
-            i += 1
-            while i < len(lines) and (lines[i].startswith("  ") or not lines[i].strip()):
-                block_lines.append(lines[i])
-                i += 1
-            # Keep block text to avoid depending on external YAML libraries.
-            metadata[key] = "\n".join(block_lines).rstrip("\n")
+        if tok.value:
+            metadata[tok.key] = tree[tok.key] = _parse_scalar(tok.value)
+            pos += 1
             continue
-        metadata[key] = _parse_scalar(raw_val)
-        i += 1
+        # A block owns every following line indented by at least two spaces.
+        block_end = pos + 1
+        while block_end < len(tokens) and tokens[block_end].indent >= 2:
+            block_end += 1
+        end_line = tokens[block_end].line_no if block_end < len(tokens) else len(lines)
+        # Keep block text to avoid depending on external YAML libraries.
+        metadata[tok.key] = "\n".join(lines[tok.line_no + 1 : end_line]).rstrip("\n")
+        children = [child for child in tokens[pos + 1 : block_end] if child.kind != "comment"]
+        tree[tok.key] = _build_node(children, 0, len(children)) if children else ""
+        pos = block_end
+    return metadata, tree, msgs
+
+
+def parse_front_matter_minimal(front_matter: str) -> tuple[dict[str, Any], list[ValidationMessage]]:
+    metadata, _tree, msgs = parse_front_matter(front_matter)
     return metadata, msgs
 
 
+def _list_item_text(item: Any) -> str:
+    if isinstance(item, dict):
+        return ", ".join(f"{key}: {value}" for key, value in item.items())
+    return str(item)
+
+
 def extract_list_items_from_front_matter_block(front_matter: str, key: str) -> list[str]:
-    lines = front_matter.splitlines()
-    items: list[str] = []
-    in_block = False
-    block_indent = 0
+    _metadata, tree, _msgs = parse_front_matter(front_matter)
+    return front_matter_list(tree, key)
 
-    inline_match = re.search(rf"(?m)^{re.escape(key)}:\s*(\[[^\n]*\])\s*$", front_matter)
-    if inline_match:
-        parsed = _parse_scalar(inline_match.group(1))
-        if isinstance(parsed, list):
-            return [str(x) for x in parsed]
 
-    for line in lines:
-        if not in_block:
-            if re.match(rf"^{re.escape(key)}:\s*$", line):
-                in_block = True
-            continue
+def front_matter_list(tree: dict[str, Any], key: str) -> list[str]:
+    node = tree.get(key)
+    if not isinstance(node, list):
+        return []
+    return [_list_item_text(item) for item in node]
+
+
+def front_matter_mapping(tree: dict[str, Any], key: str) -> dict[str, Any]:
+    node = tree.get(key)
+    return node if isinstance(node, dict) else {}
 
-        if not line.strip():
-            continue
-        current_indent = len(line) - len(line.lstrip(" "))
-        if current_indent == 0:
-            break
-        if block_indent == 0:
-            block_indent = current_indent
-        if current_indent < block_indent:
-            break
-        stripped = line.strip()
-        if stripped.startswith("- "):
-            items.append(stripped[2:].strip())
-    return items
+
+def front_matter_input_items(tree: dict[str, Any]) -> list[dict[str, Any]]:
+    node = tree.get("inputs")
+    if not isinstance(node, list):
+        return []
+    return [item for item in node if isinstance(item, dict)]
+
+
+def _inputs_missing_field(tree: dict[str, Any], field_name: str) -> bool:
+    return not any(field_name in item for item in front_matter_input_items(tree))
 
 
 def classify_missing_output_path_warning(token: str) -> ValidationMessage:
@@ -240,15 +785,82 @@ def extract_sections(body_text: str) -> dict[str, str]:
     return sections
 
 
-def load_skill_document(path: Path) -> SkillDocument:
-    text = read_text(path)
-    fm_text, body_text, msgs = split_front_matter(text)
-    metadata: dict[str, Any] = {}
-    if fm_text is not None:
-        parsed, parse_msgs = parse_front_matter_minimal(fm_text)
-        metadata = parsed
+def read_front_matter_prefix(path: Path) -> str | None:
+    """Stream ``path`` up to and including the closing ``---``; ``None`` if it has no closed front matter."""
+    with path.open(encoding="utf-8", newline="") as handle:
+        return _front_matter_prefix(handle)
+
+
+def _front_matter_prefix(lines: Iterable[str]) -> str | None:
+    seen: list[str] = []
+    for line in lines:
+        seen.append(line)
+        if len(seen) == 1:
+            if line.strip() != FRONT_MATTER_START:
+                return None
+        elif line.strip() == FRONT_MATTER_START:
+            return "".join(seen)
+    return None
+
+
+def _prefix_digest(prefix: str) -> str:
+    return hashlib.sha256(prefix.encode("utf-8")).hexdigest()
+
+
+def load_skill_document_lazy(path: Path, cache: SkillParseCache | None = None) -> SkillDocument:
+    """Parse only the front matter now; body text and sections load on first access.
+
+    With a cache, an entry whose front matter prefix hashes the same is used without
+    re-parsing it. Lazy loads never store cache entries, since those need the full
+    content hash. Files without closed front matter fall back to ``load_skill_document``.
+    """
+    with PROFILER.phase("read"):
+        prefix = read_front_matter_prefix(path)
+    if prefix is None:
+        return load_skill_document(path, cache)
+    with PROFILER.phase("parse.front_matter"):
+        fm_text, _body, msgs = split_front_matter(prefix)
+    if fm_text is None:
+        return load_skill_document(path, cache)
+    if cache is not None:
+        with PROFILER.phase("cache.lookup"):
+            cached = cache.lookup_prefix(path, prefix)
+        if cached is not None:
+            return cached
+    with PROFILER.phase("parse.front_matter"):
+        metadata, tree, parse_msgs = parse_front_matter(fm_text)
         msgs.extend(parse_msgs)
-    sections = extract_sections(body_text)
+    return LazySkillDocument.from_front_matter(path, fm_text, metadata, tree, msgs)
+
+
+def load_skill_document(path: Path, cache: SkillParseCache | None = None) -> SkillDocument:
+    if cache is None:
+        with PROFILER.phase("read"):
+            text = read_text(path)
+        return parse_skill_document(path, text)
+    with PROFILER.phase("read"):
+        raw = path.read_bytes()
+        stat = path.stat()
+    with PROFILER.phase("cache.lookup"):
+        cached = cache.lookup(path, raw, stat)
+    if cached is not None:
+        return cached
+    doc = parse_skill_document(path, raw.decode("utf-8"))
+    with PROFILER.phase("cache.store"):
+        cache.store(path, raw, stat, doc)
+    return doc
+
+
+def parse_skill_document(path: Path, text: str) -> SkillDocument:
+    with PROFILER.phase("parse.front_matter"):
+        fm_text, body_text, msgs = split_front_matter(text)
+        metadata: dict[str, Any] = {}
+        tree: dict[str, Any] = {}
+        if fm_text is not None:
+            metadata, tree, parse_msgs = parse_front_matter(fm_text)
+            msgs.extend(parse_msgs)
+    with PROFILER.phase("parse.sections"):
+        sections = extract_sections(body_text)
     return SkillDocument(
         path=path,
         text=text,
@@ -257,64 +869,240 @@ def load_skill_document(path: Path) -> SkillDocument:
         metadata=metadata,
         section_map=sections,
         messages=msgs,
+        front_matter_tree=tree,
     )
 
 
+@lru_cache(maxsize=1024)
 def _normalize_section_name(name: str) -> str:
     return re.sub(r"\s+", " ", name.strip().lower())
 
 
 def validate_skill_document(doc: SkillDocument, repo_root: Path) -> SkillDocument:
     msgs = list(doc.messages)
-    fm_text = doc.front_matter_text or ""
+    tree = doc.front_matter_tree
 
-    for key in REQUIRED_METADATA_KEYS:
-        if key not in doc.metadata:
-            msgs.append(ValidationMessage("ERROR", "missing_metadata_key", f"Missing required metadata key: {key}"))
+    with PROFILER.phase("validate.metadata_keys"):
+        for key in REQUIRED_METADATA_KEYS:
+            if key not in doc.metadata:
+                msgs.append(ValidationMessage("ERROR", "missing_metadata_key", f"Missing required metadata key: {key}"))
 
-    skill_id = str(doc.metadata.get("id", ""))
-    if skill_id and not re.fullmatch(r"[a-z0-9]+(?:-[a-z0-9]+)*", skill_id):
-        msgs.append(ValidationMessage("ERROR", "bad_skill_id", "Metadata id must be stable kebab-case"))
+        skill_id = str(doc.metadata.get("id", ""))
+        if skill_id and not KEBAB_CASE_RE.fullmatch(skill_id):
+            msgs.append(ValidationMessage("ERROR", "bad_skill_id", "Metadata id must be stable kebab-case"))
 
-    tags = doc.metadata.get("tags")
-    if tags is not None and not isinstance(tags, list):
-        msgs.append(ValidationMessage("ERROR", "bad_tags_type", "tags must be an inline YAML list (e.g. [tag-a, tag-b]) in this scaffold"))
+        tags = doc.metadata.get("tags")
+        if tags is not None and not isinstance(tags, list):
+            msgs.append(ValidationMessage("ERROR", "bad_tags_type", "tags must be an inline YAML list (e.g. [tag-a, tag-b]) in this scaffold"))
 
-    normalized = {_normalize_section_name(k): k for k in doc.section_map}
-    for required in REQUIRED_SECTIONS:
-        if _normalize_section_name(required) not in normalized:
-            msgs.append(ValidationMessage("ERROR", "missing_section", f"Missing required section: {required}"))
+    with PROFILER.phase("validate.sections"):
+        normalized = {_normalize_section_name(k): k for k in doc.section_map}
+        for required in REQUIRED_SECTIONS:
+            if _normalize_section_name(required) not in normalized:
+                msgs.append(ValidationMessage("ERROR", "missing_section", f"Missing required section: {required}"))
 
     if "safety" in doc.metadata:
-        for subkey in ["dry_run_supported", "destructive_actions", "confirmation_points"]:
-            if f"{subkey}:" not in fm_text:
-                msgs.append(ValidationMessage("ERROR", "missing_safety_subkey", f"safety must include {subkey}"))
+        with PROFILER.phase("validate.safety"):
+            safety = front_matter_mapping(tree, "safety")
+            for subkey in ["dry_run_supported", "destructive_actions", "confirmation_points"]:
+                if subkey not in safety:
+                    msgs.append(ValidationMessage("ERROR", "missing_safety_subkey", f"safety must include {subkey}"))
 
     if "inputs" in doc.metadata:
-        for token in ["- name:", "type:", "required:", "examples:"]:
-            if token not in fm_text:
-                msgs.append(ValidationMessage("ERROR", "missing_input_shape", f"inputs must include field token {token}"))
+        with PROFILER.phase("validate.inputs"):
+            # A field counts once any input item declares it; it is looked up inside inputs[], not in the text.
+            for field_name, token in [("name", "- name:"), ("type", "type:"), ("required", "required:"), ("examples", "examples:")]:
+                if _inputs_missing_field(tree, field_name):
+                    msgs.append(ValidationMessage("ERROR", "missing_input_shape", f"inputs must include field token {token}"))
 
     if "outputs" in doc.metadata:
-        for ref in extract_list_items_from_front_matter_block(fm_text, "outputs"):
-            token = ref.split()[0].strip("`,'\"")
-            if token.startswith("http://") or token.startswith("https://"):
-                continue
-            if "<" in token or ">" in token:
-                continue
-            path = (repo_root / token).resolve() if not Path(token).is_absolute() else Path(token)
-            if not path.exists():
-                msgs.append(classify_missing_output_path_warning(token))
+        with PROFILER.phase("validate.outputs"):
+            for ref in front_matter_list(tree, "outputs"):
+                if not ref.strip():
+                    continue
+                token = ref.split()[0].strip("`,'\"")
+                if token.startswith("http://") or token.startswith("https://"):
+                    continue
+                if "<" in token or ">" in token:
+                    continue
+                # Lexical normalization plus one stat call; resolve() would lstat every path component.
+                if not os.path.exists(os.path.normpath(os.path.join(repo_root, token))):
+                    msgs.append(classify_missing_output_path_warning(token))
 
     doc.messages = msgs
     return doc
 
 
-def validate_skills(skills_root: Path, repo_root: Path) -> list[SkillDocument]:
+def load_skill_corpus(
+    skills_root: Path,
+    repo_root: Path | None = None,
+    cache: SkillParseCache | None = None,
+    paths: list[Path] | None = None,
+    *,
+    jobs: int = 1,
+    lint: bool = False,
+    disabled_lint_rules: frozenset[str] = frozenset(),
+    rule_timings: dict[str, float] | None = None,
+    lazy: bool = False,
+) -> SkillCorpus:
+    """Load every skill document once; validate in the same pass when repo_root is given.
+
+    Pass ``paths`` to load an explicit subset instead of discovering every SKILL.md.
+    With ``lint=True`` (requires ``repo_root``) lint results are computed in the same pass.
+    ``jobs > 1`` fans the work out over a process pool; documents keep discovery order.
+    ``disabled_lint_rules`` and ``rule_timings`` are passed through to ``lint_skill``.
+    ``lazy=True`` is for metadata-only callers: see ``load_skill_document_lazy``.
+    """
+    selected = discover_skill_files(skills_root) if paths is None else list(paths)
+    hits_before = cache.hits if cache is not None else 0
+    docs: list[SkillDocument] = []
+    lint_results: list[dict[str, Any]] = []
+    documents = iter_skill_documents(
+        selected,
+        repo_root,
+        cache,
+        jobs=jobs,
+        lint=lint,
+        disabled_lint_rules=disabled_lint_rules,
+        rule_timings=rule_timings,
+        lazy=lazy,
+    )
+    for doc, result in documents:
+        docs.append(doc)
+        if result is not None:
+            lint_results.append(result)
+    return SkillCorpus(
+        skills_root=skills_root,
+        documents=docs,
+        files_read=len(docs),
+        validated=repo_root is not None,
+        cache_hits=(cache.hits - hits_before) if cache is not None else 0,
+        lint_results=lint_results if lint else None,
+    )
+
+
+def iter_skill_documents(
+    paths: list[Path],
+    repo_root: Path | None = None,
+    cache: SkillParseCache | None = None,
+    *,
+    jobs: int = 1,
+    lint: bool = False,
+    disabled_lint_rules: frozenset[str] = frozenset(),
+    rule_timings: dict[str, float] | None = None,
+    lazy: bool = False,
+) -> Iterator[tuple[SkillDocument, dict[str, Any] | None]]:
+    """Yield ``(document, lint_result)`` pairs in ``paths`` order as soon as each one is ready.
+
+    This is the streaming core behind ``load_skill_corpus``: callers that consume records
+    one at a time (``--ndjson``) never hold more than a few chunks of documents in memory.
+    ``lint_result`` is ``None`` unless ``lint=True``.
+    """
+    if lint and repo_root is None:
+        raise ValueError("lint=True requires repo_root so documents are validated first")
+    rules = select_lint_rules(disabled_lint_rules)
+    if jobs > 1 and len(paths) > 1:
+        yield from _iter_corpus_parallel(paths, repo_root, cache, jobs, lint, disabled_lint_rules, rule_timings, lazy)
+        return
+    load = load_skill_document_lazy if lazy else load_skill_document
+    for path in paths:
+        doc = load(path, cache=cache)
+        if repo_root is not None:
+            doc = validate_skill_document(doc, repo_root)
+        yield doc, (lint_skill(doc, rules, rule_timings) if lint else None)
+
+
+class _CorpusChunk(NamedTuple):
+    docs: list[SkillDocument]
+    lint_results: list[dict[str, Any]]
+    cache: SkillParseCache | None
+    rule_timings: dict[str, float]
+    profile: dict[str, list[float]]
+
+
+def _load_corpus_chunk(
+    paths: list[Path],
+    repo_root: Path | None,
+    cache: SkillParseCache | None,
+    lint: bool,
+    disabled_lint_rules: frozenset[str],
+    time_rules: bool,
+    profile: bool,
+    lazy: bool = False,
+) -> _CorpusChunk:
+    # Worker-side body of the parallel loader; rules are rebuilt here because the table holds lambdas.
+    PROFILER.reset(enabled=profile)
+    rules = select_lint_rules(disabled_lint_rules)
+    rule_timings: dict[str, float] | None = {} if time_rules else None
     docs: list[SkillDocument] = []
-    for path in discover_skill_files(skills_root):
-        docs.append(validate_skill_document(load_skill_document(path), repo_root))
-    return docs
+    load = load_skill_document_lazy if lazy else load_skill_document
+    for path in paths:
+        doc = load(path, cache=cache)
+        if repo_root is not None:
+            doc = validate_skill_document(doc, repo_root)
+        docs.append(doc)
+    lint_results = [lint_skill(doc, rules, rule_timings) for doc in docs] if lint else []
+    return _CorpusChunk(docs, lint_results, cache, rule_timings or {}, PROFILER.snapshot())
+
+
+# Upper bound on documents per worker task, so huge corpora still stream in small batches.
+PARALLEL_CHUNK_MAX = 256
+
+
+def _iter_corpus_parallel(
+    paths: list[Path],
+    repo_root: Path | None,
+    cache: SkillParseCache | None,
+    jobs: int,
+    lint: bool,
+    disabled_lint_rules: frozenset[str],
+    rule_timings: dict[str, float] | None,
+    lazy: bool = False,
+) -> Iterator[tuple[SkillDocument, dict[str, Any] | None]]:
+    # A few chunks per worker keeps pickling overhead low while still balancing uneven files.
+    chunk_size = max(1, min(PARALLEL_CHUNK_MAX, -(-len(paths) // (jobs * 4))))
+    chunks = iter([paths[i : i + chunk_size] for i in range(0, len(paths), chunk_size)])
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending: deque = deque()
+
+        def submit_next() -> None:
+            chunk = next(chunks, None)
+            if chunk is not None:
+                subset = cache.subset(chunk) if cache is not None else None
+                pending.append(
+                    pool.submit(
+                        _load_corpus_chunk,
+                        chunk,
+                        repo_root,
+                        subset,
+                        lint,
+                        disabled_lint_rules,
+                        rule_timings is not None,
+                        PROFILER.enabled,
+                        lazy,
+                    )
+                )
+
+        # Keep only a bounded window of chunks in flight so finished results never pile up.
+        for _ in range(jobs * 2):
+            submit_next()
+        # Consume in submission order so output matches the serial, sorted order.
+        while pending:
+            chunk = pending.popleft().result()
+            submit_next()
+            if cache is not None and chunk.cache is not None:
+                cache.merge(chunk.cache)
+            if rule_timings is not None:
+                for rule_id, seconds in chunk.rule_timings.items():
+                    rule_timings[rule_id] = rule_timings.get(rule_id, 0.0) + seconds
+            # Worker phases add up CPU across processes, so their wall total can exceed elapsed time.
+            PROFILER.merge(chunk.profile)
+            for idx, doc in enumerate(chunk.docs):
+                yield doc, (chunk.lint_results[idx] if lint else None)
+
+
+def validate_skills(skills_root: Path, repo_root: Path) -> list[SkillDocument]:
+    return load_skill_corpus(skills_root, repo_root).documents
 
 
 def format_validate_summary(docs: list[SkillDocument]) -> str:
@@ -323,191 +1111,370 @@ def format_validate_summary(docs: list[SkillDocument]) -> str:
     warns = sum(1 for d in docs for m in d.messages if m.level == "WARN")
     lines = [f"Validated {total} skills: {errors} error(s), {warns} warning(s)"]
     for doc in docs:
-        if not doc.messages:
-            lines.append(f"- OK {doc.path}")
-            continue
-        lines.append(f"- {doc.path}")
-        for msg in doc.messages:
-            lines.append(f"  [{msg.level}] {msg.code}: {msg.message}")
+        lines.extend(format_validate_document_lines(doc))
     return "\n".join(lines)
 
 
+def format_validate_document_lines(doc: SkillDocument) -> list[str]:
+    if not doc.messages:
+        return [f"- OK {doc.path}"]
+    lines = [f"- {doc.path}"]
+    for msg in doc.messages:
+        lines.append(f"  [{msg.level}] {msg.code}: {msg.message}")
+    return lines
+
+
+def validation_record(doc: SkillDocument) -> dict[str, Any]:
+    """One skill's validation result as written to ``--json`` / ``--ndjson``."""
+    return {
+        "skill_id": doc.skill_id,
+        "path": str(doc.path),
+        "messages": [{"level": m.level, "code": m.code, "message": m.message} for m in doc.messages],
+    }
+
+
+class NdjsonWriter:
+    """Write one JSON object per line, flushing each record so readers can tail the file.
+
+    ``path`` of ``-`` writes to stdout. Files are truncated on open, so a tailing reader
+    sees a run's records appear one by one instead of a single write at the end.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = path
+        self.count = 0
+        self._stream: IO[str] | None = None
+        self._owns_stream = False
+
+    def __enter__(self) -> NdjsonWriter:
+        if str(self.path) == "-":
+            self._stream = sys.stdout
+        else:
+            target = Path(self.path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            self._stream = target.open("w", encoding="utf-8")
+            self._owns_stream = True
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._stream is not None and self._owns_stream:
+            self._stream.close()
+        self._stream = None
+
+    def write(self, record: dict[str, Any]) -> None:
+        assert self._stream is not None, "NdjsonWriter used outside a with-block"
+        with PROFILER.phase("report.ndjson"):
+            self._stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+            self._stream.flush()
+        self.count += 1
+
+
 def validation_failed(docs: list[SkillDocument]) -> bool:
     return any(doc.has_errors for doc in docs)
 
 
 def _count_numbered_steps(text: str) -> int:
-    return len(re.findall(r"(?m)^\d+\.\s+", text))
-
-
-def _lint_rule_id_for_issue(issue: str) -> str:
-    issue_lower = issue.lower()
-    if issue_lower.startswith("missing section:"):
-        return "section.missing"
-    if "validation errors present" == issue_lower:
-        return "validation.errors_present"
-    if "procedure steps are not numbered" == issue_lower:
-        return "procedure.not_numbered"
-    if "procedure is too short" in issue_lower:
-        return "procedure.too_short"
-    if "expected_tools is missing" == issue_lower:
-        return "metadata.expected_tools_missing"
-    if "safety confirmation points are missing" == issue_lower:
-        return "safety.confirmation_points_missing"
-    if "examples are missing" == issue_lower:
-        return "examples.missing"
-    if "inputs missing typed inputs" in issue_lower or "inputs missing input examples" in issue_lower:
-        return "inputs.metadata_incomplete"
-    if "examples section is too thin" == issue_lower:
-        return "examples.too_thin"
-    if "failure modes section lacks recovery guidance" == issue_lower:
-        return "failure_modes.recovery_missing"
-    if "scope appears too broad" == issue_lower:
-        return "scope.too_broad"
-    if "procedure is vague / not executable" == issue_lower:
-        return "procedure.vague"
-    if "placeholder description text remains" == issue_lower:
-        return "template.placeholder_description"
-    if "when to use section still contains template wording" == issue_lower:
-        return "template.when_to_use_wording"
-    if "examples section appears to be uncustomized template content" == issue_lower:
-        return "template.examples_uncustomized"
-    return "lint.generic_issue"
-
-
-def lint_skill(doc: SkillDocument) -> dict[str, Any]:
-    issues: list[str] = []
-    fixes: list[str] = []
-    completeness = 100
-    excellence = 10
-
-    normalized_sections = {_normalize_section_name(k): v for k, v in doc.section_map.items()}
-
-    if doc.has_errors:
-        err_count = sum(1 for m in doc.messages if m.level == "ERROR")
-        completeness -= min(60, err_count * 10)
-        excellence -= min(5, err_count)
-        issues.append("Validation errors present")
-        fixes.append("Run skills-validate and fix missing metadata/sections before linting for quality")
-
-    for required in REQUIRED_SECTIONS:
-        if _normalize_section_name(required) not in normalized_sections:
-            completeness -= 8
-            excellence -= 1
-            issues.append(f"Missing section: {required}")
-            fixes.append(f"Add a `## {required}` section with concrete content")
-
-    procedure_body = normalized_sections.get("procedure", "")
-    step_count = _count_numbered_steps(procedure_body)
-    if step_count == 0:
-        completeness -= 15
-        excellence -= 2
-        issues.append("Procedure steps are not numbered")
-        fixes.append("Rewrite the Procedure section as explicit numbered steps (1., 2., 3.)")
-    elif step_count < 3:
-        completeness -= 8
-        excellence -= 1
-        issues.append("Procedure is too short to be executable")
-        fixes.append("Expand the Procedure section to at least 3 concrete numbered steps")
-
-    fm_text = doc.front_matter_text or ""
-    if "expected_tools:" not in fm_text:
-        completeness -= 10
-        excellence -= 1
-        issues.append("expected_tools is missing")
-        fixes.append("Add `expected_tools` to front matter with the tools the skill depends on")
-
-    if "confirmation_points:" not in fm_text:
-        completeness -= 8
-        excellence -= 1
-        issues.append("Safety confirmation points are missing")
-        fixes.append("Add `safety.confirmation_points` with explicit approval checkpoints")
-
-    if "examples:" not in fm_text and "## Examples" not in doc.body_text:
-        completeness -= 10
-        excellence -= 1
-        issues.append("Examples are missing")
-        fixes.append("Add realistic examples in metadata and the Examples section")
-
-    inputs_block = doc.metadata.get("inputs", "")
-    inputs_blob = inputs_block if isinstance(inputs_block, str) else json.dumps(inputs_block)
-    for token, label in [("type:", "typed inputs"), ("examples:", "input examples")]:
-        if token not in inputs_blob and token not in fm_text:
-            completeness -= 8
-            excellence -= 1
-            issues.append(f"Inputs missing {label}")
-            fixes.append("Ensure each input includes `type` and `examples` fields")
-            break
+    return len(NUMBERED_STEP_RE.findall(text))
+
+
+@dataclass(frozen=True)
+class LintContext:
+    """Per-document values shared by lint rules, computed once before any rule runs."""
+
+    doc: SkillDocument
+    tree: dict[str, Any]
+    sections: dict[str, str]
+    procedure_body: str
+    step_count: int
+    examples_body: str
+    failure_body: str
+    when_to_use_body: str
+    description_text: str
+
+    @classmethod
+    def from_document(cls, doc: SkillDocument) -> LintContext:
+        sections = {_normalize_section_name(k): v for k, v in doc.section_map.items()}
+        procedure_body = sections.get("procedure", "")
+        return cls(
+            doc=doc,
+            tree=doc.front_matter_tree,
+            sections=sections,
+            procedure_body=procedure_body,
+            step_count=_count_numbered_steps(procedure_body),
+            examples_body=sections.get("examples", ""),
+            failure_body=sections.get("failure modes + recovery", ""),
+            when_to_use_body=sections.get("when to use", ""),
+            description_text=str(doc.metadata.get("description", "")),
+        )
+
+
+@dataclass(frozen=True)
+class LintRule:
+    """One lint check: a predicate plus the penalties and text emitted when it fires.
+
+    ``predicate`` returns a falsy value when the document passes, ``True`` for a single
+    finding, or a list of subjects for one finding each; ``issue`` and ``fix`` may use
+    ``{subject}``. Penalties are ints or callables of the context for data-dependent costs.
+    """
+
+    rule_id: str
+    predicate: Callable[[LintContext], Any]
+    completeness_penalty: int | Callable[[LintContext], int]
+    excellence_penalty: int | Callable[[LintContext], int]
+    issue: str
+    fix: str
+
+
+class LintFinding(NamedTuple):
+    rule_id: str
+    issue: str
+    fix: str
+    completeness_penalty: int
+    excellence_penalty: int
+
+
+def _validation_error_count(ctx: LintContext) -> int:
+    return sum(1 for m in ctx.doc.messages if m.level == "ERROR")
 
-    examples_body = normalized_sections.get("examples", "")
-    if len(examples_body) < 60:
-        completeness -= 6
-        excellence -= 1
-        issues.append("Examples section is too thin")
-        fixes.append("Add realistic example scenarios with concrete inputs and outcomes")
-
-    failure_body = normalized_sections.get("failure modes + recovery", "")
-    if failure_body and "recover" not in failure_body.lower() and "retry" not in failure_body.lower():
-        completeness -= 4
-        excellence -= 1
-        issues.append("Failure modes section lacks recovery guidance")
-        fixes.append("Add explicit recovery or retry steps to Failure modes + recovery")
-
-    combined_text = (str(doc.metadata.get("description", "")) + "\n" + normalized_sections.get("when to use", "")).lower()
-    if any(term in combined_text for term in ["everything", "all tasks", "do anything", "universal"]):
-        completeness -= 6
-        excellence -= 2
-        issues.append("Scope appears too broad")
-        fixes.append("Narrow the skill to one job and move extra responsibilities into separate skills")
-
-    if any(term in procedure_body.lower() for term in ["make it great", "do the thing", "improve as needed"]):
-        completeness -= 6
-        excellence -= 2
-        issues.append("Procedure is vague / not executable")
-        fixes.append("Replace vague instructions with explicit commands, files, and verification steps")
-
-    description_text = str(doc.metadata.get("description", "")).strip().lower()
-    when_to_use_body = normalized_sections.get("when to use", "")
-    if description_text in {"describe the skill purpose here.", "describe the skill purpose here"}:
-        completeness -= 12
-        excellence -= 3
-        issues.append("Placeholder description text remains")
-        fixes.append("Replace the template placeholder description with a specific one-line value proposition")
-    if "use this skill when you need a focused, repeatable workflow for `" in when_to_use_body.lower():
-        completeness -= 8
-        excellence -= 2
-        issues.append("When to use section still contains template wording")
-        fixes.append("Rewrite `When to use` with a concrete scenario and trigger conditions")
-    if "example 1: run on a small repo" in examples_body.lower() and "example 2: run in dry-run mode first" in examples_body.lower():
-        completeness -= 8
-        excellence -= 2
-        issues.append("Examples section appears to be uncustomized template content")
-        fixes.append("Replace template examples with realistic, task-specific scenarios and outcomes")
-
-    completeness = max(0, completeness)
-    excellence = max(0, min(10, excellence))
-    top_issues = issues[:5]
-    suggested_fixes = fixes[:5]
-    top_issue_rule_ids = [_lint_rule_id_for_issue(issue) for issue in top_issues]
+
+def _missing_required_sections(ctx: LintContext) -> list[str]:
+    return [required for required in REQUIRED_SECTIONS if _normalize_section_name(required) not in ctx.sections]
+
+
+def _examples_missing(ctx: LintContext) -> bool:
+    has_metadata_examples = "examples" in ctx.tree or any(
+        "examples" in item for item in front_matter_input_items(ctx.tree)
+    )
+    return not has_metadata_examples and "## Examples" not in ctx.doc.body_text
+
+
+def _first_incomplete_input_field(ctx: LintContext) -> list[str]:
+    for field_name, label in [("type", "typed inputs"), ("examples", "input examples")]:
+        if _inputs_missing_field(ctx.tree, field_name):
+            return [label]
+    return []
+
+
+def _failure_modes_lack_recovery(ctx: LintContext) -> bool:
+    body = ctx.failure_body.lower()
+    return bool(body) and "recover" not in body and "retry" not in body
+
+
+def _scope_too_broad(ctx: LintContext) -> bool:
+    combined_text = (ctx.description_text + "\n" + ctx.when_to_use_body).lower()
+    return any(term in combined_text for term in ["everything", "all tasks", "do anything", "universal"])
+
+
+def _examples_uncustomized(ctx: LintContext) -> bool:
+    body = ctx.examples_body.lower()
+    return "example 1: run on a small repo" in body and "example 2: run in dry-run mode first" in body
+
+
+# Evaluation order is report order: top_issues keeps the first five findings.
+LINT_RULES: tuple[LintRule, ...] = (
+    LintRule(
+        "validation.errors_present",
+        lambda ctx: ctx.doc.has_errors,
+        lambda ctx: min(60, _validation_error_count(ctx) * 10),
+        lambda ctx: min(5, _validation_error_count(ctx)),
+        "Validation errors present",
+        "Run skills-validate and fix missing metadata/sections before linting for quality",
+    ),
+    LintRule(
+        "section.missing",
+        _missing_required_sections,
+        8,
+        1,
+        "Missing section: {subject}",
+        "Add a `## {subject}` section with concrete content",
+    ),
+    LintRule(
+        "procedure.not_numbered",
+        lambda ctx: ctx.step_count == 0,
+        15,
+        2,
+        "Procedure steps are not numbered",
+        "Rewrite the Procedure section as explicit numbered steps (1., 2., 3.)",
+    ),
+    LintRule(
+        "procedure.too_short",
+        lambda ctx: 0 < ctx.step_count < 3,
+        8,
+        1,
+        "Procedure is too short to be executable",
+        "Expand the Procedure section to at least 3 concrete numbered steps",
+    ),
+    LintRule(
+        "metadata.expected_tools_missing",
+        lambda ctx: "expected_tools" not in ctx.tree,
+        10,
+        1,
+        "expected_tools is missing",
+        "Add `expected_tools` to front matter with the tools the skill depends on",
+    ),
+    LintRule(
+        "safety.confirmation_points_missing",
+        lambda ctx: "confirmation_points" not in front_matter_mapping(ctx.tree, "safety"),
+        8,
+        1,
+        "Safety confirmation points are missing",
+        "Add `safety.confirmation_points` with explicit approval checkpoints",
+    ),
+    LintRule(
+        "examples.missing",
+        _examples_missing,
+        10,
+        1,
+        "Examples are missing",
+        "Add realistic examples in metadata and the Examples section",
+    ),
+    LintRule(
+        "inputs.metadata_incomplete",
+        _first_incomplete_input_field,
+        8,
+        1,
+        "Inputs missing {subject}",
+        "Ensure each input includes `type` and `examples` fields",
+    ),
+    LintRule(
+        "examples.too_thin",
+        lambda ctx: len(ctx.examples_body) < 60,
+        6,
+        1,
+        "Examples section is too thin",
+        "Add realistic example scenarios with concrete inputs and outcomes",
+    ),
+    LintRule(
+        "failure_modes.recovery_missing",
+        _failure_modes_lack_recovery,
+        4,
+        1,
+        "Failure modes section lacks recovery guidance",
+        "Add explicit recovery or retry steps to Failure modes + recovery",
+    ),
+    LintRule(
+        "scope.too_broad",
+        _scope_too_broad,
+        6,
+        2,
+        "Scope appears too broad",
+        "Narrow the skill to one job and move extra responsibilities into separate skills",
+    ),
+    LintRule(
+        "procedure.vague",
+        lambda ctx: any(
+            term in ctx.procedure_body.lower() for term in ["make it great", "do the thing", "improve as needed"]
+        ),
+        6,
+        2,
+        "Procedure is vague / not executable",
+        "Replace vague instructions with explicit commands, files, and verification steps",
+    ),
+    LintRule(
+        "template.placeholder_description",
+        lambda ctx: ctx.description_text.strip().lower()
+        in {"describe the skill purpose here.", "describe the skill purpose here"},
+        12,
+        3,
+        "Placeholder description text remains",
+        "Replace the template placeholder description with a specific one-line value proposition",
+    ),
+    LintRule(
+        "template.when_to_use_wording",
+        lambda ctx: "use this skill when you need a focused, repeatable workflow for `" in ctx.when_to_use_body.lower(),
+        8,
+        2,
+        "When to use section still contains template wording",
+        "Rewrite `When to use` with a concrete scenario and trigger conditions",
+    ),
+    LintRule(
+        "template.examples_uncustomized",
+        _examples_uncustomized,
+        8,
+        2,
+        "Examples section appears to be uncustomized template content",
+        "Replace template examples with realistic, task-specific scenarios and outcomes",
+    ),
+)
+
+LINT_RULE_IDS = tuple(rule.rule_id for rule in LINT_RULES)
+
+
+def select_lint_rules(disabled: Iterable[str] = ()) -> tuple[LintRule, ...]:
+    """The registry minus ``disabled`` rule ids; unknown ids raise ``ValueError``."""
+    disabled_ids = set(disabled)
+    unknown = sorted(disabled_ids - set(LINT_RULE_IDS))
+    if unknown:
+        raise ValueError(f"Unknown lint rule id(s): {', '.join(unknown)}")
+    return tuple(rule for rule in LINT_RULES if rule.rule_id not in disabled_ids)
+
+
+def _resolve_penalty(penalty: int | Callable[[LintContext], int], ctx: LintContext) -> int:
+    return penalty(ctx) if callable(penalty) else penalty
+
+
+def evaluate_lint_rule(rule: LintRule, ctx: LintContext) -> list[LintFinding]:
+    outcome = rule.predicate(ctx)
+    if not outcome:
+        return []
+    subjects = [None] if outcome is True else list(outcome)
+    completeness_penalty = _resolve_penalty(rule.completeness_penalty, ctx)
+    excellence_penalty = _resolve_penalty(rule.excellence_penalty, ctx)
+    return [
+        LintFinding(
+            rule.rule_id,
+            rule.issue.format(subject=subject),
+            rule.fix.format(subject=subject),
+            completeness_penalty,
+            excellence_penalty,
+        )
+        for subject in subjects
+    ]
+
+
+def lint_skill(
+    doc: SkillDocument,
+    rules: tuple[LintRule, ...] = LINT_RULES,
+    rule_timings: dict[str, float] | None = None,
+) -> dict[str, Any]:
+    """Score one document against ``rules``; per-rule seconds accumulate into ``rule_timings`` if given."""
+    ctx = LintContext.from_document(doc)
+    findings: list[LintFinding] = []
+    for rule in rules:
+        if rule_timings is None and not PROFILER.enabled:
+            findings.extend(evaluate_lint_rule(rule, ctx))
+            continue
+        started = time.perf_counter()
+        with PROFILER.phase(f"lint.rule.{rule.rule_id}"):
+            findings.extend(evaluate_lint_rule(rule, ctx))
+        if rule_timings is not None:
+            rule_timings[rule.rule_id] = rule_timings.get(rule.rule_id, 0.0) + time.perf_counter() - started
+
+    completeness = max(0, 100 - sum(f.completeness_penalty for f in findings))
+    excellence = max(0, min(10, 10 - sum(f.excellence_penalty for f in findings)))
+    top_findings = findings[:5]
 
     return {
         "skill_id": doc.skill_id,
         "path": str(doc.path),
         "completeness_score_100": completeness,
         "excellence_score_10": excellence,
-        "top_issues": top_issues,
-        "top_issue_rule_ids": top_issue_rule_ids,
-        "suggested_fixes": suggested_fixes,
+        "top_issues": [f.issue for f in top_findings],
+        "top_issue_rule_ids": [f.rule_id for f in top_findings],
+        "suggested_fixes": [f.fix for f in top_findings],
         "validation_errors": [m.message for m in doc.messages if m.level == "ERROR"],
         "validation_warnings": [m.message for m in doc.messages if m.level == "WARN"],
     }
 
 
-def lint_skills(skills_root: Path, repo_root: Path) -> list[dict[str, Any]]:
-    docs = validate_skills(skills_root, repo_root)
+def lint_documents(docs: list[SkillDocument]) -> list[dict[str, Any]]:
     return [lint_skill(doc) for doc in docs]
 
 
+def lint_skills(skills_root: Path, repo_root: Path) -> list[dict[str, Any]]:
+    return lint_documents(validate_skills(skills_root, repo_root))
+
+
 def _display_path(path_text: str, repo_root: Path | None, absolute_paths: bool) -> str:
     if absolute_paths:
         return path_text
@@ -522,6 +1489,18 @@ def _display_path(path_text: str, repo_root: Path | None, absolute_paths: bool)
         return path_text
 
 
+def lint_report_record(
+    item: dict[str, Any],
+    repo_root: Path | None = None,
+    absolute_paths: bool = False,
+) -> dict[str, Any]:
+    """A lint result with its path rendered the way the reports show it."""
+    rendered = dict(item)
+    rendered["path"] = _display_path(str(item.get("path", "")), repo_root=repo_root, absolute_paths=absolute_paths)
+    return rendered
+
+
+@PROFILER.timed("report.lint")
 def write_lint_reports(
     results: list[dict[str, Any]],
     reports_dir: Path,
@@ -531,11 +1510,9 @@ def write_lint_reports(
     reports_dir.mkdir(parents=True, exist_ok=True)
     json_path = reports_dir / "skills-lint.json"
     md_path = reports_dir / "skills-lint.md"
-    rendered_results: list[dict[str, Any]] = []
-    for item in results:
-        rendered = dict(item)
-        rendered["path"] = _display_path(str(item.get("path", "")), repo_root=repo_root, absolute_paths=absolute_paths)
-        rendered_results.append(rendered)
+    rendered_results = [
+        lint_report_record(item, repo_root=repo_root, absolute_paths=absolute_paths) for item in results
+    ]
 
     json_path.write_text(json.dumps(rendered_results, indent=2) + "\n", encoding="utf-8")
 
@@ -572,4 +1549,4 @@ def render_template_text(template_text: str, replacements: dict[str, str]) -> st
 
 
 def ensure_kebab_case(value: str) -> bool:
-    return bool(re.fullmatch(r"[a-z0-9]+(?:-[a-z0-9]+)*", value))
+    return bool(KEBAB_CASE_RE.fullmatch(value))
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+from _skills_common import (
+    REPORTS_ROOT,
+    SkillDocument,
+    SkillParseCache,
+    ValidationMessage,
+    discover_skill_files,
+    iter_skill_documents,
+)
+
+
+INCREMENTAL_STATE_VERSION = 3
+DEFAULT_VALIDATE_STATE_PATH = REPORTS_ROOT / ".skills-validate-state.json"
+DEFAULT_LINT_STATE_PATH = REPORTS_ROOT / ".skills-lint-state.json"
+# A state file keeps results for this many skills roots (most recently written last), so runs
+# against another root (a scratch tree, a test fixture) do not discard the main root's results.
+MAX_INCREMENTAL_STATE_ROOTS = 8
+
+
+@dataclass
+class IncrementalPlan:
+    """Which skill files must be re-checked and which can reuse the previous report."""
+
+    all_paths: list[Path]
+    recheck: list[Path]
+    reuse: list[Path]
+    ref: str | None
+    notes: list[str] = field(default_factory=list)
+    # (size, mtime_ns) of every file, taken before anything is read, stored with its result.
+    fingerprints: dict[Path, list[int]] = field(default_factory=dict)
+
+
+def add_incremental_arguments(
+    parser: argparse.ArgumentParser,
+    default_state_file: Path,
+    *,
+    in_reports_dir: bool = False,
+) -> None:
+    """Add --changed-since/--incremental/--state-file.
+
+    With ``in_reports_dir`` the state file defaults to ``default_state_file.name`` inside the
+    command's ``--reports-dir`` (``args.state_file`` is None until ``resolve_state_file``).
+    """
+    parser.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help="Only re-check SKILL.md files changed since this git ref (committed, staged, unstaged, or untracked); "
+        "reuse the cached report for the rest.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Shorthand for --changed-since HEAD (re-check only uncommitted skill changes).",
+    )
+    parser.add_argument(
+        "--state-file",
+        type=Path,
+        default=None if in_reports_dir else default_state_file,
+        help="Cached per-skill report used to merge incremental runs "
+        f"(default: {default_state_file.name} in {'--reports-dir' if in_reports_dir else 'reports/'}).",
+    )
+
+
+def resolve_state_file(args: argparse.Namespace, default_state_file: Path) -> Path:
+    if args.state_file is None:
+        args.state_file = args.reports_dir / default_state_file.name
+    return args.state_file
+
+
+def incremental_ref_from_args(args: argparse.Namespace) -> str | None:
+    if args.changed_since:
+        return str(args.changed_since)
+    if args.incremental:
+        return "HEAD"
+    return None
+
+
+def _git_lines(root: Path, git_args: list[str]) -> list[str]:
+    proc = subprocess.run(["git", "-C", str(root), *git_args], capture_output=True, text=True)
+    if proc.returncode != 0:
+        detail = proc.stderr.strip() or f"exit {proc.returncode}"
+        raise RuntimeError(f"git {' '.join(git_args)} failed: {detail}")
+    return [line for line in proc.stdout.splitlines() if line.strip()]
+
+
+def git_changed_paths(root: Path, ref: str) -> set[Path]:
+    """Resolved paths under ``root`` that differ from ``ref`` in the working tree, plus untracked files."""
+    toplevel = Path(_git_lines(root, ["rev-parse", "--show-toplevel"])[0])
+    changed = _git_lines(root, ["diff", "--name-only", ref, "--", "."])
+    untracked = _git_lines(root, ["ls-files", "--others", "--exclude-standard", "--full-name", "--", "."])
+    return {(toplevel / rel).resolve() for rel in [*changed, *untracked]}
+
+
+def _state_key(path: Path) -> str:
+    return str(path.resolve())
+
+
+def _file_fingerprint(path: Path) -> list[int]:
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _with_fingerprint(entry: dict[str, Any], fingerprint: list[int] | None) -> dict[str, Any]:
+    return dict(entry, fingerprint=fingerprint)
+
+
+def load_incremental_state(
+    state_file: Path,
+    *,
+    skills_root: Path,
+    repo_root: Path,
+    settings: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Cached per-skill results for ``skills_root``, or ``{}`` if none were saved or the repo root
+    or result-affecting ``settings`` changed."""
+    data = _read_state_roots(state_file).get(str(skills_root.resolve()))
+    if not isinstance(data, dict) or data.get("repo_root") != str(repo_root.resolve()):
+        return {}
+    if data.get("settings", {}) != (settings or {}):
+        return {}
+    results = data.get("results")
+    return results if isinstance(results, dict) else {}
+
+
+def _read_state_roots(state_file: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(state_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != INCREMENTAL_STATE_VERSION:
+        return {}
+    roots = data.get("roots")
+    return roots if isinstance(roots, dict) else {}
+
+
+def write_incremental_state(
+    state_file: Path,
+    results: dict[str, Any],
+    *,
+    skills_root: Path,
+    repo_root: Path,
+    settings: dict[str, Any] | None = None,
+) -> None:
+    roots = _read_state_roots(state_file)
+    key = str(skills_root.resolve())
+    roots.pop(key, None)
+    roots[key] = {"repo_root": str(repo_root.resolve()), "settings": settings or {}, "results": results}
+    payload = {
+        "version": INCREMENTAL_STATE_VERSION,
+        "roots": dict(list(roots.items())[-MAX_INCREMENTAL_STATE_ROOTS:]),
+    }
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = state_file.with_name(state_file.name + ".tmp")
+    tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, state_file)
+
+
+def plan_incremental(skills_root: Path, ref: str | None, state: dict[str, Any]) -> IncrementalPlan:
+    all_paths = discover_skill_files(skills_root)
+    fingerprints = {path: _file_fingerprint(path) for path in all_paths}
+    if ref is None:
+        return IncrementalPlan(all_paths=all_paths, recheck=list(all_paths), reuse=[], ref=None, fingerprints=fingerprints)
+
+    notes: list[str] = []
+    try:
+        changed = git_changed_paths(skills_root, ref)
+    except (OSError, RuntimeError) as exc:
+        notes.append(f"WARN: incremental mode unavailable ({exc}); running a full check")
+        return IncrementalPlan(
+            all_paths=all_paths, recheck=list(all_paths), reuse=[], ref=ref, notes=notes, fingerprints=fingerprints
+        )
+    if not state:
+        notes.append("No cached report found; running a full check to seed incremental state")
+
+    recheck: list[Path] = []
+    reuse: list[Path] = []
+    for path in all_paths:
+        entry = state.get(_state_key(path))
+        # Unchanged relative to the ref is not enough: a revert or branch switch since the
+        # cached run also changes the file, which the stored fingerprint catches.
+        if path.resolve() in changed or entry is None or entry.get("fingerprint") != fingerprints[path]:
+            recheck.append(path)
+        else:
+            reuse.append(path)
+    return IncrementalPlan(
+        all_paths=all_paths, recheck=recheck, reuse=reuse, ref=ref, notes=notes, fingerprints=fingerprints
+    )
+
+
+def describe_incremental_plan(plan: IncrementalPlan) -> list[str]:
+    lines = list(plan.notes)
+    if plan.ref is not None:
+        lines.append(
+            f"Incremental: re-checking {len(plan.recheck)} of {len(plan.all_paths)} skill(s) changed since {plan.ref}"
+        )
+    return lines
+
+
+def _validation_state_entry(doc: SkillDocument) -> dict[str, Any]:
+    return {"skill_id": doc.skill_id, "messages": [[m.level, m.code, m.message] for m in doc.messages]}
+
+
+def _document_from_validation_state(path: Path, entry: dict[str, Any]) -> SkillDocument:
+    # Reused results only need identity and messages; the file itself is not re-read.
+    return SkillDocument(
+        path=path,
+        text="",
+        front_matter_text=None,
+        body_text="",
+        metadata={"id": entry.get("skill_id") or path.parent.name},
+        section_map={},
+        messages=[ValidationMessage(*item) for item in entry.get("messages", [])],
+    )
+
+
+def iter_validate_incremental(
+    plan: IncrementalPlan,
+    state: dict[str, Any],
+    new_state: dict[str, Any],
+    *,
+    repo_root: Path,
+    cache: SkillParseCache | None = None,
+    jobs: int = 1,
+) -> Iterator[SkillDocument]:
+    """Yield fresh or cached validation results in discovery order, filling ``new_state`` as it goes."""
+    recheck = set(plan.recheck)
+    fresh = iter_skill_documents(plan.recheck, repo_root, cache, jobs=jobs)
+    for path in plan.all_paths:
+        key = _state_key(path)
+        doc = next(fresh)[0] if path in recheck else _document_from_validation_state(path, state[key])
+        new_state[key] = _with_fingerprint(_validation_state_entry(doc), plan.fingerprints.get(path))
+        yield doc
+
+
+def validate_incremental(
+    plan: IncrementalPlan,
+    state: dict[str, Any],
+    *,
+    skills_root: Path,
+    repo_root: Path,
+    cache: SkillParseCache | None = None,
+    jobs: int = 1,
+) -> tuple[list[SkillDocument], dict[str, Any]]:
+    """Validate ``plan.recheck`` and merge with cached results, in discovery order."""
+    new_state: dict[str, Any] = {}
+    docs = list(iter_validate_incremental(plan, state, new_state, repo_root=repo_root, cache=cache, jobs=jobs))
+    return docs, new_state
+
+
+def iter_lint_incremental(
+    plan: IncrementalPlan,
+    state: dict[str, Any],
+    new_state: dict[str, Any],
+    *,
+    repo_root: Path,
+    cache: SkillParseCache | None = None,
+    jobs: int = 1,
+    disabled_lint_rules: frozenset[str] = frozenset(),
+    rule_timings: dict[str, float] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield fresh or cached lint results in discovery order, filling ``new_state`` as it goes."""
+    recheck = set(plan.recheck)
+    fresh = iter_skill_documents(
+        plan.recheck,
+        repo_root,
+        cache,
+        jobs=jobs,
+        lint=True,
+        disabled_lint_rules=disabled_lint_rules,
+        rule_timings=rule_timings,
+    )
+    for path in plan.all_paths:
+        key = _state_key(path)
+        if path in recheck:
+            result = next(fresh)[1]
+        else:
+            result = {name: value for name, value in state[key].items() if name != "fingerprint"}
+            result["path"] = str(path)
+        new_state[key] = _with_fingerprint(result, plan.fingerprints.get(path))
+        yield result
+
+
+def lint_incremental(
+    plan: IncrementalPlan,
+    state: dict[str, Any],
+    *,
+    skills_root: Path,
+    repo_root: Path,
+    cache: SkillParseCache | None = None,
+    jobs: int = 1,
+    disabled_lint_rules: frozenset[str] = frozenset(),
+    rule_timings: dict[str, float] | None = None,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Lint ``plan.recheck`` and merge with cached lint results, in discovery order."""
+    new_state: dict[str, Any] = {}
+    results = list(
+        iter_lint_incremental(
+            plan,
+            state,
+            new_state,
+            repo_root=repo_root,
+            cache=cache,
+            jobs=jobs,
+            disabled_lint_rules=disabled_lint_rules,
+            rule_timings=rule_timings,
+        )
+    )
+    return results, new_state
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from _skills_common import (
+    PROFILER,
+    REPORTS_ROOT,
+    SkillDocument,
+    SkillParseCache,
+    discover_skill_files,
+    front_matter_input_items,
+    front_matter_list,
+    load_skill_document,
+)
+
+
+SEARCH_INDEX_VERSION = 1
+DEFAULT_SEARCH_INDEX_PATH = REPORTS_ROOT / ".skills-search-index.json"
+# Okapi BM25 parameters (the usual defaults).
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Metadata terms count this many times more than body terms; "metadata" is also reported as a section.
+METADATA_WEIGHT = 3
+METADATA_SECTION = "metadata"
+_TOKEN_RE = re.compile(r"[^\W_]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from if in into is it of on or that the this to use when with".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    return [token for token in _TOKEN_RE.findall(text.casefold()) if token not in _STOPWORDS]
+
+
+def _metadata_text(doc: SkillDocument) -> str:
+    tree = doc.front_matter_tree
+    parts = [str(doc.metadata.get(key) or "") for key in ("id", "name", "description")]
+    parts.extend(front_matter_list(tree, "tags"))
+    parts.extend(front_matter_list(tree, "expected_tools"))
+    parts.extend(str(item.get("name", "")) for item in front_matter_input_items(tree))
+    return " ".join(parts)
+
+
+def _document_sections(doc: SkillDocument) -> dict[str, list[str]]:
+    """Tokens per section, metadata first; section titles count as part of their section."""
+    sections = {METADATA_SECTION: tokenize(_metadata_text(doc))}
+    for title, text in doc.section_map.items():
+        sections[title] = tokenize(f"{title} {text}")
+    return sections
+
+
+def _term_frequencies(sections: dict[str, list[str]]) -> dict[str, int]:
+    frequencies: dict[str, int] = {}
+    for title, tokens in sections.items():
+        weight = METADATA_WEIGHT if title == METADATA_SECTION else 1
+        for token in tokens:
+            frequencies[token] = frequencies.get(token, 0) + weight
+    return frequencies
+
+
+@dataclass
+class SearchHit:
+    skill_id: str
+    path: str
+    score: float
+    sections: list[str]
+
+
+@dataclass
+class IndexUpdate:
+    indexed: int = 0
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    unchanged: int = 0
+
+
+@dataclass
+class SearchIndex:
+    """Persisted BM25 index over skill metadata and ``section_map`` text.
+
+    ``docs`` holds per-skill bookkeeping (stat signature, content hash, length, and the
+    unique terms of every section); ``postings`` maps term -> {doc key: weighted tf}.
+    Keeping both lets one skill be replaced or dropped without touching the others.
+    """
+
+    path: Path
+    skills_root: str = ""
+    docs: dict[str, dict[str, Any]] = field(default_factory=dict)
+    postings: dict[str, dict[str, int]] = field(default_factory=dict)
+    total_length: int = 0
+    _dirty: bool = False
+
+    @classmethod
+    def load(cls, path: Path) -> SearchIndex:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path)
+        if not isinstance(data, dict) or data.get("version") != SEARCH_INDEX_VERSION:
+            return cls(path)
+        docs = data.get("docs") or {}
+        return cls(
+            path,
+            skills_root=str(data.get("skills_root") or ""),
+            docs=docs,
+            postings=data.get("postings") or {},
+            total_length=sum(int(doc.get("length", 0)) for doc in docs.values()),
+        )
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        payload = {
+            "version": SEARCH_INDEX_VERSION,
+            "skills_root": self.skills_root,
+            "docs": self.docs,
+            "postings": self.postings,
+        }
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def _remove(self, key: str) -> None:
+        doc = self.docs.pop(key)
+        self.total_length -= int(doc.get("length", 0))
+        for term in {token for tokens in doc["sections"].values() for token in tokens}:
+            posting = self.postings.get(term)
+            if posting is not None:
+                posting.pop(key, None)
+                if not posting:
+                    del self.postings[term]
+
+    def _add(self, key: str, doc: SkillDocument, stat: os.stat_result, sha256: str) -> None:
+        token_lists = _document_sections(doc)
+        frequencies = _term_frequencies(token_lists)
+        length = sum(frequencies.values())
+        self.docs[key] = {
+            "skill_id": doc.skill_id,
+            "path": str(doc.path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": sha256,
+            "length": length,
+            "sections": {title: sorted(set(tokens)) for title, tokens in token_lists.items()},
+        }
+        self.total_length += length
+        for term, frequency in frequencies.items():
+            self.postings.setdefault(term, {})[key] = frequency
+
+    @PROFILER.timed("search.update")
+    def update(self, skills_root: Path, cache: SkillParseCache | None = None, rebuild: bool = False) -> IndexUpdate:
+        """Bring the index in line with ``skills_root``, re-indexing only changed SKILL.md files.
+
+        Unchanged files are recognised by (size, mtime_ns) without being read; a stat change
+        falls back to the content hash, so touched-but-identical files are not re-indexed.
+        """
+        result = IndexUpdate()
+        root = str(skills_root.resolve())
+        if rebuild or root != self.skills_root:
+            self.docs, self.postings, self.total_length = {}, {}, 0
+            self.skills_root = root
+            self._dirty = True
+        seen: set[str] = set()
+        for path in discover_skill_files(skills_root):
+            key = path.relative_to(skills_root).as_posix()
+            seen.add(key)
+            stat = path.stat()
+            existing = self.docs.get(key)
+            if existing and existing["size"] == stat.st_size and existing["mtime_ns"] == stat.st_mtime_ns:
+                result.unchanged += 1
+                continue
+            sha256 = hashlib.sha256(path.read_bytes()).hexdigest()
+            if existing and existing["sha256"] == sha256:
+                existing["mtime_ns"] = stat.st_mtime_ns
+                self._dirty = True
+                result.unchanged += 1
+                continue
+            if existing:
+                self._remove(key)
+                result.updated += 1
+            else:
+                result.added += 1
+            self._add(key, load_skill_document(path, cache), stat, sha256)
+            self._dirty = True
+        for key in [key for key in self.docs if key not in seen]:
+            self._remove(key)
+            result.removed += 1
+            self._dirty = True
+        result.indexed = len(self.docs)
+        return result
+
+    @PROFILER.timed("search.query")
+    def search(self, query: str, limit: int = 10) -> list[SearchHit]:
+        """Rank skills by BM25 over ``query`` terms; ties break by skill id."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.docs:
+            return []
+        total_docs = len(self.docs)
+        average_length = self.total_length / total_docs or 1.0
+        scores: dict[str, float] = {}
+        for term in terms:
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            idf = math.log(1 + (total_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+            for key, frequency in posting.items():
+                length = self.docs[key]["length"]
+                norm = frequency + BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+                scores[key] = scores.get(key, 0.0) + idf * frequency * (BM25_K1 + 1) / norm
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self.docs[item[0]]["skill_id"]))[:limit]
+        hits: list[SearchHit] = []
+        query_terms = set(terms)
+        for key, score in ranked:
+            doc = self.docs[key]
+            matched = [
+                (len(query_terms.intersection(tokens)), title)
+                for title, tokens in doc["sections"].items()
+                if query_terms.intersection(tokens)
+            ]
+            # Sections matching more distinct query terms first, then document order.
+            order = {title: position for position, title in enumerate(doc["sections"])}
+            sections = [title for _count, title in sorted(matched, key=lambda item: (-item[0], order[item[1]]))]
+            hits.append(SearchHit(doc["skill_id"], doc["path"], round(score, 4), sections))
+        return hits
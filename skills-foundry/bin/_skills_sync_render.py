@@ -1,13 +1,38 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import ctypes
 import datetime as dt
+import errno
+import hashlib
+import json
+import os
 import shutil
-from dataclasses import dataclass
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
-from _skills_common import load_skill_document, validate_skills, validation_failed, lint_skills, write_lint_reports
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms always fall back to copy
+    fcntl = None  # type: ignore[assignment]
+
+from _skills_backup import BackupRun, DirectoryBackup
+from _skills_common import (
+    PROFILER,
+    SkillCorpus,
+    SkillDocument,
+    front_matter_input_items,
+    lint_documents,
+    load_skill_corpus,
+    validation_failed,
+    write_lint_reports,
+)
 
 
 @dataclass
@@ -20,6 +45,9 @@ class SkillEntry:
     tags: list[str]
     expected_tools: list[str]
     input_names: list[str]
+    document: SkillDocument | None = field(default=None, repr=False, compare=False)
+    # Relative path -> {"sha256", "size"} for every file in source_dir; filled on first use.
+    source_files: dict[str, dict[str, Any]] | None = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -28,6 +56,9 @@ class SyncPlan:
     update: list[SkillEntry]
     unchanged: list[SkillEntry]
     would_prune: list[Path]
+    manifest: dict[str, Any] = field(default_factory=dict)
+    # Skills decided from the target manifest (or a live symlink) without reading target files.
+    manifest_hits: int = 0
 
 
 def _as_list(value: Any) -> list[str]:
@@ -41,59 +72,163 @@ def _as_list(value: Any) -> list[str]:
     return []
 
 
-def _parse_input_names(front_matter_text: str | None) -> list[str]:
-    if not front_matter_text:
-        return []
-    names: list[str] = []
-    for line in front_matter_text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("- name:"):
-            names.append(stripped.split(":", 1)[1].strip().strip('"').strip("'"))
-    return names
-
-
-def collect_skill_entries(skills_root: Path) -> list[SkillEntry]:
-    entries: list[SkillEntry] = []
-    for skill_md in sorted(skills_root.rglob("SKILL.md")):
-        doc = load_skill_document(skill_md)
-        category = skill_md.parent.parent.name if skill_md.parent.parent != skills_root else "uncategorized"
-        entries.append(
-            SkillEntry(
-                skill_id=str(doc.metadata.get("id") or skill_md.parent.name),
-                category=category,
-                source_dir=skill_md.parent,
-                source_skill_md=skill_md,
-                description=str(doc.metadata.get("description") or ""),
-                tags=_as_list(doc.metadata.get("tags")),
-                expected_tools=_as_list(doc.metadata.get("expected_tools")),
-                input_names=_parse_input_names(doc.front_matter_text),
-            )
-        )
-    return entries
+def _parse_input_names(front_matter_tree: dict[str, Any]) -> list[str]:
+    return [str(item["name"]) for item in front_matter_input_items(front_matter_tree) if "name" in item]
+
+
+def skill_entry_from_document(doc: SkillDocument, skills_root: Path) -> SkillEntry:
+    skill_md = doc.path
+    category = skill_md.parent.parent.name if skill_md.parent.parent != skills_root else "uncategorized"
+    return SkillEntry(
+        skill_id=str(doc.metadata.get("id") or skill_md.parent.name),
+        category=category,
+        source_dir=skill_md.parent,
+        source_skill_md=skill_md,
+        description=str(doc.metadata.get("description") or ""),
+        tags=_as_list(doc.metadata.get("tags")),
+        expected_tools=_as_list(doc.metadata.get("expected_tools")),
+        input_names=_parse_input_names(doc.front_matter_tree),
+        document=doc,
+    )
+
+
+@PROFILER.timed("catalog.entries")
+def collect_skill_entries(skills_root: Path, corpus: SkillCorpus | None = None) -> list[SkillEntry]:
+    if corpus is None:
+        corpus = load_skill_corpus(skills_root, lazy=True)
+    return [skill_entry_from_document(doc, corpus.skills_root) for doc in corpus.documents]
+
+
+FRAGMENT_CACHE_VERSION = 1
+INDEX_FRAGMENT_CACHE_NAME = ".skills-index-fragments.json"
+
+
+def catalog_fragment_cache_path(output_path: Path) -> Path:
+    return output_path.with_name(f".{output_path.name}.fragments.json")
 
 
-def render_skills_catalog(entries: list[SkillEntry], output_path: Path) -> Path:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    lines = ["# Skills Catalog", "", f"Total skills: {len(entries)}", ""]
+class FragmentCache:
+    """Rendered per-category markdown keyed by a hash of the entry fields it was rendered from.
+
+    A category whose entries did not change reuses its cached text; ``kind`` keeps catalog
+    and index fragments from ever being mixed up. ``path=None`` keeps the cache in memory.
+    """
+
+    def __init__(self, path: Path | None, kind: str, fragments: dict[str, list[str]] | None = None) -> None:
+        self.path = path
+        self.kind = kind
+        self.fragments: dict[str, list[str]] = fragments or {}
+        # Counters describe the most recent render.
+        self.rendered = 0
+        self.reused = 0
+        self.last_write_skipped = False
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path | None, kind: str) -> FragmentCache:
+        if path is None:
+            return cls(None, kind)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path, kind)
+        if not isinstance(data, dict) or data.get("version") != FRAGMENT_CACHE_VERSION or data.get("kind") != kind:
+            return cls(path, kind)
+        fragments = data.get("fragments")
+        return cls(path, kind, fragments if isinstance(fragments, dict) else {})
+
+    def fragment(self, category: str, signature: Any, render: Callable[[], str]) -> str:
+        key = hashlib.sha256(json.dumps(signature, separators=(",", ":")).encode("utf-8")).hexdigest()
+        cached = self.fragments.get(category)
+        if isinstance(cached, list) and len(cached) == 2 and cached[0] == key:
+            self.reused += 1
+            return cached[1]
+        text = render()
+        self.fragments[category] = [key, text]
+        self.rendered += 1
+        self._dirty = True
+        return text
+
+    def retain(self, categories: Iterable[str]) -> None:
+        keep = set(categories)
+        for category in [name for name in self.fragments if name not in keep]:
+            del self.fragments[category]
+            self._dirty = True
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        payload = {"version": FRAGMENT_CACHE_VERSION, "kind": self.kind, "fragments": self.fragments}
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+def write_text_if_changed(path: Path, text: str) -> bool:
+    """Atomically write ``text`` unless ``path`` already holds exactly these bytes; return whether it wrote."""
+    data = text.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def _group_by_category(entries: list[SkillEntry]) -> dict[str, list[SkillEntry]]:
     by_category: dict[str, list[SkillEntry]] = {}
     for entry in entries:
         by_category.setdefault(entry.category, []).append(entry)
-    for category in sorted(by_category):
-        lines.append(f"## {category}")
+    return {category: sorted(by_category[category], key=lambda e: e.skill_id) for category in sorted(by_category)}
+
+
+def _catalog_fragment(category: str, entries: list[SkillEntry]) -> str:
+    lines = [f"## {category}", ""]
+    for entry in entries:
+        lines.append(f"### {entry.skill_id}")
+        lines.append(f"- Description: {entry.description or '(missing description)'}")
+        lines.append(f"- Tags: {', '.join(entry.tags) if entry.tags else '(none)'}")
+        lines.append(f"- Inputs: {', '.join(entry.input_names) if entry.input_names else '(no inputs parsed)'}")
+        lines.append(f"- Expected tools: {', '.join(entry.expected_tools) if entry.expected_tools else '(none)'}")
+        lines.append(f"- Path: `{entry.source_skill_md}`")
         lines.append("")
-        for entry in sorted(by_category[category], key=lambda e: e.skill_id):
-            lines.append(f"### {entry.skill_id}")
-            lines.append(f"- Description: {entry.description or '(missing description)'}")
-            lines.append(f"- Tags: {', '.join(entry.tags) if entry.tags else '(none)'}")
-            lines.append(
-                f"- Inputs: {', '.join(entry.input_names) if entry.input_names else '(no inputs parsed)'}"
-            )
-            lines.append(
-                f"- Expected tools: {', '.join(entry.expected_tools) if entry.expected_tools else '(none)'}"
-            )
-            lines.append(f"- Path: `{entry.source_skill_md}`")
-            lines.append("")
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    return "\n".join(lines)
+
+
+@PROFILER.timed("report.catalog")
+def render_skills_catalog(
+    entries: list[SkillEntry],
+    output_path: Path,
+    fragment_cache: FragmentCache | None = None,
+) -> Path:
+    """Write the catalog, re-rendering only categories whose entries changed.
+
+    The file is left untouched (mtime included) when the rendered bytes are identical.
+    """
+    cache = fragment_cache or FragmentCache(None, "catalog")
+    cache.rendered = cache.reused = 0
+    by_category = _group_by_category(entries)
+    fragments = [
+        cache.fragment(
+            category,
+            [
+                [e.skill_id, e.description, e.tags, e.input_names, e.expected_tools, str(e.source_skill_md)]
+                for e in group
+            ],
+            partial(_catalog_fragment, category, group),
+        )
+        for category, group in by_category.items()
+    ]
+    cache.retain(by_category)
+    text = "\n".join(["# Skills Catalog", "", f"Total skills: {len(entries)}", "", *fragments])
+    cache.last_write_skipped = not write_text_if_changed(output_path, text)
+    cache.save()
     return output_path
 
 
@@ -110,28 +245,180 @@ def _load_target_skill_map(target_root: Path) -> dict[str, Path]:
     return mapping
 
 
-def _same_skill_content(source_skill_md: Path, target_skill_md: Path) -> bool:
-    if not target_skill_md.exists():
+SYNC_MANIFEST_NAME = ".skills-sync-manifest.json"
+SYNC_MANIFEST_VERSION = 1
+SOURCE_DIGEST_CACHE_NAME = ".skills-sync-source-digests.json"
+
+
+def file_digest(path: Path) -> dict[str, Any]:
+    digest = hashlib.sha256()
+    size = 0
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(block)
+            size += len(block)
+    return {"sha256": digest.hexdigest(), "size": size}
+
+
+def _walk_files(root: Path) -> list[Path]:
+    files: list[Path] = []
+    for dirpath, _dirnames, filenames in os.walk(root):
+        files.extend(Path(dirpath) / name for name in filenames)
+    return sorted(files)
+
+
+class SourceDigestCache:
+    """Source file digests keyed by path and validated by (size, mtime_ns, inode).
+
+    Lets repeat syncs skip re-hashing source files that have not been touched; any stat
+    change re-hashes the file.
+    """
+
+    def __init__(self, path: Path, entries: dict[str, list[Any]] | None = None) -> None:
+        self.path = path
+        self.entries: dict[str, list[Any]] = entries or {}
+        self.hashed = 0
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> SourceDigestCache:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path)
+        if not isinstance(data, dict) or data.get("version") != SYNC_MANIFEST_VERSION:
+            return cls(path)
+        entries = data.get("entries")
+        return cls(path, entries if isinstance(entries, dict) else {})
+
+    def digest(self, path: Path) -> dict[str, Any]:
+        stat = path.stat()
+        key = str(path.resolve())
+        signature = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        cached = self.entries.get(key)
+        if cached is not None and cached[:3] == signature:
+            return {"sha256": cached[3], "size": stat.st_size}
+        result = file_digest(path)
+        self.hashed += 1
+        self.entries[key] = [*signature, result["sha256"]]
+        self._dirty = True
+        return result
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        payload = {"version": SYNC_MANIFEST_VERSION, "entries": self.entries}
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+def source_file_digests(entry: SkillEntry, digest_cache: SourceDigestCache | None = None) -> dict[str, dict[str, Any]]:
+    """Digest every file in the skill directory once per run; later calls reuse the result."""
+    if entry.source_files is None:
+        files: dict[str, dict[str, Any]] = {}
+        for path in _walk_files(entry.source_dir):
+            rel = path.relative_to(entry.source_dir).as_posix()
+            files[rel] = digest_cache.digest(path) if digest_cache is not None else file_digest(path)
+        entry.source_files = files
+    return entry.source_files
+
+
+def load_sync_manifest(target_root: Path) -> dict[str, Any]:
+    """Per-skill records from the target's sync manifest, or ``{}`` if it is missing or unreadable."""
+    try:
+        data = json.loads((target_root / SYNC_MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != SYNC_MANIFEST_VERSION:
+        return {}
+    skills = data.get("skills")
+    return skills if isinstance(skills, dict) else {}
+
+
+@PROFILER.timed("sync.manifest")
+def write_sync_manifest(target_root: Path, records: dict[str, Any], dry_run: bool) -> Path:
+    manifest_path = target_root / SYNC_MANIFEST_NAME
+    if dry_run:
+        print(f"- would write sync manifest: {manifest_path}")
+        return manifest_path
+    target_root.mkdir(parents=True, exist_ok=True)
+    payload = {"version": SYNC_MANIFEST_VERSION, "skills": {key: records[key] for key in sorted(records)}}
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, manifest_path)
+    return manifest_path
+
+
+def _target_file_digests(target_dir: Path) -> dict[str, dict[str, Any]]:
+    return {path.relative_to(target_dir).as_posix(): file_digest(path) for path in _walk_files(target_dir)}
+
+
+def _links_to_source(entry: SkillEntry, target_dir: Path) -> bool:
+    if not target_dir.is_symlink():
+        return False
+    try:
+        return target_dir.resolve() == entry.source_dir.resolve()
+    except OSError:
         return False
-    return source_skill_md.read_text(encoding="utf-8") == target_skill_md.read_text(encoding="utf-8")
 
 
-def build_sync_plan(entries: list[SkillEntry], target_root: Path, only_ids: list[str] | None = None, prune: bool = False) -> SyncPlan:
+def _target_matches_source(
+    entry: SkillEntry,
+    target_dir: Path,
+    manifest: dict[str, Any],
+    digest_cache: SourceDigestCache | None,
+) -> tuple[bool, bool]:
+    """Return ``(unchanged, decided_without_reading_target)`` for an existing target directory."""
+    if _links_to_source(entry, target_dir):
+        # A symlink into the source tree always shows current content.
+        return True, True
+    source_files = source_file_digests(entry, digest_cache)
+    record = manifest.get(entry.skill_id)
+    if isinstance(record, dict) and isinstance(record.get("files"), dict):
+        return record["files"] == source_files, True
+    # No manifest record (first sync with this tool, or a hand-made target): compare the whole directory.
+    return _target_file_digests(target_dir) == source_files, False
+
+
+@PROFILER.timed("sync.plan")
+def build_sync_plan(
+    entries: list[SkillEntry],
+    target_root: Path,
+    only_ids: list[str] | None = None,
+    prune: bool = False,
+    digest_cache: SourceDigestCache | None = None,
+    verify_target: bool = False,
+) -> SyncPlan:
+    """Classify skills as create/update/unchanged against ``target_root``.
+
+    Existing targets are compared by the hashes recorded in the target's sync manifest, so
+    an unchanged sync never reads target files. ``verify_target`` ignores the manifest and
+    hashes every target directory instead, catching hand edits made inside the target.
+    """
     selected = [e for e in entries if not only_ids or e.skill_id in set(only_ids)]
     target_map = _load_target_skill_map(target_root)
+    manifest = load_sync_manifest(target_root)
 
     create: list[SkillEntry] = []
     update: list[SkillEntry] = []
     unchanged: list[SkillEntry] = []
+    manifest_hits = 0
     for entry in selected:
         target_dir = target_root / entry.skill_id
-        target_skill_md = target_dir / "SKILL.md"
         if not target_dir.exists():
             create.append(entry)
-        elif _same_skill_content(entry.source_skill_md, target_skill_md):
-            unchanged.append(entry)
-        else:
-            update.append(entry)
+            continue
+        same, from_manifest = _target_matches_source(
+            entry,
+            target_dir,
+            {} if verify_target else manifest,
+            digest_cache,
+        )
+        manifest_hits += int(from_manifest)
+        (unchanged if same else update).append(entry)
 
     would_prune: list[Path] = []
     if prune and not only_ids:
@@ -140,7 +427,14 @@ def build_sync_plan(entries: list[SkillEntry], target_root: Path, only_ids: list
             if skill_id not in source_ids:
                 would_prune.append(path)
 
-    return SyncPlan(create=create, update=update, unchanged=unchanged, would_prune=sorted(would_prune))
+    return SyncPlan(
+        create=create,
+        update=update,
+        unchanged=unchanged,
+        would_prune=sorted(would_prune),
+        manifest=manifest,
+        manifest_hits=manifest_hits,
+    )
 
 
 def print_sync_plan(plan: SyncPlan) -> None:
@@ -167,18 +461,18 @@ def default_backup_dir(target_root: Path) -> Path:
     return target_root.parent / f"skills-backups-{_timestamp()}"
 
 
-def _backup_existing_skill_md(target_dir: Path, backup_dir: Path, dry_run: bool) -> None:
+@PROFILER.timed("sync.backup")
+def _backup_existing_skill_md(target_dir: Path, backup: DirectoryBackup | BackupRun, dry_run: bool) -> None:
     skill_md = target_dir / "SKILL.md"
     if not skill_md.exists():
         return
-    backup_path = backup_dir / target_dir.name / "SKILL.md"
     if dry_run:
-        print(f"- would backup: {skill_md} -> {backup_path}")
+        print(f"- would backup: {skill_md} -> {backup.destination(target_dir.name, 'SKILL.md')}")
         return
-    backup_path.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(skill_md, backup_path)
+    backup.save(target_dir.name, "SKILL.md", skill_md)
 
 
+@PROFILER.timed("sync.remove")
 def _remove_target(target_dir: Path, dry_run: bool) -> None:
     if not target_dir.exists() and not target_dir.is_symlink():
         return
@@ -191,72 +485,594 @@ def _remove_target(target_dir: Path, dry_run: bool) -> None:
         shutil.rmtree(target_dir)
 
 
-def _sync_one(entry: SkillEntry, target_root: Path, strategy: str, backup_dir: Path, dry_run: bool) -> None:
+SYNC_STRATEGIES = ("copy", "symlink", "delta", "hardlink", "reflink")
+
+# linux/fs.h: _IOW(0x94, 9, int). Clones a whole file as copy-on-write extents (btrfs, XFS, bcachefs).
+FICLONE = 0x40049409
+
+# Errors meaning "this filesystem pair cannot link/clone"; anything else is a real failure.
+_LINK_FALLBACK_ERRNOS = frozenset(
+    code
+    for code in (
+        errno.EXDEV,
+        errno.EPERM,
+        errno.EMLINK,
+        errno.EINVAL,
+        errno.ENOTTY,
+        errno.EOPNOTSUPP,
+        getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+        getattr(errno, "ENOSYS", errno.EOPNOTSUPP),
+    )
+)
+
+
+def _hardlink_file(source: str, destination: str, fallback_copies: list[str]) -> str:
+    try:
+        os.link(source, destination)
+    except OSError as exc:
+        if exc.errno not in _LINK_FALLBACK_ERRNOS:
+            raise
+        fallback_copies.append(destination)
+        shutil.copy2(source, destination)
+    return destination
+
+
+def _reflink_file(source: str, destination: str, fallback_copies: list[str]) -> str:
+    if fcntl is None:
+        fallback_copies.append(destination)
+        return shutil.copy2(source, destination)
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    except OSError as exc:
+        if exc.errno not in _LINK_FALLBACK_ERRNOS:
+            raise
+        fallback_copies.append(destination)
+        return shutil.copy2(source, destination)
+    shutil.copystat(source, destination)
+    return destination
+
+
+def _atomic_copy_file(source: Path, destination: Path) -> None:
+    """Copy ``source`` over ``destination`` via a sibling temp file and rename.
+
+    Readers see either the old or the new file, never a partial write.
+    """
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = destination.with_name(f".{destination.name}.skills-sync.tmp")
+    try:
+        shutil.copy2(source, tmp_path)
+        os.replace(tmp_path, destination)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _delta_changes(
+    entry: SkillEntry,
+    target_dir: Path,
+    digest_cache: SourceDigestCache | None,
+) -> tuple[list[str], list[str]]:
+    """Return ``(changed_or_new, removed)`` relative paths between a skill and its target copy.
+
+    Target files are only hashed when their size matches the source; a size mismatch is
+    already a change.
+    """
+    source_files = source_file_digests(entry, digest_cache)
+    changed: list[str] = []
+    for rel, digest in source_files.items():
+        target_file = target_dir / rel
+        if target_file.is_symlink() or not target_file.is_file():
+            changed.append(rel)
+        elif target_file.stat().st_size != digest["size"] or file_digest(target_file)["sha256"] != digest["sha256"]:
+            changed.append(rel)
+    removed: list[str] = []
+    if target_dir.is_dir():
+        removed = [
+            rel
+            for rel in (path.relative_to(target_dir).as_posix() for path in _walk_files(target_dir))
+            if rel not in source_files
+        ]
+    return changed, removed
+
+
+def _sync_delta(
+    entry: SkillEntry,
+    target_dir: Path,
+    backup: DirectoryBackup | BackupRun,
+    dry_run: bool,
+    digest_cache: SourceDigestCache | None,
+) -> None:
+    """Bring ``target_dir`` in line with the source by rewriting only changed files.
+
+    Unchanged files keep their inode and mtime, so watchers of the target see no churn.
+    """
+    if target_dir.is_symlink() or (target_dir.exists() and not target_dir.is_dir()):
+        # A symlinked or stray target cannot be patched in place; start from an empty directory.
+        _remove_target(target_dir, dry_run)
+    changed, removed = _delta_changes(entry, target_dir, digest_cache)
+    if "SKILL.md" in changed or "SKILL.md" in removed:
+        _backup_existing_skill_md(target_dir, backup, dry_run)
+    if dry_run:
+        print(
+            f"- would delta: {entry.source_dir} -> {target_dir} "
+            f"({len(changed)} file(s) to write, {len(removed)} to remove)"
+        )
+        return
+
+    with PROFILER.phase("sync.delta"):
+        for rel in changed:
+            destination = target_dir / rel
+            if destination.is_dir() and not destination.is_symlink():
+                shutil.rmtree(destination)
+            _atomic_copy_file(entry.source_dir / rel, destination)
+        for rel in removed:
+            (target_dir / rel).unlink(missing_ok=True)
+        # Drop directories emptied by removals, deepest first.
+        for dirpath, _dirnames, _filenames in sorted(os.walk(target_dir), key=lambda item: -len(item[0])):
+            path = Path(dirpath)
+            if path != target_dir and not any(path.iterdir()):
+                path.rmdir()
+
+
+def _sync_one(
+    entry: SkillEntry,
+    target_root: Path,
+    strategy: str,
+    backup: DirectoryBackup | BackupRun,
+    dry_run: bool,
+    digest_cache: SourceDigestCache | None = None,
+    fallback_copies: list[str] | None = None,
+) -> None:
+    """Replace ``target_root/<skill_id>`` with the source skill using ``strategy``.
+
+    ``hardlink`` and ``reflink`` copy file by file where the filesystem cannot link or
+    clone (another device, no CoW support); those paths are appended to ``fallback_copies``.
+    """
     target_dir = target_root / entry.skill_id
+    if strategy == "delta":
+        _sync_delta(entry, target_dir, backup, dry_run, digest_cache)
+        return
     if target_dir.exists() or target_dir.is_symlink():
-        _backup_existing_skill_md(target_dir, backup_dir, dry_run)
+        _backup_existing_skill_md(target_dir, backup, dry_run)
         _remove_target(target_dir, dry_run)
 
     if dry_run:
         print(f"- would {strategy}: {entry.source_dir} -> {target_dir}")
         return
 
-    target_root.mkdir(parents=True, exist_ok=True)
-    if strategy == "copy":
-        shutil.copytree(entry.source_dir, target_dir)
-    elif strategy == "symlink":
-        target_dir.symlink_to(entry.source_dir.resolve(), target_is_directory=True)
-    else:
-        raise ValueError(f"Unknown strategy: {strategy}")
+    with PROFILER.phase(f"sync.{strategy}"):
+        if strategy in {"copy", "hardlink", "reflink"}:
+            copy_function: Callable[[str, str], Any] = shutil.copy2
+            if strategy != "copy":
+                link_file = _hardlink_file if strategy == "hardlink" else _reflink_file
+                copy_function = partial(link_file, fallback_copies=[] if fallback_copies is None else fallback_copies)
+            try:
+                shutil.copytree(entry.source_dir, target_dir, copy_function=copy_function)
+            except BaseException:
+                # copytree finishes what it can before raising; never leave a half-copied skill behind.
+                shutil.rmtree(target_dir, ignore_errors=True)
+                raise
+        elif strategy == "symlink":
+            target_dir.symlink_to(entry.source_dir.resolve(), target_is_directory=True)
+        else:
+            raise ValueError(f"Unknown strategy: {strategy}")
 
 
-def _prune_targets(paths: list[Path], backup_dir: Path, dry_run: bool) -> None:
-    for path in paths:
-        _backup_existing_skill_md(path, backup_dir, dry_run)
-        _remove_target(path, dry_run)
+def _prune_target(path: Path, backup: DirectoryBackup | BackupRun, dry_run: bool) -> None:
+    _backup_existing_skill_md(path, backup, dry_run)
+    _remove_target(path, dry_run)
 
 
-def write_target_index(entries: list[SkillEntry], target_root: Path, dry_run: bool) -> Path:
-    index_path = target_root / "INDEX.md"
-    by_category: dict[str, list[SkillEntry]] = {}
+def _index_fragment(category: str, entries: list[SkillEntry]) -> str:
+    lines = [f"## {category}"]
     for entry in entries:
-        by_category.setdefault(entry.category, []).append(entry)
-    lines = ["# Skill Index", ""]
-    for category in sorted(by_category):
-        lines.append(f"## {category}")
-        for entry in sorted(by_category[category], key=lambda e: e.skill_id):
-            desc = entry.description or "(missing description)"
-            lines.append(f"- `{entry.skill_id}`: {desc}")
-        lines.append("")
+        lines.append(f"- `{entry.skill_id}`: {entry.description or '(missing description)'}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+@PROFILER.timed("sync.index")
+def write_target_index(
+    entries: list[SkillEntry],
+    target_root: Path,
+    dry_run: bool,
+    fragment_cache: FragmentCache | None = None,
+) -> Path:
+    index_path = target_root / "INDEX.md"
     if dry_run:
         print(f"- would write index: {index_path}")
         return index_path
-    target_root.mkdir(parents=True, exist_ok=True)
-    index_path.write_text("\n".join(lines), encoding="utf-8")
+    cache = fragment_cache or FragmentCache.load(target_root / INDEX_FRAGMENT_CACHE_NAME, "index")
+    cache.rendered = cache.reused = 0
+    by_category = _group_by_category(entries)
+    fragments = [
+        cache.fragment(
+            category,
+            [[e.skill_id, e.description] for e in group],
+            partial(_index_fragment, category, group),
+        )
+        for category, group in by_category.items()
+    ]
+    cache.retain(by_category)
+    cache.last_write_skipped = not write_text_if_changed(index_path, "\n".join(["# Skill Index", "", *fragments]))
+    cache.save()
     return index_path
 
 
-def run_validate_and_lint_for_sync(skills_root: Path, repo_root: Path, reports_dir: Path) -> tuple[list[SkillEntry], list[dict[str, Any]]]:
-    docs = validate_skills(skills_root, repo_root)
-    if validation_failed(docs):
+def run_validate_and_lint_for_sync(
+    skills_root: Path,
+    repo_root: Path,
+    reports_dir: Path,
+    corpus: SkillCorpus | None = None,
+) -> tuple[list[SkillEntry], list[dict[str, Any]]]:
+    if corpus is None or not corpus.validated:
+        corpus = load_skill_corpus(skills_root, repo_root)
+    if validation_failed(corpus.documents):
         raise RuntimeError("Validation failed; refusing to sync")
-    lint_results = lint_skills(skills_root, repo_root)
+    lint_results = corpus.lint_results if corpus.lint_results is not None else lint_documents(corpus.documents)
     write_lint_reports(lint_results, reports_dir, repo_root=repo_root)
-    entries = collect_skill_entries(skills_root)
+    entries = collect_skill_entries(skills_root, corpus=corpus)
     return entries, lint_results
 
 
+@dataclass
+class SyncOpResult:
+    skill_id: str
+    action: str
+    status: str
+    seconds: float = 0.0
+    error: str | None = None
+
+
+@dataclass
+class SyncSummary:
+    results: list[SyncOpResult]
+    seconds: float = 0.0
+    fallback_copies: int = 0
+    # Transactional runs only: the staged tree was discarded and the target left untouched.
+    rolled_back: bool = False
+
+    def count(self, status: str, action: str | None = None) -> int:
+        return sum(1 for r in self.results if r.status == status and (action is None or r.action == action))
+
+    @property
+    def failed(self) -> bool:
+        return self.count("failed") > 0
+
+    def format(self) -> str:
+        return (
+            f"Sync summary: created {self.count('ok', 'create')}, updated {self.count('ok', 'update')}, "
+            f"pruned {self.count('ok', 'prune')}, failed {self.count('failed')}, skipped {self.count('skipped')} "
+            f"({self.seconds:.2f}s)"
+            + (f"; {self.fallback_copies} file(s) copied instead of linked" if self.fallback_copies else "")
+        )
+
+
+def _run_sync_ops(
+    ops: list[tuple[str, str, Callable[[], None]]],
+    jobs: int,
+    fail_fast: bool,
+    progress: bool,
+) -> list[SyncOpResult]:
+    """Run independent per-skill operations on a thread pool; report progress in submission order.
+
+    With ``fail_fast`` the first failure stops operations that have not started yet (they are
+    reported as ``skipped``); operations already running are allowed to finish.
+    """
+    stop = threading.Event()
+
+    def run_op(skill_id: str, action: str, func: Callable[[], None]) -> SyncOpResult:
+        if stop.is_set():
+            return SyncOpResult(skill_id, action, "skipped")
+        started = time.perf_counter()
+        try:
+            func()
+        except Exception as exc:  # noqa: BLE001 - surfaced per skill in the summary
+            if fail_fast:
+                stop.set()
+            return SyncOpResult(skill_id, action, "failed", time.perf_counter() - started, f"{type(exc).__name__}: {exc}")
+        return SyncOpResult(skill_id, action, "ok", time.perf_counter() - started)
+
+    results: list[SyncOpResult] = []
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = [pool.submit(run_op, skill_id, action, func) for skill_id, action, func in ops]
+        for idx, future in enumerate(futures, start=1):
+            result = future.result()
+            results.append(result)
+            if not progress:
+                continue
+            if result.status == "failed":
+                print(f"[{idx}/{len(ops)}] FAILED {result.action} {result.skill_id}: {result.error}", flush=True)
+            elif result.status == "skipped":
+                print(f"[{idx}/{len(ops)}] skipped {result.action} {result.skill_id} (stopped after failure)", flush=True)
+            else:
+                print(f"[{idx}/{len(ops)}] {result.action} {result.skill_id} ({result.seconds * 1000:.0f} ms)", flush=True)
+    return results
+
+
 def apply_sync(
     entries: list[SkillEntry],
     plan: SyncPlan,
     target_root: Path,
     strategy: str,
-    backup_dir: Path,
+    backup: Path | DirectoryBackup | BackupRun,
     prune: bool,
     dry_run: bool,
-) -> None:
-    for entry in plan.create + plan.update:
-        _sync_one(entry, target_root=target_root, strategy=strategy, backup_dir=backup_dir, dry_run=dry_run)
-    if prune and plan.would_prune:
-        _prune_targets(plan.would_prune, backup_dir=backup_dir, dry_run=dry_run)
-    write_target_index([*plan.create, *plan.update, *plan.unchanged], target_root=target_root, dry_run=dry_run)
+    digest_cache: SourceDigestCache | None = None,
+    jobs: int = 1,
+    fail_fast: bool = True,
+    index_entries: list[SkillEntry] | None = None,
+) -> SyncSummary:
+    """Apply ``plan``; per-skill create/update/prune operations run on ``jobs`` threads.
+
+    The index and manifest are written afterwards from what actually succeeded, so a
+    partial run leaves the manifest consistent with the target. ``index_entries`` lists
+    every skill ``INDEX.md`` should cover when ``plan`` only covers a subset (watch mode).
+    """
+    started = time.perf_counter()
+    if isinstance(backup, Path):
+        backup = DirectoryBackup(backup)
+    fallback_copies: list[str] = []
+    ops: list[tuple[str, str, Callable[[], None]]] = []
+    for action, group in [("create", plan.create), ("update", plan.update)]:
+        for entry in group:
+            ops.append(
+                (
+                    entry.skill_id,
+                    action,
+                    partial(_sync_one, entry, target_root, strategy, backup, dry_run, digest_cache, fallback_copies),
+                )
+            )
+    if prune:
+        for path in plan.would_prune:
+            ops.append((path.name, "prune", partial(_prune_target, path, backup, dry_run)))
+    if ops and not dry_run:
+        target_root.mkdir(parents=True, exist_ok=True)
+    # Dry-run output is a readable plan, so it stays serial and unnumbered.
+    results = _run_sync_ops(ops, jobs=1 if dry_run else jobs, fail_fast=fail_fast, progress=not dry_run)
+
+    failed_ids = {r.skill_id for r in results if r.status == "failed"}
+    skipped_ids = {r.skill_id for r in results if r.status == "skipped"}
+    synced = [*plan.create, *plan.update, *plan.unchanged]
+    indexed = synced if index_entries is None else index_entries
+    write_target_index(
+        [e for e in indexed if dry_run or (target_root / e.skill_id).exists()],
+        target_root=target_root,
+        dry_run=dry_run,
+    )
+    current = [
+        e
+        for e in synced
+        if (dry_run or (target_root / e.skill_id).exists()) and e.skill_id not in failed_ids | skipped_ids
+    ]
+    records = _manifest_records(plan, current, target_root, digest_cache, dropped=failed_ids)
+    write_sync_manifest(target_root, records, dry_run=dry_run)
+    return SyncSummary(results=results, seconds=time.perf_counter() - started, fallback_copies=len(fallback_copies))
+
+
+def _manifest_records(
+    plan: SyncPlan,
+    synced: list[SkillEntry],
+    target_root: Path,
+    digest_cache: SourceDigestCache | None,
+    dropped: set[str] | None = None,
+) -> dict[str, Any]:
+    # Start from the previous manifest so skills outside an --only selection (or skipped after a
+    # failure) keep their records; failed skills lose theirs so the next plan re-hashes them.
+    records = dict(plan.manifest)
+    for path in plan.would_prune:
+        if not path.exists():
+            records.pop(path.name, None)
+    for skill_id in dropped or ():
+        records.pop(skill_id, None)
+    for entry in synced:
+        records[entry.skill_id] = {
+            "source_dir": str(entry.source_dir.resolve()),
+            "strategy": "symlink" if (target_root / entry.skill_id).is_symlink() else "copy",
+            "files": source_file_digests(entry, digest_cache),
+        }
+    return records
+
+
+SYNC_JOURNAL_VERSION = 1
+_AT_FDCWD = -100
+_RENAME_EXCHANGE = 2
+
+
+def _transaction_paths(target_root: Path) -> tuple[Path, Path, Path]:
+    """Return ``(staging, previous, journal)`` siblings of ``target_root`` (same filesystem)."""
+    parent, name = target_root.parent, target_root.name
+    return (
+        parent / f".{name}.skills-sync-staging",
+        parent / f".{name}.skills-sync-previous",
+        parent / f".{name}.skills-sync-journal.json",
+    )
+
+
+def _write_journal(journal: Path, payload: dict[str, Any]) -> None:
+    tmp_path = journal.with_name(journal.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as handle:
+        handle.write(json.dumps({"version": SYNC_JOURNAL_VERSION, **payload}, indent=2) + "\n")
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, journal)
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _exchange_paths(first: Path, second: Path) -> bool:
+    """Atomically swap two paths with ``renameat2(RENAME_EXCHANGE)``; False where unsupported."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return False
+    result = renameat2(_AT_FDCWD, os.fsencode(first), _AT_FDCWD, os.fsencode(second), _RENAME_EXCHANGE)
+    if result == 0:
+        return True
+    code = ctypes.get_errno()
+    if code in _LINK_FALLBACK_ERRNOS:
+        return False
+    raise OSError(code, os.strerror(code), str(first))
+
+
+def _same_directory(path: Path, identity: list[int]) -> bool:
+    try:
+        stat = path.lstat()
+    except FileNotFoundError:
+        return False
+    return [stat.st_dev, stat.st_ino] == identity
+
+
+def recover_sync_transaction(target_root: Path) -> str | None:
+    """Finish or roll back a transactional sync that was interrupted; return what was done.
+
+    A run interrupted while staging is rolled back (the target was never touched). A run
+    interrupted mid-swap is completed if the staged tree is intact, otherwise the previous
+    tree is put back. Raises ``RuntimeError`` if the journal belongs to a live process.
+    """
+    if target_root.is_symlink():
+        target_root = target_root.resolve()
+    staging, previous, journal = _transaction_paths(target_root)
+    try:
+        data = json.loads(journal.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        data = {}
+    pid = data.get("pid")
+    if isinstance(pid, int) and pid != os.getpid() and _pid_alive(pid):
+        raise RuntimeError(f"Another transactional sync (pid {pid}) is in progress on {target_root}")
+
+    staged_identity = data.get("staging_identity")
+    if data.get("phase") == "swapping" and isinstance(staged_identity, list):
+        if _same_directory(target_root, staged_identity):
+            outcome = "completed the interrupted swap"
+        elif not target_root.exists() and _same_directory(staging, staged_identity):
+            os.rename(staging, target_root)
+            outcome = "completed the interrupted swap"
+        elif not target_root.exists() and previous.exists():
+            os.rename(previous, target_root)
+            outcome = "restored the previous target"
+        else:
+            outcome = "rolled back (the staged tree was never swapped in)"
+    else:
+        outcome = "rolled back (the target was never touched)"
+    for leftover in (staging, previous):
+        if leftover.exists() or leftover.is_symlink():
+            _remove_target(leftover, dry_run=False)
+    journal.unlink(missing_ok=True)
+    return f"Recovered interrupted transactional sync of {target_root}: {outcome}"
+
+
+@PROFILER.timed("sync.stage")
+def _stage_target(target_root: Path, staging: Path) -> None:
+    """Mirror the current target into ``staging`` cheaply.
+
+    Skill directories are rebuilt from hard links (no data copied); top-level files such
+    as ``INDEX.md`` are small and copied so they can never be rewritten through a shared
+    inode. Strategies then replace files in ``staging`` without touching the live target.
+    """
+    staging.mkdir(parents=True)
+    if not target_root.exists():
+        return
+    link_file = partial(_hardlink_file, fallback_copies=[])
+    for child in sorted(target_root.iterdir()):
+        destination = staging / child.name
+        if child.is_symlink():
+            os.symlink(os.readlink(child), destination)
+        elif child.is_dir():
+            shutil.copytree(child, destination, symlinks=True, copy_function=link_file)
+        else:
+            shutil.copy2(child, destination)
+
+
+def apply_sync_transactional(
+    entries: list[SkillEntry],
+    plan: SyncPlan,
+    target_root: Path,
+    strategy: str,
+    backup: Path | DirectoryBackup | BackupRun,
+    prune: bool,
+    digest_cache: SourceDigestCache | None = None,
+    jobs: int = 1,
+    index_entries: list[SkillEntry] | None = None,
+) -> SyncSummary:
+    """Apply ``plan`` to a staged copy of ``target_root`` and swap it in atomically.
+
+    Readers see either the old tree or the new one, never a mix. Any failed operation
+    discards the staging tree and leaves the target untouched. A journal next to the
+    target records progress so ``recover_sync_transaction`` can finish or undo a run
+    that was killed.
+    """
+    if target_root.is_symlink():
+        target_root = target_root.resolve()
+    staging, previous, journal = _transaction_paths(target_root)
+    recovered = recover_sync_transaction(target_root)
+    if recovered:
+        print(recovered)
+    if staging.exists() or staging.is_symlink():
+        # Left behind without a journal (e.g. a crash while discarding a failed run).
+        _remove_target(staging, dry_run=False)
+    target_root.parent.mkdir(parents=True, exist_ok=True)
+
+    journal_payload: dict[str, Any] = {
+        "pid": os.getpid(),
+        "target": str(target_root),
+        "started": dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds"),
+        "phase": "staging",
+    }
+    _write_journal(journal, journal_payload)
+    try:
+        _stage_target(target_root, staging)
+        staged_plan = replace(plan, would_prune=[staging / path.name for path in plan.would_prune])
+        summary = apply_sync(
+            entries,
+            staged_plan,
+            staging,
+            strategy,
+            backup,
+            prune,
+            dry_run=False,
+            digest_cache=digest_cache,
+            jobs=jobs,
+            fail_fast=True,
+            index_entries=index_entries,
+        )
+    except BaseException:
+        _remove_target(staging, dry_run=False)
+        journal.unlink(missing_ok=True)
+        raise
+    if summary.failed:
+        _remove_target(staging, dry_run=False)
+        journal.unlink(missing_ok=True)
+        summary.rolled_back = True
+        return summary
+
+    with PROFILER.phase("sync.swap"):
+        stat = staging.lstat()
+        _write_journal(journal, {**journal_payload, "phase": "swapping", "staging_identity": [stat.st_dev, stat.st_ino]})
+        if not target_root.exists():
+            os.rename(staging, target_root)
+        elif _exchange_paths(staging, target_root):
+            # staging now holds the old tree.
+            _remove_target(staging, dry_run=False)
+        else:
+            # No atomic exchange here: two renames, with the journal covering the gap between them.
+            os.rename(target_root, previous)
+            os.rename(staging, target_root)
+            _remove_target(previous, dry_run=False)
+        journal.unlink(missing_ok=True)
+    return summary
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import ctypes
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+
+# linux/inotify.h
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Editor swap/backup files and our own temp files never trigger a rebuild.
+_IGNORED_SUFFIXES = (".swp", ".swx", ".tmp", "~")
+
+
+def is_relevant_path(path: Path) -> bool:
+    name = path.name
+    return not name.startswith(".") and not name.endswith(_IGNORED_SUFFIXES)
+
+
+def add_watch_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After the first run, keep watching the skills root and redo only the skills that change.",
+    )
+    parser.add_argument(
+        "--debounce-ms",
+        type=int,
+        default=200,
+        metavar="MS",
+        help="With --watch: wait for MS milliseconds without further changes before rebuilding (default: 200).",
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="With --watch: poll file stats instead of using inotify.",
+    )
+    parser.add_argument(
+        "--max-cycles",
+        type=int,
+        metavar="N",
+        help="With --watch: exit after N rebuilds (for scripts and tests).",
+    )
+
+
+class _InotifyBackend:
+    """Recursive inotify watch on Linux through libc, without third-party packages."""
+
+    name = "inotify"
+
+    def __init__(self, root: Path) -> None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code))
+        self.fd = fd
+        self.root = root
+        self.watches: dict[int, Path] = {}
+        self._watch_tree(root)
+
+    def _watch_tree(self, directory: Path) -> list[Path]:
+        """Watch ``directory`` and its subdirectories; return files already inside it."""
+        found: list[Path] = []
+        for dirpath, dirnames, filenames in os.walk(directory):
+            wd = self._add_watch(self.fd, os.fsencode(dirpath), _WATCH_MASK)
+            if wd >= 0:
+                self.watches[wd] = Path(dirpath)
+            dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+            found.extend(Path(dirpath) / name for name in filenames)
+        return found
+
+    def poll(self, timeout: float) -> tuple[set[Path], bool]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set(), False
+        try:
+            data = os.read(self.fd, 1 << 16)
+        except BlockingIOError:
+            return set(), False
+        changed: set[Path] = set()
+        overflow = False
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            directory = self.watches.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            path = directory / os.fsdecode(raw_name) if raw_name else directory
+            changed.add(path)
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) and path.is_dir():
+                # Files can land in a new directory before its watch exists; report them now.
+                changed.update(self._watch_tree(path))
+        return changed, overflow
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class _PollingBackend:
+    """Portable fallback: compare (mtime_ns, size, inode) snapshots of every file."""
+
+    name = "polling"
+
+    def __init__(self, root: Path, interval: float) -> None:
+        self.root = root
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int, int]]:
+        snapshot: dict[Path, tuple[int, int, int]] = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+            for name in filenames:
+                path = Path(dirpath) / name
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        return snapshot
+
+    def poll(self, timeout: float) -> tuple[set[Path], bool]:
+        time.sleep(min(timeout, self.interval))
+        current = self._scan()
+        previous, self.snapshot = self.snapshot, current
+        changed = {path for path in previous.keys() | current.keys() if previous.get(path) != current.get(path)}
+        return changed, False
+
+    def close(self) -> None:
+        return None
+
+
+class SkillTreeWatcher:
+    """Report files that change under a skills root, preferring inotify over polling."""
+
+    def __init__(self, root: Path, force_poll: bool = False, poll_interval: float = 0.25) -> None:
+        self.root = root
+        backend: _InotifyBackend | _PollingBackend | None = None
+        if not force_poll and sys.platform.startswith("linux"):
+            try:
+                backend = _InotifyBackend(root)
+            except (OSError, AttributeError):
+                backend = None
+        self.backend = backend or _PollingBackend(root, poll_interval)
+
+    def wait(self, debounce: float, timeout: float = 1.0) -> tuple[set[Path], bool]:
+        """Block until something changes, then until ``debounce`` seconds pass with no change.
+
+        Returns ``(changed_paths, rescan_everything)``; the second item is set when the
+        kernel dropped events and the change set is incomplete.
+        """
+        changed: set[Path] = set()
+        rescan = False
+        while not changed and not rescan:
+            batch, overflow = self.backend.poll(timeout)
+            changed.update(path for path in batch if is_relevant_path(path))
+            rescan = rescan or overflow
+        while True:
+            batch, overflow = self.backend.poll(debounce)
+            relevant = {path for path in batch if is_relevant_path(path)}
+            rescan = rescan or overflow
+            if not relevant and not overflow:
+                return changed, rescan
+            changed.update(relevant)
+
+    def close(self) -> None:
+        self.backend.close()
+
+
+def affected_skill_dirs(changed: set[Path], known_dirs: set[Path], skills_root: Path) -> set[Path]:
+    """Map changed file paths to the skill directories that contain (or contained) them."""
+    affected: set[Path] = set()
+    for path in changed:
+        # A removed or renamed directory takes every skill below it along.
+        affected.update(known for known in known_dirs if known == path or path in known.parents)
+        for candidate in [path, *path.parents]:
+            if candidate == skills_root or skills_root not in candidate.parents:
+                break
+            if candidate in known_dirs or (candidate / "SKILL.md").is_file():
+                affected.add(candidate)
+                break
+    return affected
+
+
+def run_watch_loop(
+    skills_root: Path,
+    on_change: Callable[[set[Path], bool], None],
+    *,
+    debounce_ms: int,
+    force_poll: bool,
+    max_cycles: int | None,
+) -> int:
+    """Call ``on_change(changed_paths, rescan_everything)`` after each debounced burst of edits.
+
+    An exception inside one cycle is reported and the session keeps watching; the next
+    cycle is a full rescan so whatever the failed batch left half-done is picked up again.
+    """
+    watcher = SkillTreeWatcher(skills_root, force_poll=force_poll)
+    print(f"Watching {skills_root} ({watcher.backend.name}); press Ctrl-C to stop", flush=True)
+    cycles = 0
+    retry_rescan = False
+    try:
+        while max_cycles is None or cycles < max_cycles:
+            changed, rescan = watcher.wait(debounce=max(debounce_ms, 0) / 1000)
+            try:
+                on_change(changed, rescan or retry_rescan)
+                retry_rescan = False
+            except Exception as exc:
+                print(f"[watch] ERROR: {type(exc).__name__}: {exc}; still watching", flush=True)
+                retry_rescan = True
+            cycles += 1
+    except KeyboardInterrupt:
+        print("Stopped watching")
+    finally:
+        watcher.close()
+    return 0
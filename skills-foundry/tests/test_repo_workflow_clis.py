@@ -1,5 +1,8 @@
 from pathlib import Path
+import json
+import signal
 import subprocess
+import time
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -387,3 +390,335 @@ def test_repo_helper_stage1_plan_execute_timeout_writes_run_log(tmp_path: Path)
     log_text = run_log.read_text(encoding="utf-8")
     assert "timed_out" in log_text
     assert "Timed out after 0.05 second(s)" in log_text
+
+
+def test_repo_helper_stage1_plan_execute_parallel_runs_independent_prompts_and_skips_failed_chain(tmp_path: Path) -> None:
+    repo_root = _make_prompt_repo(tmp_path)
+    prompts_dir = repo_root / ".prompts"
+    (prompts_dir / "PROMPT_01.txt").write_text("Depends-On: none\nTask 1\n", encoding="utf-8")
+    (prompts_dir / "PROMPT_02.txt").write_text("# Depends-On: PROMPT_00_s\nTask 2\n", encoding="utf-8")
+    (repo_root / "deps.json").write_text('{"PROMPT_03.txt": ["01"]}', encoding="utf-8")
+    # PROMPT_01 and PROMPT_02 each wait for the other's marker, so they only pass when run concurrently.
+    runner = repo_root / "runner.py"
+    runner.write_text(
+        "import os, sys, time\n"
+        "name = os.path.basename(sys.argv[1])\n"
+        "open(os.path.join('markers', name), 'w').close()\n"
+        "other = {'PROMPT_01.txt': 'PROMPT_02.txt', 'PROMPT_02.txt': 'PROMPT_01.txt'}.get(name)\n"
+        "deadline = time.time() + 5\n"
+        "while other and not os.path.exists(os.path.join('markers', other)) and time.time() < deadline:\n"
+        "    time.sleep(0.02)\n"
+        "if other and not os.path.exists(os.path.join('markers', other)):\n"
+        "    raise SystemExit(9)\n"
+        "print('RAN', name)\n"
+        "raise SystemExit(5 if name == 'PROMPT_01.txt' else 0)\n",
+        encoding="utf-8",
+    )
+    (repo_root / "markers").mkdir()
+
+    result = _run(
+        [
+            str(REPO_HELPER_STAGE1_PLAN),
+            "--repo-root",
+            str(repo_root),
+            "--prompts-dir",
+            ".prompts",
+            "--execute",
+            "--parallel",
+            "2",
+            "--prompt-deps",
+            "deps.json",
+            "--runner-argv-template",
+            '["python3","runner.py","{prompt_path}"]',
+            "--run-log",
+            "STAGE1-PARALLEL.md",
+            "--no-max-prompts",
+            "--require-tools",
+            "python3",
+        ]
+    )
+
+    assert result.returncode == 5, result.stdout + "\n" + result.stderr
+    assert "- parallel workers: 2" in result.stdout
+    assert "- skipped PROMPT_03.txt: depends on failed PROMPT_01.txt" in result.stdout
+    log_text = (repo_root / "STAGE1-PARALLEL.md").read_text(encoding="utf-8")
+    assert "RAN PROMPT_02.txt" in log_text
+    assert "- returncode: `5`" in log_text
+    assert "PROMPT_03.txt" not in log_text
+    assert not (repo_root / "markers" / "PROMPT_03.txt").exists()
+
+
+def test_repo_helper_stage1_plan_execute_streams_output_to_prompt_logs(tmp_path: Path) -> None:
+    repo_root = _make_prompt_repo(tmp_path)
+
+    result = _run(
+        [
+            str(REPO_HELPER_STAGE1_PLAN),
+            "--repo-root",
+            str(repo_root),
+            "--prompts-dir",
+            ".prompts",
+            "--start",
+            "1",
+            "--end",
+            "2",
+            "--execute",
+            "--runner-argv-template",
+            '["python3","-c","import sys; n = 2000 if sys.argv[1].endswith(\\"02.txt\\") else 1; print(\\"LINE\\\\n\\" * n, end=\\"\\")","{prompt_path}"]',
+            "--run-log",
+            "STAGE1-STREAM.md",
+            "--prompt-log-dir",
+            "logs/stage1",
+            "--require-tools",
+            "python3",
+        ]
+    )
+
+    assert result.returncode == 0, result.stdout + "\n" + result.stderr
+    assert "[PROMPT_01.txt] LINE" in result.stdout
+    stdout_log = repo_root / "logs" / "stage1" / "PROMPT_02.stdout.log"
+    assert stdout_log.read_text(encoding="utf-8") == "LINE\n" * 2000
+    log_text = (repo_root / "STAGE1-STREAM.md").read_text(encoding="utf-8")
+    assert "- stdout_log: `logs/stage1/PROMPT_01.stdout.log` (5 bytes)" in log_text
+    assert "- stdout_log: `logs/stage1/PROMPT_02.stdout.log` (10000 bytes)" in log_text
+    assert "- stdout: not inlined (over 4096 bytes); see stdout_log" in log_text
+    assert log_text.count("```text\nLINE\n```") == 2
+    assert "- success: 3" in log_text
+
+
+def test_repo_helper_stage1_plan_execute_resume_skips_checkpointed_prompts(tmp_path: Path) -> None:
+    repo_root = _make_prompt_repo(tmp_path)
+    runner = repo_root / "runner.py"
+    runner.write_text(
+        "import os, sys\n"
+        "name = os.path.basename(sys.argv[1])\n"
+        "with open('runs.txt', 'a') as handle:\n"
+        "    handle.write(name + '\\n')\n"
+        "raise SystemExit(7 if name == 'PROMPT_02.txt' and not os.path.exists('fixed') else 0)\n",
+        encoding="utf-8",
+    )
+    cmd = [
+        str(REPO_HELPER_STAGE1_PLAN),
+        "--repo-root",
+        str(repo_root),
+        "--prompts-dir",
+        ".prompts",
+        "--execute",
+        "--runner-argv-template",
+        '["python3","runner.py","{prompt_path}"]',
+        "--run-log",
+        "STAGE1-RESUME.md",
+        "--no-max-prompts",
+        "--require-tools",
+        "python3",
+    ]
+    runs = repo_root / "runs.txt"
+
+    first = _run(cmd)
+    assert first.returncode == 7, first.stdout + "\n" + first.stderr
+    assert runs.read_text(encoding="utf-8").split() == ["PROMPT_00_s.txt", "PROMPT_01.txt", "PROMPT_02.txt"]
+    journal = (repo_root / "STAGE1-RESUME.checkpoint.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["status"] for line in journal] == ["success", "success", "failed"]
+
+    (repo_root / "fixed").write_text("", encoding="utf-8")
+    (repo_root / ".prompts" / "PROMPT_01.txt").write_text("Task 1, revised\n", encoding="utf-8")
+    runs.unlink()
+    resumed = _run(cmd + ["--resume"])
+    assert resumed.returncode == 0, resumed.stdout + "\n" + resumed.stderr
+    assert "- already done PROMPT_00_s.txt (checkpoint; prompt unchanged)" in resumed.stdout
+    assert "PROMPT_01.txt: prompt changed since its checkpointed success" in resumed.stdout
+    assert runs.read_text(encoding="utf-8").split() == ["PROMPT_01.txt", "PROMPT_02.txt", "PROMPT_03.txt"]
+    log_text = (repo_root / "STAGE1-RESUME.md").read_text(encoding="utf-8")
+    assert "# Stage 1 Execution Log (resumed)" in log_text
+    assert "- returncode: `7`" in log_text
+
+    runs.unlink()
+    again = _run(cmd + ["--resume"])
+    assert again.returncode == 0
+    assert not runs.exists()
+
+
+def test_repo_helper_stage1_plan_execute_global_timeout_tears_down_runner_process_group(tmp_path: Path) -> None:
+    repo_root = _make_prompt_repo(tmp_path)
+    runner = repo_root / "runner.py"
+    # The runner leaves a grandchild behind; teardown must reach it through the process group.
+    runner.write_text(
+        "import subprocess, sys, time\n"
+        "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+        "open('child.pid', 'w').write(str(child.pid))\n"
+        "print('started', flush=True)\n"
+        "time.sleep(30)\n",
+        encoding="utf-8",
+    )
+
+    result = _run(
+        [
+            str(REPO_HELPER_STAGE1_PLAN),
+            "--repo-root",
+            str(repo_root),
+            "--prompts-dir",
+            ".prompts",
+            "--start",
+            "1",
+            "--end",
+            "2",
+            "--execute",
+            "--runner-shell-template",
+            "python3 runner.py {prompt_path}",
+            "--global-timeout-seconds",
+            "0.5",
+            "--run-log",
+            "STAGE1-GLOBAL-TIMEOUT.md",
+            "--no-max-prompts",
+            "--no-progress",
+            "--require-tools",
+            "python3",
+        ]
+    )
+
+    assert result.returncode == 124, result.stdout + "\n" + result.stderr
+    assert "Stopped: Global timeout of 0.5 second(s) reached; 2 prompt(s) not started" in result.stdout
+    assert "[PROMPT_00_s.txt] started" in result.stdout
+    assert "[progress]" not in result.stderr
+    log_text = (repo_root / "STAGE1-GLOBAL-TIMEOUT.md").read_text(encoding="utf-8")
+    assert "- status: `timed_out`" in log_text
+    assert "Global timeout of 0.5 second(s) reached" in log_text
+    assert "### PROMPT_01.txt" not in log_text
+    assert "- stopped: Global timeout of 0.5 second(s) reached" in log_text
+    assert "- not_started: 2" in log_text
+    child_stat = Path(f"/proc/{(repo_root / 'child.pid').read_text(encoding='utf-8')}/stat")
+    assert not child_stat.exists() or child_stat.read_text().split()[2] == "Z"
+
+
+def test_repo_helper_stage1_plan_execute_retries_transient_exit_codes_and_logs_attempts(tmp_path: Path) -> None:
+    repo_root = _make_prompt_repo(tmp_path)
+    runner = repo_root / "runner.py"
+    # PROMPT_00_s fails with the transient code twice before succeeding; PROMPT_01 fails with a non-listed code.
+    runner.write_text(
+        "import os, sys\n"
+        "name = os.path.basename(sys.argv[1])\n"
+        "with open('runs.txt', 'a') as handle:\n"
+        "    handle.write(name + '\\n')\n"
+        "runs = open('runs.txt').read().split().count(name)\n"
+        "print('attempt', runs)\n"
+        "if name == 'PROMPT_00_s.txt' and runs < 3:\n"
+        "    raise SystemExit(75)\n"
+        "raise SystemExit(3 if name == 'PROMPT_01.txt' else 0)\n",
+        encoding="utf-8",
+    )
+
+    result = _run(
+        [
+            str(REPO_HELPER_STAGE1_PLAN),
+            "--repo-root",
+            str(repo_root),
+            "--prompts-dir",
+            ".prompts",
+            "--execute",
+            "--runner-argv-template",
+            '["python3","runner.py","{prompt_path}"]',
+            "--run-log",
+            "STAGE1-RETRY.md",
+            "--retries",
+            "3",
+            "--retry-on-exit-codes",
+            "75,76",
+            "--retry-backoff-seconds",
+            "0.01",
+            "--no-max-prompts",
+            "--no-progress",
+            "--require-tools",
+            "python3",
+        ]
+    )
+
+    assert result.returncode == 3, result.stdout + "\n" + result.stderr
+    assert "- retries: 3 on 75, 76" in result.stdout
+    assert "- retrying PROMPT_00_s.txt in" in result.stdout
+    assert "(attempt 3/4): failed (rc=75)" in result.stdout
+    assert (repo_root / "runs.txt").read_text(encoding="utf-8").split() == ["PROMPT_00_s.txt"] * 3 + ["PROMPT_01.txt"]
+    log_dir = repo_root / "STAGE1-RETRY.logs"
+    assert (log_dir / "PROMPT_00_s.stdout.log").read_text(encoding="utf-8") == "attempt 1\n"
+    assert (log_dir / "PROMPT_00_s.attempt-3.stdout.log").read_text(encoding="utf-8") == "attempt 3\n"
+    log_text = (repo_root / "STAGE1-RETRY.md").read_text(encoding="utf-8")
+    assert "- attempts: 3" in log_text
+    assert "  - attempt 1: `failed` (rc=75)" in log_text
+    assert "  - attempt 2: `failed` (rc=75)" in log_text
+    assert "- prompts_retried: 1" in log_text
+    assert "- retry_attempts: 2" in log_text
+    journal = [json.loads(line) for line in (repo_root / "STAGE1-RETRY.checkpoint.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [(record["status"], record["attempt"]) for record in journal] == [("success", 3), ("failed", 1)]
+
+    rejected = _run(
+        [
+            str(REPO_HELPER_STAGE1_PLAN),
+            "--repo-root",
+            str(repo_root),
+            "--execute",
+            "--runner-argv-template",
+            '["python3","runner.py","{prompt_path}"]',
+            "--run-log",
+            "STAGE1-RETRY.md",
+            "--retries",
+            "2",
+        ]
+    )
+    assert rejected.returncode == 2
+    assert "--retries requires --retry-on-exit-codes and/or --retry-on-timeout" in rejected.stdout
+
+
+def test_repo_helper_stage1_plan_execute_interrupt_during_retry_backoff_records_interrupted(tmp_path: Path) -> None:
+    repo_root = _make_prompt_repo(tmp_path)
+    (repo_root / "runner.py").write_text(
+        "open('runs.txt', 'a').write('run\\n')\nraise SystemExit(75)\n",
+        encoding="utf-8",
+    )
+    proc = subprocess.Popen(
+        [
+            str(REPO_HELPER_STAGE1_PLAN),
+            "--repo-root",
+            str(repo_root),
+            "--prompts-dir",
+            ".prompts",
+            "--start",
+            "1",
+            "--end",
+            "1",
+            "--execute",
+            "--runner-argv-template",
+            '["python3","runner.py","{prompt_path}"]',
+            "--run-log",
+            "STAGE1-RETRY-STOP.md",
+            "--retries",
+            "3",
+            "--retry-on-exit-codes",
+            "75",
+            "--retry-backoff-seconds",
+            "30",
+            "--no-max-prompts",
+            "--no-progress",
+            "--require-tools",
+            "python3",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    runs = repo_root / "runs.txt"
+    deadline = time.time() + 10
+    while not runs.exists() and time.time() < deadline:
+        time.sleep(0.05)
+    time.sleep(0.5)
+    proc.send_signal(signal.SIGINT)
+    stdout, stderr = proc.communicate(timeout=10)
+
+    assert proc.returncode == 130, stdout + "\n" + stderr
+    assert runs.read_text(encoding="utf-8").split() == ["run"]
+    assert "- executed PROMPT_00_s.txt: interrupted (rc=130)" in stdout
+    assert "Stopped: Interrupted by SIGINT; 1 prompt(s) not started" in stdout
+    log_text = (repo_root / "STAGE1-RETRY-STOP.md").read_text(encoding="utf-8")
+    assert "- status: `interrupted`" in log_text
+    assert "Interrupted by SIGINT before retry 2 started" in log_text
+    # The cancelled retry never ran, so no earlier attempt is listed.
+    assert "- attempts:" not in log_text
+    assert "retried after" not in log_text
@@ -0,0 +1,54 @@
+from pathlib import Path
+import json
+import subprocess
+
+
+ROOT = Path(__file__).resolve().parents[1]
+CLI = ROOT / "bin" / "skills-bench"
+
+
+def test_skills_bench_help_runs() -> None:
+    result = subprocess.run([str(CLI), "--help"], capture_output=True, text=True)
+    assert result.returncode == 0
+    assert "Benchmark foundry" in result.stdout
+
+
+def test_skills_bench_generates_seeded_corpus_and_compares_baseline(tmp_path: Path) -> None:
+    outputs = {}
+    for run in ["a", "b"]:
+        work_dir = tmp_path / f"work-{run}"
+        output = tmp_path / f"bench-{run}.json"
+        cmd = [str(CLI), "--sizes", "12", "--seed", "7", "--work-dir", str(work_dir), "--output", str(output)]
+        if run == "b":
+            cmd += ["--baseline", str(tmp_path / "bench-a.json"), "--max-regression", "100000"]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        assert result.returncode == 0, result.stdout + "\n" + result.stderr
+        outputs[run] = result.stdout
+        skill_files = sorted((work_dir / "corpus-12-seed7" / "skills").rglob("SKILL.md"))
+        assert len(skill_files) == 12
+        assert (skill_files[0].parent / "EXAMPLES.md").exists()
+
+    # Same seed, same corpus, byte for byte.
+    corpus_a = tmp_path / "work-a" / "corpus-12-seed7" / "skills"
+    corpus_b = tmp_path / "work-b" / "corpus-12-seed7" / "skills"
+    files_a = sorted(p.relative_to(corpus_a) for p in corpus_a.rglob("*") if p.is_file())
+    assert files_a == sorted(p.relative_to(corpus_b) for p in corpus_b.rglob("*") if p.is_file())
+    assert all((corpus_a / rel).read_bytes() == (corpus_b / rel).read_bytes() for rel in files_a)
+
+    # The sync target looks like a real synced tree: full skill dirs plus a manifest.
+    target = tmp_path / "work-a" / "corpus-12-seed7" / "target"
+    manifest = json.loads((target / ".skills-sync-manifest.json").read_text(encoding="utf-8"))
+    assert len(manifest["skills"]) == 10
+    assert all((target / skill_id / "EXAMPLES.md").exists() for skill_id in manifest["skills"])
+
+    data = json.loads((tmp_path / "bench-b.json").read_text(encoding="utf-8"))
+    assert data["seed"] == 7
+    assert {item["benchmark"] for item in data["results"]} == {
+        "validate_skills",
+        "lint_skills",
+        "collect_skill_entries",
+        "render_skills_catalog",
+        "build_sync_plan",
+    }
+    assert "Comparison vs baseline" in outputs["b"]
+    assert "REGRESSION" not in outputs["b"]
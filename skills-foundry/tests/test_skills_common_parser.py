@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 import sys
 import textwrap
 from pathlib import Path
@@ -78,3 +79,233 @@ def test_parse_front_matter_minimal_handles_comments_and_blank_lines() -> None:
     assert metadata["tags"] == ["workflow", "parser"]
     assert "confirmation_points:" in str(metadata["safety"])
 
+
+
+def test_parse_cache_hits_on_unchanged_content_and_misses_after_edit(tmp_path: Path) -> None:
+    skill_md = tmp_path / "skills" / "core" / "cached-skill" / "SKILL.md"
+    skill_md.parent.mkdir(parents=True)
+    skill_md.write_text("---\nid: cached-skill\ntags: [core]\n---\n\n## When to use\nAlways.\n", encoding="utf-8")
+    cache_file = tmp_path / "parse-cache.json"
+
+    cache = MODULE.SkillParseCache.load(cache_file)
+    first = MODULE.load_skill_document(skill_md, cache=cache)
+    cache.save()
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    cache = MODULE.SkillParseCache.load(cache_file)
+    second = MODULE.load_skill_document(skill_md, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert second.metadata == first.metadata
+    assert second.section_map == first.section_map
+
+    skill_md.write_text("---\nid: cached-skill\ntags: [core, edited]\n---\n\n## When to use\nAlways.\n", encoding="utf-8")
+    third = MODULE.load_skill_document(skill_md, cache=cache)
+    assert cache.misses == 1
+    assert third.metadata["tags"] == ["core", "edited"]
+
+
+def test_lazy_document_defers_body_and_matches_eager_parse(tmp_path: Path) -> None:
+    skill_md = tmp_path / "skills" / "core" / "lazy-skill" / "SKILL.md"
+    skill_md.parent.mkdir(parents=True)
+    skill_md.write_text(
+        "---\nid: lazy-skill\ntags: [core]\n---\n\n## When to use\nAlways.\n\n## Procedure\n1. Step.\n",
+        encoding="utf-8",
+    )
+    eager = MODULE.load_skill_document(skill_md)
+
+    lazy = MODULE.load_skill_document_lazy(skill_md)
+    assert isinstance(lazy, MODULE.LazySkillDocument)
+    assert lazy.metadata == eager.metadata
+    assert lazy.front_matter_text == eager.front_matter_text
+    assert lazy._section_map is None
+    assert lazy.section_map == eager.section_map
+    assert (lazy.text, lazy.body_text) == (eager.text, eager.body_text)
+
+    cache_file = tmp_path / "parse-cache.json"
+    cache = MODULE.SkillParseCache.load(cache_file)
+    MODULE.load_skill_document(skill_md, cache=cache)
+    cached = MODULE.load_skill_document_lazy(skill_md, cache=cache)
+    assert cache.hits == 1
+    assert cached.section_map == eager.section_map
+    assert cached.text == eager.text
+
+    broken = skill_md.with_name("BROKEN.md")
+    broken.write_text("---\nid: broken\n", encoding="utf-8")
+    fallback = MODULE.load_skill_document_lazy(broken, cache=cache)
+    assert [m.code for m in fallback.messages] == ["unterminated_front_matter"]
+    assert str(broken) in cache.entries
+
+
+def test_lazy_cache_hit_verifies_front_matter_not_stat(tmp_path: Path) -> None:
+    skill_md = tmp_path / "skills" / "core" / "lazy-skill" / "SKILL.md"
+    skill_md.parent.mkdir(parents=True)
+    skill_md.write_text("---\nid: lazy-skill\ntags: [aaaa]\n---\n\n## When to use\nAlways.\n", encoding="utf-8")
+    cache = MODULE.SkillParseCache.load(tmp_path / "parse-cache.json")
+    MODULE.load_skill_document(skill_md, cache=cache)
+    original = skill_md.stat()
+
+    # Same size and mtime (a restore that preserves mtime): the stale entry must not be served.
+    skill_md.write_text("---\nid: lazy-skill\ntags: [bbbb]\n---\n\n## When to use\nAlways.\n", encoding="utf-8")
+    os.utime(skill_md, ns=(original.st_atime_ns, original.st_mtime_ns))
+    edited = MODULE.load_skill_document_lazy(skill_md, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert edited.metadata["tags"] == ["bbbb"]
+
+    # A body-only edit still reuses the cached front matter, but the body comes from disk.
+    MODULE.load_skill_document(skill_md, cache=cache)
+    skill_md.write_text("---\nid: lazy-skill\ntags: [bbbb]\n---\n\n## When to use\nNever.\n", encoding="utf-8")
+    body_edit = MODULE.load_skill_document_lazy(skill_md, cache=cache)
+    assert cache.hits == 1
+    assert body_edit.section_map["When to use"] == "Never."
+
+
+def test_parse_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    skills_root = tmp_path / "skills"
+    paths = []
+    for name in ["alpha", "beta", "gamma"]:
+        skill_md = skills_root / "core" / name / "SKILL.md"
+        skill_md.parent.mkdir(parents=True)
+        skill_md.write_text(f"---\nid: {name}\n---\n", encoding="utf-8")
+        paths.append(skill_md)
+    cache_file = tmp_path / "parse-cache.json"
+
+    cache = MODULE.SkillParseCache.load(cache_file, max_entries=2)
+    MODULE.load_skill_document(paths[0], cache=cache)
+    cache.save()
+    cache = MODULE.SkillParseCache.load(cache_file, max_entries=2)
+    MODULE.load_skill_document(paths[1], cache=cache)
+    MODULE.load_skill_document(paths[2], cache=cache)
+    cache.save()
+
+    reloaded = MODULE.SkillParseCache.load(cache_file, max_entries=2)
+    assert sorted(reloaded.entries) == sorted(str(p) for p in paths[1:])
+
+
+def test_parse_front_matter_builds_nested_tree_for_blocks() -> None:
+    front_matter = textwrap.dedent(
+        """\
+        id: tree-skill
+        tags: [workflow, parser]
+        inputs:
+          - name: repo_root
+            type: path
+            required: true
+            examples: [".", "../other"]
+          - name: dry_run
+            type: bool
+            required: false
+            examples: [true]
+        safety:
+          dry_run_supported: true
+          destructive_actions: []
+          confirmation_points:
+            - Confirm before write
+        outputs:
+          - docs/OUT.md
+        """
+    )
+
+    metadata, tree, messages = MODULE.parse_front_matter(front_matter)
+
+    assert messages == []
+    assert metadata["tags"] == tree["tags"] == ["workflow", "parser"]
+    assert isinstance(metadata["safety"], str)
+    assert tree["inputs"] == [
+        {"name": "repo_root", "type": "path", "required": True, "examples": [".", "../other"]},
+        {"name": "dry_run", "type": "bool", "required": False, "examples": ["true"]},
+    ]
+    assert tree["safety"] == {
+        "dry_run_supported": True,
+        "destructive_actions": [],
+        "confirmation_points": ["Confirm before write"],
+    }
+    assert tree["outputs"] == ["docs/OUT.md"]
+
+
+def test_validate_nested_key_checks_are_exact_not_substring(tmp_path: Path) -> None:
+    skill_md = tmp_path / "skills" / "core" / "exact-skill" / "SKILL.md"
+    skill_md.parent.mkdir(parents=True)
+    skill_md.write_text(
+        textwrap.dedent(
+            """\
+            ---
+            id: exact-skill
+            description: "Mentions confirmation_points: and type: but defines neither."
+            inputs:
+              - name: target
+                required: true
+                examples: ["."]
+              - name: mode
+                required: false
+            safety:
+              dry_run_supported: true
+              destructive_actions: []
+            ---
+            """
+        ),
+        encoding="utf-8",
+    )
+
+    doc = MODULE.validate_skill_document(MODULE.load_skill_document(skill_md), tmp_path)
+    messages = {(m.code, m.message) for m in doc.messages}
+
+    assert ("missing_safety_subkey", "safety must include confirmation_points") in messages
+    assert ("missing_input_shape", "inputs must include field token type:") in messages
+    assert ("missing_input_shape", "inputs must include field token examples:") not in messages
+
+
+def test_validate_accepts_optional_input_without_examples(tmp_path: Path) -> None:
+    skill_md = tmp_path / "skills" / "core" / "optional-input-skill" / "SKILL.md"
+    skill_md.parent.mkdir(parents=True)
+    skill_md.write_text(
+        textwrap.dedent(
+            """\
+            ---
+            id: optional-input-skill
+            description: "Second input is optional and has no examples."
+            inputs:
+              - name: target
+                type: string
+                required: true
+                examples: ["."]
+              - name: agent_role
+                type: string
+                required: false
+            ---
+            """
+        ),
+        encoding="utf-8",
+    )
+
+    doc = MODULE.validate_skill_document(MODULE.load_skill_document(skill_md), tmp_path)
+    lint = MODULE.lint_skill(doc)
+
+    assert "missing_input_shape" not in {m.code for m in doc.messages}
+    assert "inputs.metadata_incomplete" not in lint["top_issue_rule_ids"]
+
+
+def test_lint_rule_registry_attaches_ids_and_supports_disabling(tmp_path: Path) -> None:
+    skill_md = tmp_path / "skills" / "core" / "thin-skill" / "SKILL.md"
+    skill_md.parent.mkdir(parents=True)
+    skill_md.write_text(
+        "---\nid: thin-skill\nname: Thin\ndescription: Thin skill.\n---\n\n## Procedure\n1. Only step.\n",
+        encoding="utf-8",
+    )
+    doc = MODULE.validate_skill_document(MODULE.load_skill_document(skill_md), tmp_path)
+
+    timings: dict[str, float] = {}
+    full = MODULE.lint_skill(doc, rule_timings=timings)
+    assert full["top_issue_rule_ids"][:3] == ["validation.errors_present", "section.missing", "section.missing"]
+    assert full["top_issues"][1] == "Missing section: When to use"
+    assert set(timings) == set(MODULE.LINT_RULE_IDS)
+
+    trimmed = MODULE.lint_skill(doc, MODULE.select_lint_rules(["validation.errors_present", "section.missing"]))
+    assert trimmed["top_issue_rule_ids"][0] == "procedure.too_short"
+    assert trimmed["completeness_score_100"] > full["completeness_score_100"]
+
+    try:
+        MODULE.select_lint_rules(["no.such_rule"])
+    except ValueError as exc:
+        assert "no.such_rule" in str(exc)
+    else:
+        raise AssertionError("unknown rule ids must be rejected")
@@ -79,6 +79,9 @@ def test_lint_scoring_works_on_sample_skill(tmp_path: Path) -> None:
     assert result.returncode == 0
     assert (reports_dir / "skills-lint.json").exists()
     assert (reports_dir / "skills-lint.md").exists()
+    # Incremental state follows --reports-dir instead of the foundry's reports/.
+    assert (reports_dir / ".skills-lint-state.json").exists()
+    assert (reports_dir / ".skill-parse-cache.json").exists()
 
     data = json.loads((reports_dir / "skills-lint.json").read_text(encoding="utf-8"))
     assert len(data) == 1
@@ -171,3 +174,123 @@ def test_skills_lint_can_emit_absolute_paths(tmp_path: Path) -> None:
     assert result.returncode == 0, result.stdout + "\n" + result.stderr
     data = json.loads((reports_dir / "skills-lint.json").read_text(encoding="utf-8"))
     assert Path(data[0]["path"]).is_absolute()
+
+
+def test_skills_lint_jobs_matches_serial_output_order(tmp_path: Path) -> None:
+    skills_root = tmp_path / "skills"
+    for idx in range(6):
+        category = "core" if idx % 2 else "workflow"
+        skill_dir = skills_root / category / f"skill-{idx:02d}"
+        skill_dir.mkdir(parents=True)
+        procedure = "\n".join(f"{step}. Step {step}." for step in range(1, idx + 1))
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nid: skill-{idx:02d}\nname: Skill {idx}\ndescription: Parallel lint sample.\n---\n\n"
+            f"## When to use\nSample.\n\n## Procedure\n{procedure}\n",
+            encoding="utf-8",
+        )
+
+    reports = {}
+    for jobs in ["1", "3"]:
+        reports_dir = tmp_path / f"reports-{jobs}"
+        result = subprocess.run(
+            [
+                str(CLI),
+                "--skills-root",
+                str(skills_root),
+                "--repo-root",
+                str(tmp_path),
+                "--reports-dir",
+                str(reports_dir),
+                "--no-cache",
+                "--jobs",
+                jobs,
+            ],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stdout + "\n" + result.stderr
+        reports[jobs] = (reports_dir / "skills-lint.json").read_text(encoding="utf-8")
+
+    assert reports["1"] == reports["3"]
+    assert [item["skill_id"] for item in json.loads(reports["3"])] == [
+        "skill-01",
+        "skill-03",
+        "skill-05",
+        "skill-00",
+        "skill-02",
+        "skill-04",
+    ]
+
+
+def test_skills_lint_ndjson_streams_one_record_per_skill(tmp_path: Path) -> None:
+    skills_root = tmp_path / "skills"
+    for idx in range(3):
+        skill_dir = skills_root / "core" / f"skill-{idx:02d}"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nid: skill-{idx:02d}\nname: Skill {idx}\ndescription: NDJSON sample.\n---\n\n## When to use\nSample.\n",
+            encoding="utf-8",
+        )
+
+    reports_dir = tmp_path / "reports"
+    result = subprocess.run(
+        [
+            str(CLI),
+            "--skills-root",
+            str(skills_root),
+            "--repo-root",
+            str(tmp_path),
+            "--reports-dir",
+            str(reports_dir),
+            "--no-cache",
+            "--jobs",
+            "2",
+            "--ndjson",
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stdout + "\n" + result.stderr
+    lines = (reports_dir / "skills-lint.ndjson").read_text(encoding="utf-8").splitlines()
+    records = [json.loads(line) for line in lines]
+    assert [item["skill_id"] for item in records] == ["skill-00", "skill-01", "skill-02"]
+    assert records[0]["path"] == "skills/core/skill-00/SKILL.md"
+    assert "completeness_score_100" in records[0]
+    assert not (reports_dir / "skills-lint.json").exists()
+    assert "Linted 3 skills" in result.stdout
+
+
+def test_skills_lint_profile_json_records_phases_and_rules(tmp_path: Path) -> None:
+    skills_root = tmp_path / "skills"
+    skill_dir = skills_root / "core" / "profiled-skill"
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(
+        "---\nid: profiled-skill\nname: Profiled\ndescription: Profile sample.\n---\n\n## Procedure\n1. Step.\n",
+        encoding="utf-8",
+    )
+
+    profile_path = tmp_path / "profile.json"
+    result = subprocess.run(
+        [
+            str(CLI),
+            "--skills-root",
+            str(skills_root),
+            "--repo-root",
+            str(tmp_path),
+            "--reports-dir",
+            str(tmp_path / "reports"),
+            "--no-cache",
+            "--profile-json",
+            str(profile_path),
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stdout + "\n" + result.stderr
+    assert "Profile (total wall" in result.stderr
+    phases = {item["phase"]: item for item in json.loads(profile_path.read_text(encoding="utf-8"))["phases"]}
+    for name in ["discover", "read", "parse.front_matter", "parse.sections", "validate.sections", "report.lint"]:
+        assert phases[name]["calls"] >= 1
+    assert phases["lint.rule.section.missing"]["calls"] == 1
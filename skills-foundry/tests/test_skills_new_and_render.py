@@ -54,3 +54,95 @@ def test_skills_new_then_render_catalog(tmp_path: Path) -> None:
     assert "Total skills: 1" in catalog_text
     assert "demo-skill" in catalog_text
     assert "A demo skill for CLI smoke testing." in catalog_text
+
+
+def test_skills_render_watch_rerenders_changed_skills(tmp_path: Path) -> None:
+    skills_root = tmp_path / "skills"
+    output_catalog = tmp_path / "SKILLS_CATALOG.md"
+    for skill_id in ["alpha-skill", "beta-skill"]:
+        skill_dir = skills_root / "core" / skill_id
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nid: {skill_id}\nname: {skill_id}\ndescription: First draft.\n---\n\n## When to use\nSample.\n",
+            encoding="utf-8",
+        )
+
+    process = subprocess.Popen(
+        [
+            str(SKILLS_RENDER_CLI),
+            "--skills-root",
+            str(skills_root),
+            "--output",
+            str(output_catalog),
+            "--no-cache",
+            "--watch",
+            "--poll",
+            "--debounce-ms",
+            "100",
+            "--max-cycles",
+            "1",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    try:
+        assert process.stdout is not None
+        for line in process.stdout:
+            if line.startswith("Watching"):
+                break
+        (skills_root / "core" / "beta-skill" / "SKILL.md").write_text(
+            "---\nid: beta-skill\nname: beta-skill\ndescription: Second draft.\n---\n\n## When to use\nSample.\n",
+            encoding="utf-8",
+        )
+        output = process.stdout.read()
+        assert process.wait(timeout=30) == 0
+    finally:
+        process.kill()
+
+    assert "[watch] re-rendered catalog for 2 skills (1 changed skill(s)" in output
+    catalog_text = output_catalog.read_text(encoding="utf-8")
+    assert "Second draft." in catalog_text
+    assert "First draft." in catalog_text
+
+
+def test_skills_render_reuses_unchanged_category_fragments(tmp_path: Path) -> None:
+    skills_root = tmp_path / "skills"
+    output_catalog = tmp_path / "reports" / "SKILLS_CATALOG.md"
+
+    def write_skill(category: str, skill_id: str, description: str) -> None:
+        skill_dir = skills_root / category / skill_id
+        skill_dir.mkdir(parents=True, exist_ok=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nid: {skill_id}\nname: {skill_id}\ndescription: {description}\n---\n\n## When to use\nSample.\n",
+            encoding="utf-8",
+        )
+
+    def render() -> str:
+        result = subprocess.run(
+            [
+                str(SKILLS_RENDER_CLI),
+                "--skills-root",
+                str(skills_root),
+                "--output",
+                str(output_catalog),
+                "--cache-file",
+                str(tmp_path / "cache.json"),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stdout + "\n" + result.stderr
+        return result.stdout
+
+    write_skill("core", "alpha-skill", "Alpha.")
+    write_skill("workflow", "beta-skill", "Beta.")
+    assert "categories re-rendered: 2, reused: 0)" in render()
+    mtime = output_catalog.stat().st_mtime_ns
+
+    assert "categories re-rendered: 0, reused: 2; unchanged, not rewritten)" in render()
+    assert output_catalog.stat().st_mtime_ns == mtime
+
+    write_skill("workflow", "beta-skill", "Beta, revised.")
+    assert "categories re-rendered: 1, reused: 1)" in render()
+    assert "Beta, revised." in output_catalog.read_text(encoding="utf-8")
@@ -0,0 +1,67 @@
+from pathlib import Path
+import json
+import subprocess
+
+
+ROOT = Path(__file__).resolve().parents[1]
+RENDER_CLI = ROOT / "bin" / "skills-render"
+QUERY_CLI = ROOT / "bin" / "skills-query"
+
+
+def _write_skill(skills_root: Path, category: str, skill_id: str, tags: str, tools: str, inputs: list[str]) -> None:
+    skill_dir = skills_root / category / skill_id
+    skill_dir.mkdir(parents=True)
+    input_lines = "".join(f"  - name: {name}\n    type: string\n" for name in inputs)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nid: {skill_id}\nname: {skill_id}\ndescription: Query sample {skill_id}.\n"
+        f"tags: [{tags}]\nexpected_tools: [{tools}]\ninputs:\n{input_lines}---\n\n## When to use\nSample.\n",
+        encoding="utf-8",
+    )
+
+
+def test_skills_query_answers_from_rendered_index(tmp_path: Path) -> None:
+    skills_root = tmp_path / "skills"
+    _write_skill(skills_root, "core", "release-notes", "release, docs", "git", ["target_path"])
+    _write_skill(skills_root, "core", "repo-audit", "review", "git, rg", ["target_path", "depth"])
+    _write_skill(skills_root, "workflow", "release-train", "release", "gh", ["version"])
+
+    render = subprocess.run(
+        [
+            str(RENDER_CLI),
+            "--skills-root",
+            str(skills_root),
+            "--output",
+            str(tmp_path / "reports" / "SKILLS_CATALOG.md"),
+            "--no-cache",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert render.returncode == 0, render.stdout + "\n" + render.stderr
+    index_path = tmp_path / "reports" / "skills-catalog-index.json"
+    data = json.loads(index_path.read_text(encoding="utf-8"))
+    assert [skill["skill_id"] for skill in data["skills"]] == ["release-notes", "release-train", "repo-audit"]
+    assert data["index"]["tag"]["keys"] == ["docs", "release", "review"]
+
+    # The query must not need the skill files at all.
+    for skill_md in skills_root.rglob("SKILL.md"):
+        skill_md.unlink()
+
+    def query(*args: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run([str(QUERY_CLI), "--index", str(index_path), *args], capture_output=True, text=True)
+
+    result = query("--tag", "Release", "--tool", "git")
+    assert result.returncode == 0, result.stdout + "\n" + result.stderr
+    assert [line.split("\t")[0] for line in result.stdout.splitlines()[:-1]] == ["release-notes"]
+
+    prefix = json.loads(query("--input", "target*", "--json").stdout)
+    assert [skill["skill_id"] for skill in prefix] == ["release-notes", "repo-audit"]
+
+    assert query("--category", "workflow").stdout.startswith("release-train\tworkflow\t")
+    assert json.loads(query("--id", "repo-audit", "--json").stdout)[0]["expected_tools"] == ["git", "rg"]
+    # --id is ANDed with the other criteria, not a replacement for them.
+    assert query("--id", "repo-audit", "--tool", "rg").stdout.startswith("repo-audit\t")
+    assert query("--id", "repo-audit", "--tag", "release").returncode == 1
+    assert query("--category", "core", "--tool", "git").stdout.splitlines()[-1] == "2 skill(s) matched"
+    assert query("--tag", "release", "--category", "missing").returncode == 1
+    assert "release\t2" in query("--list-keys", "tag").stdout
@@ -0,0 +1,57 @@
+from pathlib import Path
+import json
+import subprocess
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SEARCH_CLI = ROOT / "bin" / "skills-search"
+
+
+def _write_skill(skills_root: Path, skill_id: str, description: str, procedure: str) -> Path:
+    skill_dir = skills_root / "core" / skill_id
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    path = skill_dir / "SKILL.md"
+    path.write_text(
+        f"---\nid: {skill_id}\nname: {skill_id}\ndescription: {description}\ntags: [sample]\n---\n\n"
+        f"## When to use\nSample skill.\n\n## Procedure\n{procedure}\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def _search(skills_root: Path, index_file: Path, query: str, *extra: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [str(SEARCH_CLI), query, "--skills-root", str(skills_root), "--index-file", str(index_file), "--no-cache", *extra],
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_skills_search_ranks_and_updates_incrementally(tmp_path: Path) -> None:
+    skills_root = tmp_path / "skills"
+    index_file = tmp_path / "reports" / ".skills-search-index.json"
+    _write_skill(skills_root, "changelog-drafter", "Draft changelog entries.", "Collect merged changes for the changelog.")
+    _write_skill(skills_root, "port-checker", "Check ports.", "List listening ports; mention the changelog once.")
+    audit = _write_skill(skills_root, "repo-audit", "Audit a repository.", "Walk the tree.")
+
+    first = _search(skills_root, index_file, "changelog", "--json")
+    assert first.returncode == 0, first.stdout + "\n" + first.stderr
+    assert "added 3, updated 0, removed 0, unchanged 0" in first.stderr
+    hits = json.loads(first.stdout)
+    assert [hit["skill_id"] for hit in hits] == ["changelog-drafter", "port-checker"]
+    assert hits[0]["sections"] == ["metadata", "Procedure"]
+    assert hits[1]["sections"] == ["Procedure"]
+    assert index_file.is_file()
+
+    _write_skill(skills_root, "port-checker", "Check ports.", "List listening ports only.")
+    audit.unlink()
+    second = _search(skills_root, index_file, "changelog")
+    assert second.returncode == 0
+    assert "added 0, updated 1, removed 1, unchanged 1" in second.stderr
+    assert "changelog-drafter" in second.stdout
+    assert "port-checker" not in second.stdout
+    assert "1 skill(s) matched" in second.stdout
+
+    missing = _search(skills_root, index_file, "kubernetes", "--no-update")
+    assert missing.returncode == 1
+    assert "0 skill(s) matched" in missing.stdout
@@ -1,6 +1,9 @@
 from pathlib import Path
+import json
 import subprocess
+import sys
 import textwrap
+import time
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -235,3 +238,535 @@ def test_skills_sync_prune_removes_extra_targets_with_backup(tmp_path: Path) ->
     assert not stale_skill_dir.exists()
     assert (backup_root / "obsolete-skill" / "SKILL.md").exists()
     assert "- would-prune: 1" in result.stdout or "Backups (if any) written under:" in result.stdout
+
+
+def test_skills_sync_reads_each_skill_file_once(tmp_path: Path) -> None:
+    source_skills = tmp_path / "skills"
+    _write_valid_skill(source_skills, "core", "hello-skill", "A hello skill")
+    _write_valid_skill(source_skills, "workflow", "repo-tree-summarizer", "A repo tree skill")
+
+    result = subprocess.run(
+        [
+            str(SYNC_CLI),
+            "--from",
+            str(source_skills),
+            "--to",
+            str(tmp_path / "installed-skills"),
+            "--reports-dir",
+            str(tmp_path / "reports"),
+            "--repo-root",
+            str(tmp_path),
+            "--cache-file",
+            str(tmp_path / "parse-cache.json"),
+            "--dry-run",
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stdout + "\n" + result.stderr
+    assert (tmp_path / "parse-cache.json").exists()
+    assert "Skill files read: 2" in result.stdout
+    assert "- create: 2" in result.stdout
+
+
+def test_skills_sync_manifest_detects_non_skill_md_changes_without_reading_target(tmp_path: Path) -> None:
+    source_skills = tmp_path / "skills"
+    target_root = tmp_path / "installed-skills"
+    _write_valid_skill(source_skills, "core", "hello-skill", "A hello skill")
+    _write_valid_skill(source_skills, "workflow", "repo-tree-summarizer", "A repo tree skill")
+    (source_skills / "core" / "hello-skill" / "EXAMPLES.md").write_text("# Examples\n", encoding="utf-8")
+
+    def run_sync(*extra: str) -> subprocess.CompletedProcess[str]:
+        result = subprocess.run(
+            [
+                str(SYNC_CLI),
+                "--from",
+                str(source_skills),
+                "--to",
+                str(target_root),
+                "--reports-dir",
+                str(tmp_path / "reports"),
+                "--repo-root",
+                str(tmp_path),
+                "--cache-file",
+                str(tmp_path / "cache" / "parse.json"),
+                "--backup-dir",
+                str(tmp_path / "backups"),
+                *extra,
+            ],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stdout + "\n" + result.stderr
+        return result
+
+    run_sync()
+    manifest = json.loads((target_root / ".skills-sync-manifest.json").read_text(encoding="utf-8"))
+    assert set(manifest["skills"]["hello-skill"]["files"]) == {"EXAMPLES.md", "SKILL.md"}
+
+    again = run_sync("--dry-run")
+    assert "- unchanged: 2" in again.stdout
+    assert "Sync manifest: 2 of 2 existing target(s) compared without reading target files" in again.stdout
+
+    (source_skills / "core" / "hello-skill" / "EXAMPLES.md").write_text("# Examples\n\nNew scenario.\n", encoding="utf-8")
+    changed = run_sync()
+    assert "- update: 1" in changed.stdout
+    assert (target_root / "hello-skill" / "EXAMPLES.md").read_text(encoding="utf-8").endswith("New scenario.\n")
+
+    # Hand edits inside the target are only visible when the manifest is bypassed.
+    (target_root / "repo-tree-summarizer" / "SKILL.md").write_text("edited\n", encoding="utf-8")
+    assert "- unchanged: 2" in run_sync("--dry-run").stdout
+    assert "- update: 1" in run_sync("--dry-run", "--verify-target").stdout
+
+
+def test_skills_sync_jobs_reports_progress_and_continues_on_error(tmp_path: Path) -> None:
+    source_skills = tmp_path / "skills"
+    target_root = tmp_path / "installed-skills"
+    for idx in range(5):
+        _write_valid_skill(source_skills, "core", f"skill-{idx:02d}", f"Parallel sync sample {idx}")
+    # A dangling symlink makes copytree fail for exactly one skill.
+    (source_skills / "core" / "skill-02" / "broken.md").symlink_to(tmp_path / "missing.md")
+
+    def run_sync(*extra: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [
+                str(SYNC_CLI),
+                "--from",
+                str(source_skills),
+                "--to",
+                str(target_root),
+                "--reports-dir",
+                str(tmp_path / "reports"),
+                "--repo-root",
+                str(tmp_path),
+                "--backup-dir",
+                str(tmp_path / "backups"),
+                "--no-cache",
+                "--jobs",
+                "4",
+                *extra,
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+    result = run_sync("--continue-on-error")
+    assert result.returncode == 1, result.stdout + "\n" + result.stderr
+    progress = [line for line in result.stdout.splitlines() if line.startswith("[")]
+    assert [line.split()[0] for line in progress] == [f"[{idx}/5]" for idx in range(1, 6)]
+    assert "FAILED create skill-02" in progress[2]
+    assert "Sync summary: created 4, updated 0, pruned 0, failed 1, skipped 0" in result.stdout
+    assert sorted(path.name for path in target_root.iterdir() if path.is_dir()) == [
+        "skill-00",
+        "skill-01",
+        "skill-03",
+        "skill-04",
+    ]
+    manifest = json.loads((target_root / ".skills-sync-manifest.json").read_text(encoding="utf-8"))
+    assert "skill-02" not in manifest["skills"]
+    assert "skill-02" not in (target_root / "INDEX.md").read_text(encoding="utf-8")
+
+    (source_skills / "core" / "skill-02" / "broken.md").unlink()
+    retry = run_sync()
+    assert retry.returncode == 0, retry.stdout + "\n" + retry.stderr
+    assert "Sync summary: created 1, updated 0, pruned 0, failed 0, skipped 0" in retry.stdout
+
+
+def test_skills_sync_delta_rewrites_only_changed_files(tmp_path: Path) -> None:
+    source_skills = tmp_path / "skills"
+    target_root = tmp_path / "installed-skills"
+    _write_valid_skill(source_skills, "core", "hello-skill", "A hello skill")
+    source_dir = source_skills / "core" / "hello-skill"
+    (source_dir / "EXAMPLES.md").write_text("# Examples\n", encoding="utf-8")
+    (source_dir / "refs").mkdir()
+    (source_dir / "refs" / "old.md").write_text("old\n", encoding="utf-8")
+
+    def run_sync() -> subprocess.CompletedProcess[str]:
+        result = subprocess.run(
+            [
+                str(SYNC_CLI),
+                "--from",
+                str(source_skills),
+                "--to",
+                str(target_root),
+                "--reports-dir",
+                str(tmp_path / "reports"),
+                "--repo-root",
+                str(tmp_path),
+                "--backup-dir",
+                str(tmp_path / "backups"),
+                "--no-cache",
+                "--strategy",
+                "delta",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stdout + "\n" + result.stderr
+        return result
+
+    run_sync()
+    target_dir = target_root / "hello-skill"
+    assert sorted(p.relative_to(target_dir).as_posix() for p in target_dir.rglob("*") if p.is_file()) == [
+        "EXAMPLES.md",
+        "SKILL.md",
+        "refs/old.md",
+    ]
+    skill_md_inode = (target_dir / "SKILL.md").stat().st_ino
+
+    (source_dir / "EXAMPLES.md").write_text("# Examples\n\nNew scenario.\n", encoding="utf-8")
+    (source_dir / "refs" / "old.md").unlink()
+    (source_dir / "refs").rmdir()
+    (source_dir / "CHECKLIST.md").write_text("- [ ] check\n", encoding="utf-8")
+    result = run_sync()
+
+    assert "Sync summary: created 0, updated 1" in result.stdout
+    assert (target_dir / "SKILL.md").stat().st_ino == skill_md_inode
+    assert (target_dir / "EXAMPLES.md").read_text(encoding="utf-8").endswith("New scenario.\n")
+    assert (target_dir / "CHECKLIST.md").exists()
+    assert not (target_dir / "refs").exists()
+    assert not list(target_dir.glob(".*.tmp"))
+    # SKILL.md did not change, so there was nothing to back up.
+    assert not (tmp_path / "backups" / "hello-skill").exists()
+
+
+def test_skills_sync_hardlink_and_reflink_build_real_directories(tmp_path: Path) -> None:
+    source_skills = tmp_path / "skills"
+    _write_valid_skill(source_skills, "core", "hello-skill", "A hello skill")
+    source_md = source_skills / "core" / "hello-skill" / "SKILL.md"
+
+    for strategy in ["hardlink", "reflink"]:
+        target_root = tmp_path / f"installed-{strategy}"
+        result = subprocess.run(
+            [
+                str(SYNC_CLI),
+                "--from",
+                str(source_skills),
+                "--to",
+                str(target_root),
+                "--reports-dir",
+                str(tmp_path / "reports"),
+                "--repo-root",
+                str(tmp_path),
+                "--backup-dir",
+                str(tmp_path / "backups"),
+                "--no-cache",
+                "--strategy",
+                strategy,
+            ],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stdout + "\n" + result.stderr
+        target_dir = target_root / "hello-skill"
+        assert target_dir.is_dir() and not target_dir.is_symlink()
+        assert (target_dir / "SKILL.md").read_bytes() == source_md.read_bytes()
+        if strategy == "hardlink":
+            assert (target_dir / "SKILL.md").stat().st_ino == source_md.stat().st_ino
+        else:
+            # Clone or fallback copy: either way the target is its own file.
+            assert (target_dir / "SKILL.md").stat().st_ino != source_md.stat().st_ino
+
+
+def test_skills_sync_backup_store_dedupes_and_restores(tmp_path: Path) -> None:
+    source_skills = tmp_path / "skills"
+    target_root = tmp_path / "installed-skills"
+    # The default store sits next to the target, not in the user's home.
+    store = tmp_path / "skills-backups"
+    backup_cli = ROOT / "bin" / "skills-backup"
+    _write_valid_skill(source_skills, "core", "hello-skill", "A hello skill")
+    _write_valid_skill(source_skills, "core", "other-skill", "Another skill")
+
+    def run(cli: Path, *args: str) -> subprocess.CompletedProcess[str]:
+        result = subprocess.run([str(cli), *args], capture_output=True, text=True)
+        assert result.returncode == 0, result.stdout + "\n" + result.stderr
+        return result
+
+    def run_sync(*extra: str) -> subprocess.CompletedProcess[str]:
+        return run(
+            SYNC_CLI,
+            "--from",
+            str(source_skills),
+            "--to",
+            str(target_root),
+            "--reports-dir",
+            str(tmp_path / "reports"),
+            "--repo-root",
+            str(tmp_path),
+            "--no-cache",
+            *extra,
+        )
+
+    run_sync()
+    original = (target_root / "hello-skill" / "SKILL.md").read_text(encoding="utf-8")
+    for description in ["Second revision", "Third revision"]:
+        _write_valid_skill(source_skills, "core", "hello-skill", description)
+        result = run_sync()
+        assert "1 file(s), 1 new blob(s)" in result.stdout
+
+    runs = sorted((store / "runs").glob("*.json"))
+    assert len(runs) == 2
+    first_run = json.loads(runs[0].read_text(encoding="utf-8"))
+    assert [(item["skill_id"], item["path"]) for item in first_run["files"]] == [("hello-skill", "SKILL.md")]
+    assert len(list((store / "objects").glob("*/*"))) == 2
+
+    listing = run(backup_cli, "--store", str(store), "--list")
+    assert first_run["run_id"] in listing.stdout
+
+    run(backup_cli, "--to", str(target_root), "--restore", first_run["run_id"])
+    assert (target_root / "hello-skill" / "SKILL.md").read_text(encoding="utf-8") == original
+    manifest = json.loads((target_root / ".skills-sync-manifest.json").read_text(encoding="utf-8"))
+    assert "hello-skill" not in manifest["skills"]
+    assert "other-skill" in manifest["skills"]
+
+    pruned = run(backup_cli, "--store", str(store), "--prune", "--keep-last", "1")
+    assert "Removed 1 run(s) and 1 blob(s)" in pruned.stdout
+    assert len(list((store / "runs").glob("*.json"))) == 1
+    assert len(list((store / "objects").glob("*/*"))) == 1
+
+
+def test_skills_backup_restore_does_not_write_through_symlinked_skill_dirs(tmp_path: Path) -> None:
+    source_skills = tmp_path / "skills"
+    target_root = tmp_path / "installed-skills"
+    _write_valid_skill(source_skills, "core", "hello-skill", "A hello skill")
+    sync_cmd = [
+        str(SYNC_CLI),
+        "--from",
+        str(source_skills),
+        "--to",
+        str(target_root),
+        "--reports-dir",
+        str(tmp_path / "reports"),
+        "--repo-root",
+        str(tmp_path),
+        "--no-cache",
+    ]
+    assert subprocess.run(sync_cmd, capture_output=True, text=True).returncode == 0
+    original = (target_root / "hello-skill" / "SKILL.md").read_text(encoding="utf-8")
+    _write_valid_skill(source_skills, "core", "hello-skill", "A changed hello skill")
+    linked = subprocess.run([*sync_cmd, "--strategy", "symlink"], capture_output=True, text=True)
+    assert linked.returncode == 0, linked.stdout + "\n" + linked.stderr
+    assert (target_root / "hello-skill").is_symlink()
+    source_text = (source_skills / "core" / "hello-skill" / "SKILL.md").read_text(encoding="utf-8")
+
+    restored = subprocess.run(
+        [str(ROOT / "bin" / "skills-backup"), "--to", str(target_root), "--restore", "latest"],
+        capture_output=True,
+        text=True,
+    )
+
+    assert restored.returncode == 0, restored.stdout + "\n" + restored.stderr
+    assert (source_skills / "core" / "hello-skill" / "SKILL.md").read_text(encoding="utf-8") == source_text
+    assert not (target_root / "hello-skill").is_symlink()
+    assert (target_root / "hello-skill" / "SKILL.md").read_text(encoding="utf-8") == original
+
+
+def test_skills_backup_prune_waits_for_runs_still_writing_their_manifest(tmp_path: Path) -> None:
+    sys.path.insert(0, str(ROOT / "bin"))
+    try:
+        from _skills_backup import BackupStore
+    finally:
+        sys.path.pop(0)
+    store = BackupStore(tmp_path / "store")
+    old, new = tmp_path / "old.md", tmp_path / "new.md"
+    old.write_text("old content\n", encoding="utf-8")
+    new.write_text("new content\n", encoding="utf-8")
+    for source in [old, new]:
+        run = store.begin_run(tmp_path / "target")
+        run.save("hello-skill", "SKILL.md", source)
+        run.commit()
+
+    # This run reuses the blob only the oldest run references; --keep-last 1 would drop it.
+    pending = store.begin_run(tmp_path / "target")
+    pending.save("hello-skill", "SKILL.md", old)
+    prune = subprocess.Popen(
+        [str(ROOT / "bin" / "skills-backup"), "--store", str(store.root), "--prune", "--keep-last", "1"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    time.sleep(0.3)
+    assert prune.poll() is None
+    pending.commit()
+    stdout, stderr = prune.communicate(timeout=10)
+
+    assert prune.returncode == 0, stdout + "\n" + stderr
+    assert "Removed 2 run(s)" in stdout
+    assert store.restore("latest", target_root=tmp_path / "restored")[1]
+    assert (tmp_path / "restored" / "hello-skill" / "SKILL.md").read_text(encoding="utf-8") == "old content\n"
+
+
+def test_skills_sync_watch_respects_only_and_rewrites_lint_report(tmp_path: Path) -> None:
+    source_skills = tmp_path / "skills"
+    target_root = tmp_path / "installed-skills"
+    reports_dir = tmp_path / "reports"
+    _write_valid_skill(source_skills, "core", "hello-skill", "A hello skill")
+    _write_valid_skill(source_skills, "core", "other-skill", "Another skill")
+
+    process = subprocess.Popen(
+        [
+            str(SYNC_CLI),
+            "--from",
+            str(source_skills),
+            "--to",
+            str(target_root),
+            "--reports-dir",
+            str(reports_dir),
+            "--repo-root",
+            str(tmp_path),
+            "--backup-dir",
+            str(tmp_path / "backups"),
+            "--no-cache",
+            "--only",
+            "hello-skill",
+            "--watch",
+            "--poll",
+            "--debounce-ms",
+            "100",
+            "--max-cycles",
+            "1",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    try:
+        assert process.stdout is not None
+        for line in process.stdout:
+            if line.startswith("Watching"):
+                break
+        (reports_dir / "skills-lint.json").unlink()
+        _write_valid_skill(source_skills, "core", "hello-skill", "A changed hello skill")
+        _write_valid_skill(source_skills, "core", "other-skill", "A changed other skill")
+        output = process.stdout.read()
+        assert process.wait(timeout=30) == 0, output
+    finally:
+        process.kill()
+
+    assert "[watch] synced 1 changed skill(s)" in output
+    assert "A changed hello skill" in (target_root / "hello-skill" / "SKILL.md").read_text(encoding="utf-8")
+    assert not (target_root / "other-skill").exists()
+    lint_report = json.loads((reports_dir / "skills-lint.json").read_text(encoding="utf-8"))
+    assert [item["skill_id"] for item in lint_report] == ["hello-skill", "other-skill"]
+
+
+def test_skills_sync_watch_reports_a_failed_cycle_and_keeps_watching(tmp_path: Path) -> None:
+    source_skills = tmp_path / "skills"
+    target_root = tmp_path / "installed-skills"
+    reports_dir = tmp_path / "reports"
+    _write_valid_skill(source_skills, "core", "hello-skill", "A hello skill")
+    _write_valid_skill(source_skills, "core", "other-skill", "Another skill")
+
+    process = subprocess.Popen(
+        [
+            str(SYNC_CLI),
+            "--from",
+            str(source_skills),
+            "--to",
+            str(target_root),
+            "--reports-dir",
+            str(reports_dir),
+            "--repo-root",
+            str(tmp_path),
+            "--backup-dir",
+            str(tmp_path / "backups"),
+            "--no-cache",
+            "--watch",
+            "--poll",
+            "--debounce-ms",
+            "100",
+            "--max-cycles",
+            "2",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    try:
+        assert process.stdout is not None
+        for line in process.stdout:
+            if line.startswith("Watching"):
+                break
+        # A directory where the lint report goes makes the first cycle raise.
+        lint_json = reports_dir / "skills-lint.json"
+        lint_json.unlink()
+        lint_json.mkdir()
+        _write_valid_skill(source_skills, "core", "hello-skill", "A changed hello skill")
+        for line in process.stdout:
+            if line.startswith("[watch] ERROR:"):
+                break
+        assert process.poll() is None
+        lint_json.rmdir()
+        _write_valid_skill(source_skills, "core", "other-skill", "A changed other skill")
+        output = process.stdout.read()
+        assert process.wait(timeout=30) == 0, output
+    finally:
+        process.kill()
+
+    # The second cycle rescans, so the edit the failed cycle dropped is synced too.
+    assert "[watch] synced 2 changed skill(s)" in output
+    assert "A changed hello skill" in (target_root / "hello-skill" / "SKILL.md").read_text(encoding="utf-8")
+    assert "A changed other skill" in (target_root / "other-skill" / "SKILL.md").read_text(encoding="utf-8")
+    assert lint_json.is_file()
+
+
+def test_skills_sync_transactional_swaps_atomically_and_recovers(tmp_path: Path) -> None:
+    source_skills = tmp_path / "skills"
+    target_root = tmp_path / "installed-skills"
+    staging = tmp_path / ".installed-skills.skills-sync-staging"
+    journal = tmp_path / ".installed-skills.skills-sync-journal.json"
+    _write_valid_skill(source_skills, "core", "hello-skill", "A hello skill")
+    _write_valid_skill(source_skills, "core", "other-skill", "Another skill")
+
+    def run_sync() -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [
+                str(SYNC_CLI),
+                "--from",
+                str(source_skills),
+                "--to",
+                str(target_root),
+                "--reports-dir",
+                str(tmp_path / "reports"),
+                "--repo-root",
+                str(tmp_path),
+                "--backup-dir",
+                str(tmp_path / "backups"),
+                "--no-cache",
+                "--transactional",
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+    first = run_sync()
+    assert first.returncode == 0, first.stdout + "\n" + first.stderr
+    assert (target_root / "hello-skill" / "SKILL.md").exists()
+    assert "`other-skill`" in (target_root / "INDEX.md").read_text(encoding="utf-8")
+    other_inode = (target_root / "other-skill" / "SKILL.md").stat().st_ino
+
+    # A run killed while staging leaves a journal and a partial staging tree behind.
+    staging.mkdir()
+    (staging / "partial").write_text("x", encoding="utf-8")
+    journal.write_text(json.dumps({"version": 1, "pid": 2**22 + 1, "phase": "staging"}), encoding="utf-8")
+    _write_valid_skill(source_skills, "core", "hello-skill", "A changed hello skill")
+    second = run_sync()
+    assert second.returncode == 0, second.stdout + "\n" + second.stderr
+    assert "Recovered interrupted transactional sync" in second.stdout
+    assert "A changed hello skill" in (target_root / "hello-skill" / "SKILL.md").read_text(encoding="utf-8")
+    # The unchanged skill was carried over by hard link, not copied.
+    assert (target_root / "other-skill" / "SKILL.md").stat().st_ino == other_inode
+    assert not staging.exists() and not journal.exists()
+
+    # Any failure discards the staged tree and leaves the target exactly as it was.
+    before = (target_root / "hello-skill" / "SKILL.md").read_text(encoding="utf-8")
+    _write_valid_skill(source_skills, "core", "hello-skill", "A third hello skill")
+    _write_valid_skill(source_skills, "core", "third-skill", "A skill that fails to copy")
+    (source_skills / "core" / "third-skill" / "broken.md").symlink_to(tmp_path / "missing.md")
+    failed = run_sync()
+    assert failed.returncode == 1, failed.stdout + "\n" + failed.stderr
+    assert "rolled back; target unchanged" in failed.stdout
+    assert (target_root / "hello-skill" / "SKILL.md").read_text(encoding="utf-8") == before
+    assert not (target_root / "third-skill").exists()
+    assert not staging.exists() and not journal.exists()
@@ -1,4 +1,5 @@
 from pathlib import Path
+import json
 import subprocess
 import textwrap
 
@@ -7,6 +8,11 @@ ROOT = Path(__file__).resolve().parents[1]
 CLI = ROOT / "bin" / "skills-validate"
 
 
+def _scratch_cache_args(tmp_path: Path) -> list[str]:
+    # Keep the parse cache and incremental state out of the foundry's reports/.
+    return ["--no-cache", "--state-file", str(tmp_path / "validate-state.json")]
+
+
 def test_skills_validate_fails_missing_yaml_fields(tmp_path: Path) -> None:
     skills_root = tmp_path / "skills"
     skill_dir = skills_root / "workflow" / "bad-skill"
@@ -59,7 +65,7 @@ def test_skills_validate_fails_missing_yaml_fields(tmp_path: Path) -> None:
     )
 
     result = subprocess.run(
-        [str(CLI), "--skills-root", str(skills_root), "--repo-root", str(tmp_path)],
+        [str(CLI), "--skills-root", str(skills_root), "--repo-root", str(tmp_path), *_scratch_cache_args(tmp_path)],
         capture_output=True,
         text=True,
     )
@@ -130,7 +136,7 @@ def test_skills_validate_categorizes_missing_output_paths(tmp_path: Path) -> Non
     )
 
     result = subprocess.run(
-        [str(CLI), "--skills-root", str(skills_root), "--repo-root", str(tmp_path)],
+        [str(CLI), "--skills-root", str(skills_root), "--repo-root", str(tmp_path), *_scratch_cache_args(tmp_path)],
         capture_output=True,
         text=True,
     )
@@ -202,6 +208,7 @@ def test_skills_validate_can_suppress_expected_output_warnings_and_show_summary(
             str(skills_root),
             "--repo-root",
             str(tmp_path),
+            *_scratch_cache_args(tmp_path),
             "--suppress-expected-output-warnings",
             "--warning-code-summary",
         ],
@@ -278,7 +285,7 @@ def test_skills_validate_prints_compact_hint_on_noisy_verbose_run(tmp_path: Path
     )
 
     result = subprocess.run(
-        [str(CLI), "--skills-root", str(skills_root), "--repo-root", str(tmp_path)],
+        [str(CLI), "--skills-root", str(skills_root), "--repo-root", str(tmp_path), *_scratch_cache_args(tmp_path)],
         capture_output=True,
         text=True,
     )
@@ -349,6 +356,7 @@ def test_skills_validate_compact_alias_enables_warning_triage_preset(tmp_path: P
             str(skills_root),
             "--repo-root",
             str(tmp_path),
+            *_scratch_cache_args(tmp_path),
             "--compact",
         ],
         capture_output=True,
@@ -364,3 +372,109 @@ def test_skills_validate_compact_alias_enables_warning_triage_preset(tmp_path: P
     assert "Warning Code Summary:" in result.stdout
     assert "- (no warnings)" in result.stdout
     assert "Hint: this run has a high warning count." not in result.stdout
+
+
+def test_skills_validate_incremental_rechecks_only_changed_skills(tmp_path: Path) -> None:
+    skills_root = tmp_path / "skills"
+    state_file = tmp_path / "validate-state.json"
+    for skill_id in ["stable-skill", "edited-skill"]:
+        skill_dir = skills_root / "workflow" / skill_id
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nid: {skill_id}\nname: Partial\n---\n\n## When to use\nNever.\n",
+            encoding="utf-8",
+        )
+    git = ["git", "-C", str(tmp_path), "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    subprocess.run([*git, "init", "-q"], check=True)
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "seed"], check=True)
+
+    base_cmd = [
+        str(CLI),
+        "--skills-root",
+        str(skills_root),
+        "--repo-root",
+        str(tmp_path),
+        "--state-file",
+        str(state_file),
+        "--no-cache",
+    ]
+    seed = subprocess.run([*base_cmd, "--incremental"], capture_output=True, text=True)
+    assert seed.returncode != 0
+    assert "re-checking 2 of 2 skill(s) changed since HEAD" in seed.stdout
+
+    edited = skills_root / "workflow" / "edited-skill" / "SKILL.md"
+    edited.write_text(edited.read_text(encoding="utf-8").replace("name: Partial\n", ""), encoding="utf-8")
+
+    result = subprocess.run([*base_cmd, "--incremental"], capture_output=True, text=True)
+
+    assert result.returncode != 0
+    assert "re-checking 1 of 2 skill(s) changed since HEAD" in result.stdout
+    # The unchanged skill's cached errors are merged into the report.
+    assert "Validated 2 skills" in result.stdout
+    assert result.stdout.count("Missing required metadata key: description") == 2
+    assert result.stdout.count("Missing required metadata key: name") == 1
+
+    # Reverting the edit leaves nothing in `git diff HEAD`; the fingerprint still forces a re-check.
+    subprocess.run([*git, "checkout", "--", "."], check=True)
+    reverted = subprocess.run([*base_cmd, "--incremental"], capture_output=True, text=True)
+    assert "re-checking 1 of 2 skill(s) changed since HEAD" in reverted.stdout
+    assert reverted.stdout.count("Missing required metadata key: name") == 0
+
+
+def test_skills_validate_incremental_state_is_kept_per_skills_root(tmp_path: Path) -> None:
+    state_file = tmp_path / "validate-state.json"
+    git = ["git", "-C", str(tmp_path), "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    roots = [tmp_path / "main-skills", tmp_path / "other-skills"]
+    for skills_root in roots:
+        skill_dir = skills_root / "workflow" / "some-skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("---\nid: some-skill\n---\n", encoding="utf-8")
+    subprocess.run([*git, "init", "-q"], check=True)
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "seed"], check=True)
+
+    def validate(skills_root: Path, *extra: str) -> subprocess.CompletedProcess[str]:
+        cmd = [str(CLI), "--skills-root", str(skills_root), "--repo-root", str(tmp_path), "--state-file", str(state_file)]
+        return subprocess.run([*cmd, "--no-cache", *extra], capture_output=True, text=True)
+
+    assert "re-checking 1 of 1" in validate(roots[0], "--incremental").stdout
+    # A full run against another root must not replace the first root's cached results.
+    validate(roots[1])
+    assert "re-checking 0 of 1" in validate(roots[0], "--incremental").stdout
+
+
+def test_skills_validate_ndjson_to_stdout_keeps_summary_on_stderr(tmp_path: Path) -> None:
+    skills_root = tmp_path / "skills"
+    for skill_id in ["alpha-skill", "beta-skill"]:
+        skill_dir = skills_root / "workflow" / skill_id
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nid: {skill_id}\nname: Partial\n---\n\n## When to use\nNever.\n",
+            encoding="utf-8",
+        )
+
+    result = subprocess.run(
+        [
+            str(CLI),
+            "--skills-root",
+            str(skills_root),
+            "--repo-root",
+            str(tmp_path),
+            "--state-file",
+            str(tmp_path / "validate-state.json"),
+            "--no-cache",
+            "--ndjson",
+            "-",
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode != 0
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [item["skill_id"] for item in records] == ["alpha-skill", "beta-skill"]
+    assert {"level": "ERROR", "code": "missing_metadata_key", "message": "Missing required metadata key: description"} in records[0][
+        "messages"
+    ]
+    assert "Validated 2 skills:" in result.stderr